@@ -7,19 +7,44 @@ from __future__ import annotations
 import sqlite3
 from collections import deque
 from collections.abc import Container
-from dataclasses import dataclass
-from pathlib import Path
+from contextlib import contextmanager, ExitStack
+from dataclasses import dataclass, field, replace
+from functools import lru_cache, partial
+from pathlib import Path, PurePath
 from sqlite3 import Connection
+from time import perf_counter
 from typing import (
-    Iterable, Iterator, Literal, Optional, Union,
-    TypeVar, overload, Type, Generic, TYPE_CHECKING)
+    Any, Callable, Iterable, Iterator, Literal, Mapping, NamedTuple, Optional,
+    Sequence, Union, TypeVar, overload, Type, Generic, TYPE_CHECKING,
+    get_args)
+import importlib
 
 # The BP and RP must be imported before other _db_* modules because they are
 # roots of the dependency graph.
 from .views import *
 from ._views import (
     RELATION_MAP, WRAPPER_CLASSES, add_reverse_connections,
-    validate_weak_connections, AbstractDBView)
+    validate_weak_connections, build_weak_connection_indexes_script,
+    AbstractDBView, wrap_query_columns, wrap_query_row, relation_map_version)
+from ._components import PACK_COMPONENTS, FileRows
+
+if TYPE_CHECKING:
+    from ._loading import (
+        RowBuffer, load_components, refresh_components, refresh_transaction,
+        start_extraction, RefreshResult, LoadReport, ComponentReport,
+        ProgressCallback)
+    from concurrent.futures import Future, ProcessPoolExecutor
+    from ._manifest import PackManifest, scan_pack
+    from ._watch import PackWatcher
+    from ._cache import ExtractionCache
+    from ._archive import ArchivePath, find_archive_packs, is_archive
+    from ._pool import ReadConnectionPool
+    from ._identity import IdentityMap
+    from ._async import AsyncDatabase
+    from ._columns import DictionaryColumn, fetch_columns
+    from ._prepared import PreparedEasyQuery
+    from ._pages import (
+        EasyQueryPage, fetch_easy_query_page, yield_easy_query_pages)
 
 VERSION: tuple[int, int, int] = (3, 2, 0)
 __version__ = '.'.join([str(x) for x in VERSION])
@@ -32,6 +57,149 @@ def _path_converter(path: bytes):
     return Path(path.decode('utf8'))
 
 
+CACHED_STATEMENTS = 512
+'''
+The size of the cache of the prepared statements of the connections opened
+by the :class:`Database`. Every :class:`PreparedEasyQuery` and the queries
+used for loading the packs keep one statement in the cache, so the default
+size of the cache of the sqlite3 module (128) is too small for the
+applications that use many prepared queries. It's used only when the
+connection is opened, so it must be changed before opening the database.
+'''
+
+def _connect(db_path: Union[str, Path], uri: bool = False) -> Connection:
+    '''
+    Connects to the database and sets up the connection the same way as
+    :meth:`Database.create` does.
+    '''
+    if isinstance(db_path, Path):
+        db_path = db_path.as_posix()
+    sqlite3.register_adapter(Path, _path_adapter)
+    sqlite3.register_converter("Path", _path_converter)
+    # The connection can be used by the PackWatcher thread
+    db = sqlite3.connect(
+        db_path, detect_types=sqlite3.PARSE_DECLTYPES,
+        check_same_thread=False, uri=uri,
+        cached_statements=CACHED_STATEMENTS)
+    db.row_factory = sqlite3.Row
+    db.executescript("PRAGMA foreign_keys = ON;\n")
+    return db
+
+def _build_scripts() -> list[str]:
+    '''
+    Returns the build scripts of all of the database components in the order
+    of execution.
+    '''
+    return [
+        RESOURCE_PACK_BUILD_SCRIPT,
+        CLIENT_ENTITY_BUILD_SCRIPT,
+        RENDER_CONTROLLER_BUILD_SCRIPT,
+        GEOMETRY_BUILD_SCRIPT,
+        TEXTURE_BUILD_SCRIPT,
+        PARTICLE_BUILD_SCRIPT,
+        RP_ANIMATION_BUILD_SCRIPT,
+        RP_ANIMATION_CONTROLLER_BUILD_SCRIPT,
+        ATTACHABLE_BUILD_SCRIPT,
+        SOUND_DEFINITIONS_BUILD_SCRIPT,
+        SOUND_BUILD_SCRIPT,
+        RP_ITEM_BUILD_SCRIPT,
+        TERRAIN_TEXTURE_BUILD_SCRIPT,
+
+        BEHAVIOR_PACK_BUILD_SCRIPT,
+        ENTITY_BUILD_SCRIPT,
+        LOOT_TABLE_BUILD_SCRIPT,
+        TRADE_TABLE_BUILD_SCRIPT,
+        BP_ANIMATION_BUILD_SCRIPT,
+        BP_ANIMATION_CONTROLLER_BUILD_SCRIPT,
+        BP_ITEM_BUILD_SCRIPT,
+        BP_BLOCK_BUILD_SCRIPT,
+        FEATURE_RULE_BUILD_SCRIPT,
+        FEATURE_BUILD_SCRIPT,
+
+        # Must be the last one, it references the tables of the other scripts
+        WEAK_CONNECTION_INDEXES_BUILD_SCRIPT,
+    ]
+
+@lru_cache(maxsize=None)
+def _schema_template() -> Connection:
+    '''
+    Returns the connection to an empty in-memory database with all of the
+    tables created by the build scripts. The template is built once and
+    copied into the new databases with the backup API, which is much faster
+    than running the build scripts.
+    '''
+    db = sqlite3.connect(":memory:", check_same_thread=False)
+    for build_script in _build_scripts():
+        db.executescript(build_script)
+    return db
+
+def _copy_schema_template(db: Connection) -> bool:
+    '''
+    Copies the template of the empty database (see :func:`_schema_template`)
+    into the database using the backup API.
+
+    Returns False if the database isn't empty.
+    '''
+    if db.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchone() is not None:
+        return False
+    _schema_template().backup(db)
+    return True
+
+@lru_cache(maxsize=None)
+def _expected_schema() -> list[tuple[str, str, str]]:
+    '''
+    Returns the schema of a new database created by :meth:`Database.create`.
+    '''
+    return _get_schema(_schema_template())
+
+def _get_schema(db: Connection) -> list[tuple[str, str, str]]:
+    '''
+    Returns the types, names and SQL of the objects in the database.
+    '''
+    return sorted(
+        (type_, name, sql) for type_, name, sql in db.execute(
+            "SELECT type, name, sql FROM sqlite_master "
+            "WHERE name NOT LIKE 'sqlite_%'"))
+
+def _find_packs(
+        path: Union[Path, str],
+        pack_type: Literal["rp", "bp"]) -> list[Union[PurePath, str]]:
+    '''
+    Returns the list of the packs of given type at the path. If the path is
+    an archive, it can contain multiple packs. Otherwise the path itself is
+    the only pack.
+    '''
+    from ._archive import find_archive_packs, is_archive  # pylint: disable=import-outside-toplevel
+    if not is_archive(path):
+        return [path]
+    packs: list[Union[PurePath, str]] = [
+        pack_path for type_, pack_path in find_archive_packs(path)
+        if type_ in (pack_type, None)
+    ]
+    if len(packs) == 0:
+        raise ValueError(
+            f"The archive {path} doesn't contain any "
+            f"{'resource' if pack_type == 'rp' else 'behavior'} packs.")
+    return packs
+
+@contextmanager
+def _open_cache(
+        cache: Union[ExtractionCache, Path, str, None]
+) -> Iterator[Optional[ExtractionCache]]:
+    '''
+    Opens the cache if the path to the cache is provided. The caches passed as
+    objects are not closed.
+    '''
+    if cache is None:
+        yield None
+        return
+    from ._cache import ExtractionCache  # pylint: disable=import-outside-toplevel
+    if isinstance(cache, ExtractionCache):
+        yield cache
+        return
+    with ExtractionCache(cache) as cache_:
+        yield cache_
+
 # TYPES FOR INCLUDE/EXCLUDE ARGUMENTS OF LOADING RP/BP
 DbRpItems = Literal[
     "geometries",
@@ -60,6 +228,33 @@ DbBpItems = Literal[
     "features"
 ]
 
+class PackLoadResult(NamedTuple):
+    '''
+    The result of loading a single pack with :meth:`Database.load_many`.
+    '''
+    pack_type: Literal["rp", "bp"]
+    '''The type of the pack.'''
+
+    path: PurePath
+    '''
+    The path to the pack. The packs from the archives have
+    :class:`ArchivePath` paths.
+    '''
+
+    pk: Optional[int]
+    '''The primary key of the pack or None if loading failed.'''
+
+    files: int
+    '''The number of the loaded files.'''
+
+    seconds: float
+    '''
+    The time spent on waiting for the rows of the pack and inserting them.
+    '''
+
+    error: Optional[Exception]
+    '''The exception that stopped loading the pack or None.'''
+
 # THE MAIN DATABASE CLASS
 @dataclass
 class Database:
@@ -70,8 +265,26 @@ class Database:
     connection: Connection
     '''The SQLite database conncetion.'''
 
+    _bulk_loading: bool = field(default=False, init=False, repr=False)
+    '''Whether the database is in the :meth:`bulk_load` mode.'''
+
+    read_pool: Optional[ReadConnectionPool] = field(default=None, repr=False)
+    '''
+    The pool of the read-only connections used by the queries (see
+    :meth:`open_read_pool`) or None if the queries use the main connection.
+    '''
+
+    identity_map: Optional[IdentityMap] = field(default=None, repr=False)
+    '''
+    The :class:`IdentityMap` used by the queries to reuse the wrapper objects
+    of the rows that were already returned or None. The map is cleared after
+    loading and refreshing the packs.
+    '''
+
     @staticmethod
-    def open(db_path: Union[str, Path]) -> Database:
+    def open(
+            db_path: Union[str, Path], *, readers: int = 0,
+            identity_map_size: int = 0) -> Database:
         '''
         Creates a database using  path to the database file.
         This function doesn't check if the database has a valid structure. It
@@ -79,18 +292,34 @@ class Database:
         sets some sqlite3 adapter and converter functions for Path objects.
 
         :param db_path: the path to the database file
+        :param readers: If it's greater than 0, the database is switched to
+            the WAL mode and the queries use a pool of up to this many
+            read-only connections (see :meth:`open_read_pool`).
+        :param identity_map_size: If it's greater than 0, the queries use an
+            :class:`IdentityMap` of this size (see :attr:`identity_map`).
         '''
         if isinstance(db_path, Path):
             db_path = db_path.as_posix()
 
         sqlite3.register_adapter(Path, _path_adapter)
         sqlite3.register_converter("Path", _path_converter)
-        db = sqlite3.connect(db_path, detect_types=sqlite3.PARSE_DECLTYPES)
+        # The connection can be used by the PackWatcher thread
+        db = sqlite3.connect(
+            db_path, detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False, cached_statements=CACHED_STATEMENTS)
 
-        return Database(db)
+        database = Database(db)
+        if readers > 0:
+            database.open_read_pool(readers)
+        if identity_map_size > 0:
+            from ._identity import IdentityMap  # pylint: disable=import-outside-toplevel
+            database.identity_map = IdentityMap(identity_map_size)
+        return database
 
     @staticmethod
-    def create(db_path: Union[str, Path] = ":memory:") -> Database:
+    def create(
+            db_path: Union[str, Path] = ":memory:", *,
+            readers: int = 0, identity_map_size: int = 0) -> Database:
         '''
         Creates a new database for storing resource packs and behavior packs in
         memory or in a file. The default value is :code:`":memory:"` which
@@ -98,47 +327,120 @@ class Database:
 
         :param db_path: The path to the database file or :code:`":memory:"`.
 
-        Creates a new dtabase in :code:`db_path`. Runs all of the build scripts of
-        the database components.
+        Creates a new dtabase in :code:`db_path`. The tables of the database
+        components are copied from an empty database built once by running
+        all of their build scripts.
 
         :param db_path: The path to the database file. The argument is passed to
             :func:`sqlite3.connect` If the argument is :code:`":memory:"`, the
             database is created in memory. :code:`":memory:"` is the default value.
+        :param readers: The size of the pool of the read-only connections
+            (see :meth:`open`).
+        :param identity_map_size: The size of the :attr:`identity_map` (see
+            :meth:`open`).
         '''
-        sqlite3.register_adapter(Path, _path_adapter)
-        sqlite3.register_converter("Path", _path_converter)
-        db = sqlite3.connect(db_path, detect_types=sqlite3.PARSE_DECLTYPES)
-        db.row_factory = sqlite3.Row
-
-        db.executescript("PRAGMA foreign_keys = ON;\n")
-
-        db.executescript(RESOURCE_PACK_BUILD_SCRIPT)
-        db.executescript(CLIENT_ENTITY_BUILD_SCRIPT)
-        db.executescript(RENDER_CONTROLLER_BUILD_SCRIPT)
-        db.executescript(GEOMETRY_BUILD_SCRIPT)
-        db.executescript(TEXTURE_BUILD_SCRIPT)
-        db.executescript(PARTICLE_BUILD_SCRIPT)
-        db.executescript(RP_ANIMATION_BUILD_SCRIPT)
-        db.executescript(RP_ANIMATION_CONTROLLER_BUILD_SCRIPT)
-        db.executescript(ATTACHABLE_BUILD_SCRIPT)
-        db.executescript(SOUND_DEFINITIONS_BUILD_SCRIPT)
-        db.executescript(SOUND_BUILD_SCRIPT)
-        db.executescript(RP_ITEM_BUILD_SCRIPT)
-        db.executescript(TERRAIN_TEXTURE_BUILD_SCRIPT)
-
-        db.executescript(BEHAVIOR_PACK_BUILD_SCRIPT)
-        db.executescript(ENTITY_BUILD_SCRIPT)
-        db.executescript(LOOT_TABLE_BUILD_SCRIPT)
-        db.executescript(TRADE_TABLE_BUILD_SCRIPT)
-        db.executescript(BP_ANIMATION_BUILD_SCRIPT)
-        db.executescript(BP_ANIMATION_CONTROLLER_BUILD_SCRIPT)
-        db.executescript(BP_ITEM_BUILD_SCRIPT)
-        db.executescript(BP_BLOCK_BUILD_SCRIPT)
-        db.executescript(FEATURE_RULE_BUILD_SCRIPT)
-        db.executescript(FEATURE_BUILD_SCRIPT)
+        db = _connect(db_path)
+        if not _copy_schema_template(db):
+            for build_script in _build_scripts():
+                db.executescript(build_script)
+        database = Database(db)
+        if readers > 0:
+            database.open_read_pool(readers)
+        if identity_map_size > 0:
+            from ._identity import IdentityMap  # pylint: disable=import-outside-toplevel
+            database.identity_map = IdentityMap(identity_map_size)
+        return database
+
+    def open_read_pool(self, size: int = 4) -> ReadConnectionPool:
+        '''
+        Switches the database file to the WAL journal mode and creates a pool
+        of read-only connections used by :func:`yield_from_easy_query` and
+        :func:`yield_from_any_query`. The main connection stays the only
+        writer. The queries can run in multiple threads at the same time and
+        they don't wait for the writer (for example during a refresh). They
+        see the last committed state of the database, so the changes made on
+        the main connection must be committed to be visible in the queries.
+
+        The wrapper objects returned by the queries are bound to the
+        connections they came from.
+
+        :param size: The maximal number of the read-only connections.
+        '''
+        if self.read_pool is not None:
+            raise RuntimeError("The read pool is already open.")
+        db_path = self._file_path()
+        if db_path is None:
+            raise ValueError("The read pool requires a database file.")
+        # The journal mode can't be changed inside of a transaction
+        self.connection.commit()
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        from ._pool import ReadConnectionPool  # pylint: disable=import-outside-toplevel
+        self.read_pool = ReadConnectionPool(
+            partial(_connect, f"{Path(db_path).as_uri()}?mode=ro", True),
+            size)
+        return self.read_pool
+
+    def _file_path(self) -> Optional[str]:
+        '''
+        Returns the path to the file of the main database or None if the
+        database is in memory.
+        '''
+        db_path = self.connection.execute(
+            "PRAGMA database_list").fetchone()[2]
+        return None if db_path == "" else db_path
 
+    @staticmethod
+    def load_snapshot(
+            snapshot_path: Union[str, Path],
+            into_memory: bool = True) -> Database:
+        '''
+        Opens a database saved with :meth:`save_snapshot`. The connection is
+        set up the same way as in :meth:`create`.
+
+        :param snapshot_path: The path to the snapshot file.
+        :param into_memory: Whether to copy the snapshot into a new in-memory
+            database. If False, the snapshot file is opened directly and the
+            changes are saved to it.
+
+        Raises ValueError if the schema of the snapshot doesn't match the
+        schema of the databases created by this version of the module.
+        '''
+        # The URI with the mode prevents creating an empty database if the
+        # file doesn't exist
+        snapshot_uri = Path(snapshot_path).absolute().as_uri()
+        if into_memory:
+            db = _connect(":memory:")
+            source = sqlite3.connect(f"{snapshot_uri}?mode=ro", uri=True)
+            try:
+                source.backup(db)
+            finally:
+                source.close()
+        else:
+            db = _connect(f"{snapshot_uri}?mode=rw", uri=True)
+        if _get_schema(db) != _expected_schema():
+            db.close()
+            raise ValueError(
+                f"The schema of the snapshot {snapshot_path} doesn't match the "
+                "schema of the database.")
         return Database(db)
 
+    def save_snapshot(self, snapshot_path: Union[str, Path]) -> None:
+        '''
+        Commits the changes and saves the copy of the database into a file
+        using the SQLite backup API. The existing file is overwritten. The
+        snapshot can be opened with :meth:`load_snapshot`.
+
+        :param snapshot_path: The path to the snapshot file.
+        '''
+        if isinstance(snapshot_path, Path):
+            snapshot_path = snapshot_path.as_posix()
+        self.connection.commit()
+        target = sqlite3.connect(snapshot_path)
+        try:
+            self.connection.backup(target)
+        finally:
+            target.close()
+
     def load_rp(
         self,
         rp_path: Path | str, *,
@@ -156,73 +458,61 @@ class Database:
             "rp_items",
             "terrain_texture",
         ),
-        exclude: Container[DbRpItems] = tuple()
-    ) -> None:
+        exclude: Container[DbRpItems] = tuple(),
+        workers: Optional[int] = None,
+        cache: Union[ExtractionCache, Path, str, None] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> LoadReport:
         '''
         Loads resource pack data into the database.
 
         :param db: The database connection.
-        :param rp_path: The path to the resource pack.
+        :param rp_path: The path to the resource pack or to an archive
+            (.mcpack, .mcaddon or .zip). The files are read directly from the
+            archive. All of the resource packs in the archive are loaded.
         :param include: A list of items to include. By default, all items are
             included.
         :param exclude: A list of items to exclude. By default, no items are
             excluded.
+        :param workers: The number of worker processes used for reading and
+            parsing the files of the pack. By default, the files are loaded
+            in the current process. The rows are always inserted by the
+            current process in the same order, so the result is the same as
+            with the serial loading.
+        :param cache: The :class:`ExtractionCache` or the path to its file.
+            The rows of the files that didn't change since they were cached
+            are loaded from the cache instead of parsing the files.
+        :param progress: A function called after inserting every file with
+            the name of the component, the number of its inserted files and
+            the number of all of its files.
 
         If there is an item in both include and exclude, it is excluded. The
         include and exclude lists accept strings that are the names of the
         supported database components.
+
+        Returns the :class:`LoadReport` with the statistics of the loading.
         '''
-        rp_pk = load_resource_pack(self.connection, rp_path)
-        if (
-                "geometries" in include and
-                "geometries" not in exclude):
-            load_geometries(self.connection, rp_pk)
-        if (
-                "client_entities" in include and
-                "client_entities" not in exclude):
-            load_client_entities(self.connection, rp_pk)
-        if (
-                "render_controllers" in include and
-                "render_controllers" not in exclude):
-            load_render_controllers(self.connection, rp_pk)
-        if (
-                "textures" in include and
-                "textures" not in exclude):
-            load_textures(self.connection, rp_pk)
-        if (
-                "particles" in include and
-                "particles" not in exclude):
-            load_particles(self.connection, rp_pk)
-        if (
-                "rp_animations" in include and
-                "rp_animations" not in exclude):
-            load_rp_animations(self.connection, rp_pk)
-        if (
-                "rp_animation_controllers" in include and
-                "rp_animation_controllers" not in exclude):
-            load_rp_animation_controllers(self.connection, rp_pk)
-        if (
-                "attachables" in include and
-                "attachables" not in exclude):
-            load_attachables(self.connection, rp_pk)
-        if (
-                "sound_definitions" in include and
-                "sound_definitions" not in exclude):
-            load_sound_definitions(self.connection, rp_pk)
-        if (
-                "sounds" in include and
-                "sounds" not in exclude):
-            load_sounds(self.connection, rp_pk)
-        if (
-                "rp_items" in include and
-                "rp_items" not in exclude):
-            load_rp_items(self.connection, rp_pk)
-        self.connection.commit()
-        if (
-                "terrain_texture" in include and
-                "terrain_texture" not in exclude):
-            load_terrain_texture(self.connection, rp_pk)
-        self.connection.commit()
+        from ._loading import LoadReport, load_components  # pylint: disable=import-outside-toplevel
+        self._invalidate()
+        start = perf_counter()
+        report = LoadReport()
+        with _open_cache(cache) as cache_:
+            for pack_path in _find_packs(rp_path, "rp"):
+                rp_pk = load_resource_pack(self.connection, pack_path)
+                load_components(
+                    self.connection,
+                    [
+                        name for name in get_args(DbRpItems)
+                        if name in include and name not in exclude
+                    ],
+                    rp_pk, workers=workers, cache=cache_, report=report,
+                    progress=progress)
+                report.pack_pks.append(rp_pk)
+        if not self._bulk_loading:
+            self.connection.commit()
+        report.seconds = perf_counter() - start
+        return report
+
     def load_bp(
             self,
             bp_path: Path | str, *,
@@ -237,64 +527,429 @@ class Database:
                 "feature_rules",
                 "features"
             ),
-            exclude: Container[DbBpItems] = tuple()) -> None:
+            exclude: Container[DbBpItems] = tuple(),
+            workers: Optional[int] = None,
+            cache: Union[ExtractionCache, Path, str, None] = None,
+            progress: Optional[ProgressCallback] = None) -> LoadReport:
         '''
         Loads behavior pack data into the database.
 
         :param db: The database connection.
-        :param bp_path: The path to the resource pack.
+        :param bp_path: The path to the behavior pack or to an archive
+            (.mcpack, .mcaddon or .zip). The files are read directly from the
+            archive. All of the behavior packs in the archive are loaded.
         :param include: A list of items to include. By default, all items are
             included.
         :param exclude: A list of items to exclude. By default, no items are
             excluded.
+        :param workers: The number of worker processes used for reading and
+            parsing the files of the pack. By default, the files are loaded
+            in the current process. The rows are always inserted by the
+            current process in the same order, so the result is the same as
+            with the serial loading.
+        :param cache: The :class:`ExtractionCache` or the path to its file.
+            The rows of the files that didn't change since they were cached
+            are loaded from the cache instead of parsing the files.
+        :param progress: A function called after inserting every file with
+            the name of the component, the number of its inserted files and
+            the number of all of its files.
 
         If there is an item in both include and exclude, it is excluded. The
         include and exclude lists accept strings that are the names of the
         supported database components.
+
+        Returns the :class:`LoadReport` with the statistics of the loading.
         '''
-        bp_pk = load_behavior_pack(self.connection, bp_path)
-        if (
-                "entities" in include and
-                "entities" not in exclude):
-            load_entities(self.connection, bp_pk)
-        if (
-                "loot_tables" in include and
-                "loot_tables" not in exclude):
-            load_loot_tables(self.connection, bp_pk)
-        if (
-                "trade_tables" in include and
-                "trade_tables" not in exclude):
-            load_trade_tables(self.connection, bp_pk)
-        if (
-                "bp_animations" in include and
-                "bp_animations" not in exclude):
-            load_bp_animations(self.connection, bp_pk)
-        if (
-                "bp_animation_controllers" in include and
-                "bp_animation_controllers" not in exclude):
-            load_bp_animation_controllers(self.connection, bp_pk)
-        if (
-                "bp_items" in include and
-                "bp_items" not in exclude):
-            load_bp_items(self.connection, bp_pk)
-        if (
-                "bp_blocks" in include and
-                "bp_blocks" not in exclude):
-            load_bp_blocks(self.connection, bp_pk)
-        if (
-                "feature_rules" in include and
-                "feature_rules" not in exclude):
-            load_feature_rules(self.connection, bp_pk)
-        if (
-                "features" in include and
-                "features" not in exclude):
-            load_features(self.connection, bp_pk)
-        self.connection.commit()
+        from ._loading import LoadReport, load_components  # pylint: disable=import-outside-toplevel
+        self._invalidate()
+        start = perf_counter()
+        report = LoadReport()
+        with _open_cache(cache) as cache_:
+            for pack_path in _find_packs(bp_path, "bp"):
+                bp_pk = load_behavior_pack(self.connection, pack_path)
+                load_components(
+                    self.connection,
+                    [
+                        name for name in get_args(DbBpItems)
+                        if name in include and name not in exclude
+                    ],
+                    bp_pk, workers=workers, cache=cache_, report=report,
+                    progress=progress)
+                report.pack_pks.append(bp_pk)
+        if not self._bulk_loading:
+            self.connection.commit()
+        report.seconds = perf_counter() - start
+        return report
+
+    def load_many(
+            self,
+            packs: Iterable[tuple[Literal["rp", "bp"], Path | str]], *,
+            workers: Optional[int] = None,
+            cache: Union[ExtractionCache, Path, str, None] = None
+    ) -> list[PackLoadResult]:
+        '''
+        Loads multiple resource packs and behavior packs into the database.
+        All of the components of the packs are loaded.
+
+        With the workers, the packs are scanned and their files are parsed
+        on a shared pool of worker processes, so the work on the following
+        pack overlaps with inserting the rows of the current one. The number
+        of the parsed files waiting for the insertion is limited. The rows
+        are inserted by the current process, one pack at a time, in the
+        order of the :code:`packs` list.
+
+        Every pack is loaded inside of its own savepoint. If loading a pack
+        fails (including the paths that don't exist), its rows are removed,
+        the error is reported in the result and the remaining packs are
+        still loaded.
+
+        :param packs: The pairs of the pack types (:code:`"rp"` or
+            :code:`"bp"`) and the paths to the packs. The archives are
+            replaced with all of the packs of given type inside of them.
+        :param workers: The number of worker processes. By default, all of
+            the work is done in the current process.
+        :param cache: The :class:`ExtractionCache` or the path to its file.
+
+        Returns the results of loading the packs in the order of the
+        :code:`packs` list.
+        '''
+        from ._archive import is_archive  # pylint: disable=import-outside-toplevel
+        from ._loading import RowBuffer, start_extraction  # pylint: disable=import-outside-toplevel
+        from ._manifest import scan_pack  # pylint: disable=import-outside-toplevel
+        self._invalidate()
+        pack_loaders = {
+            "rp": (load_resource_pack, get_args(DbRpItems)),
+            "bp": (load_behavior_pack, get_args(DbBpItems)),
+        }
+        # The archives are replaced with the packs found inside of them. The
+        # errors of reading the archives and the paths that don't exist are
+        # reported like the errors of loading the packs.
+        specs: list[tuple[Literal["rp", "bp"], PurePath]] = []
+        spec_errors: list[Optional[Exception]] = []
+        for pack_type, path in packs:
+            if pack_type not in pack_loaders:
+                raise ValueError(f"Unknown pack type: {pack_type}")
+            try:
+                if not is_archive(path) and not Path(path).is_dir():
+                    raise FileNotFoundError(
+                        f"The pack {path} isn't a directory or an archive.")
+                for pack_path in _find_packs(path, pack_type):
+                    if isinstance(pack_path, str):
+                        pack_path = Path(pack_path)
+                    specs.append((pack_type, pack_path))
+                    spec_errors.append(None)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                specs.append((pack_type, Path(path)))
+                spec_errors.append(e)
+        results: list[PackLoadResult] = []
+        with ExitStack() as stack:
+            cache_ = stack.enter_context(_open_cache(cache))
+            executor: Optional[ProcessPoolExecutor] = None
+            if workers is not None and workers >= 2:
+                # Importing multiprocessing is slow, so it's done only when
+                # it's used
+                from concurrent.futures import ProcessPoolExecutor  # pylint: disable=import-outside-toplevel
+                executor = stack.enter_context(
+                    ProcessPoolExecutor(max_workers=workers))
+            # Submit the discovery of all of the packs first, then the
+            # parsing of their files as soon as they're scanned
+            scans: list[Union[Future[PackManifest], PackManifest, Exception, None]] = []
+            for (pack_type, path), error in zip(specs, spec_errors):
+                components = [
+                    PACK_COMPONENTS[name]
+                    for name in pack_loaders[pack_type][1]]
+                if error is not None:
+                    scans.append(error)
+                elif executor is None:
+                    scans.append(None)
+                else:
+                    scans.append(executor.submit(scan_pack, path, components))
+
+            def extract_pack(
+                    index: int) -> Union[Iterator[FileRows], Exception]:
+                (pack_type, path), scan = specs[index], scans[index]
+                names = pack_loaders[pack_type][1]
+                try:
+                    if isinstance(scan, Exception):
+                        raise scan
+                    if scan is None:
+                        scan = scan_pack(
+                            path, [PACK_COMPONENTS[name] for name in names])
+                    elif not isinstance(scan, dict):
+                        scan = scan.result()
+                    return start_extraction(
+                        [
+                            (name, entry)
+                            for name in names for entry in scan[name]
+                        ],
+                        path, cache_, executor, workers or 1)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    return e
+            # Insert the packs one by one. The extraction of the next pack
+            # starts before inserting the current one, so the workers parse
+            # its files in the meantime. Starting all of the packs at once
+            # would keep the rows of all of them in memory.
+            extractions: dict[int, Union[Iterator[FileRows], Exception]] = {}
+            for i, (pack_type, path) in enumerate(specs):
+                for j in range(i, min(i + 2, len(specs))):
+                    if j not in extractions:
+                        extractions[j] = extract_pack(j)
+                extraction = extractions.pop(i)
+                start = perf_counter()
+                pk: Optional[int] = None
+                files = 0
+                error: Optional[Exception] = None
+                self.connection.execute("SAVEPOINT load_many")
+                try:
+                    if isinstance(extraction, Exception):
+                        raise extraction
+                    pk = pack_loaders[pack_type][0](self.connection, path)
+                    buffer = RowBuffer(self.connection)
+                    for file_rows in extraction:
+                        buffer.add(file_rows, pk)
+                        files += 1
+                    buffer.flush()
+                    self.connection.execute("RELEASE load_many")
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    self.connection.execute("ROLLBACK TO load_many")
+                    self.connection.execute("RELEASE load_many")
+                    pk, files, error = None, 0, e
+                results.append(PackLoadResult(
+                    pack_type, path, pk, files, perf_counter() - start,
+                    error))
+        if not self._bulk_loading:
+            self.connection.commit()
+        return results
+
+    @contextmanager
+    def bulk_load(self) -> Iterator[Database]:
+        '''
+        A context manager for loading large amounts of data faster. All of
+        the loading inside of the context runs in a single transaction with
+        the journal in memory (the databases in the WAL mode, for example the
+        ones with the :attr:`read_pool`, keep using the WAL), without syncing
+        the database file and with the foreign keys checked only at the end.
+        The indexes are dropped at the start and created again at the end,
+        followed by :code:`ANALYZE` and :code:`PRAGMA optimize`. The previous
+        settings are restored when the context ends.
+
+        If an exception is raised, the transaction is rolled back, so nothing
+        loaded inside of the context is saved.
+
+        Example:
+
+        .. code-block:: python
+
+            db = Database.create("packs.db")
+            with db.bulk_load():
+                db.load_rp("RP")
+                db.load_bp("BP")
+        '''
+        if self._bulk_loading:
+            raise RuntimeError("The database is already in the bulk load mode.")
+        db = self.connection
+        # The pragmas can't be changed inside of a transaction
+        db.commit()
+        journal_mode = db.execute("PRAGMA journal_mode").fetchone()[0]
+        synchronous = db.execute("PRAGMA synchronous").fetchone()[0]
+        # The WAL mode can't be changed while the read pool has open
+        # connections, and the readers need it to keep reading during the
+        # bulk load, so it's kept
+        if journal_mode != "wal":
+            db.execute("PRAGMA journal_mode = MEMORY")
+        db.execute("PRAGMA synchronous = OFF")
+        indexes: list[str] = [
+            sql for (sql,) in db.execute(
+                "SELECT sql FROM sqlite_master "
+                "WHERE type = 'index' AND sql IS NOT NULL")
+        ]
+        self._bulk_loading = True
+        try:
+            db.execute("BEGIN")
+            db.execute("PRAGMA defer_foreign_keys = ON")
+            for (name,) in db.execute(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE type = 'index' AND sql IS NOT NULL").fetchall():
+                db.execute(f"DROP INDEX {name}")
+            yield self
+            for sql in indexes:
+                db.execute(sql)
+            db.commit()
+        except BaseException:
+            db.rollback()
+            self._invalidate()
+            raise
+        finally:
+            self._bulk_loading = False
+            if journal_mode != "wal":
+                db.execute(f"PRAGMA journal_mode = {journal_mode}")
+            db.execute(f"PRAGMA synchronous = {synchronous}")
+        db.execute("ANALYZE")
+        db.execute("PRAGMA optimize")
+        db.commit()
+
+    def refresh_rp(
+        self,
+        rp_pk: int, *,
+        include: Container[DbRpItems] = (
+            "geometries",
+            "client_entities",
+            "render_controllers",
+            "textures",
+            "particles",
+            "rp_animations",
+            "rp_animation_controllers",
+            "attachables",
+            "sound_definitions",
+            "sounds",
+            "rp_items",
+            "terrain_texture",
+        ),
+        exclude: Container[DbRpItems] = tuple(),
+        workers: Optional[int] = None
+    ) -> RefreshResult:
+        '''
+        Updates the data of a resource pack that is already loaded into the
+        database. Only the new files and the files with modified content are
+        parsed. The data of the modified and removed files is deleted.
+
+        :param rp_pk: The primary key of the resource pack.
+        :param include: A list of items to include. It should be the same as
+            the list used for loading the pack, otherwise the missing items
+            are loaded.
+        :param exclude: A list of items to exclude.
+        :param workers: The number of worker processes used for reading and
+            parsing the files of the pack (see :meth:`load_rp`).
+
+        Returns the paths to the added, modified and removed files.
+        '''
+        return self._refresh_pack(
+            [
+                name for name in get_args(DbRpItems)
+                if name in include and name not in exclude
+            ],
+            rp_pk, workers)
+
+    def refresh_bp(
+            self,
+            bp_pk: int, *,
+            include: Container[DbBpItems] = (
+                "entities",
+                "loot_tables",
+                "trade_tables",
+                "bp_animations",
+                "bp_animation_controllers",
+                "bp_items",
+                "bp_blocks",
+                "feature_rules",
+                "features"
+            ),
+            exclude: Container[DbBpItems] = tuple(),
+            workers: Optional[int] = None) -> RefreshResult:
+        '''
+        Updates the data of a behavior pack that is already loaded into the
+        database. Only the new files and the files with modified content are
+        parsed. The data of the modified and removed files is deleted.
+
+        :param bp_pk: The primary key of the behavior pack.
+        :param include: A list of items to include. It should be the same as
+            the list used for loading the pack, otherwise the missing items
+            are loaded.
+        :param exclude: A list of items to exclude.
+        :param workers: The number of worker processes used for reading and
+            parsing the files of the pack (see :meth:`load_bp`).
+
+        Returns the paths to the added, modified and removed files.
+        '''
+        return self._refresh_pack(
+            [
+                name for name in get_args(DbBpItems)
+                if name in include and name not in exclude
+            ],
+            bp_pk, workers)
+
+    def _refresh_pack(
+            self, names: list[str], pack_pk: int,
+            workers: Optional[int]) -> RefreshResult:
+        '''
+        Refreshes the components of a pack in a single transaction.
+        '''
+        from ._loading import refresh_components, refresh_transaction  # pylint: disable=import-outside-toplevel
+        self._invalidate()
+        with refresh_transaction(self.connection):
+            return refresh_components(
+                self.connection, names, pack_pk, workers=workers)
+
+    def watch(
+            self, interval: float = 0.25,
+            on_change: Optional[Callable[[dict[Path, RefreshResult]], None]] = None,
+            workers: Optional[int] = None, *,
+            include: Container[Union[DbRpItems, DbBpItems]] = (
+                *get_args(DbRpItems), *get_args(DbBpItems)),
+            exclude: Container[Union[DbRpItems, DbBpItems]] = tuple()
+    ) -> PackWatcher:
+        '''
+        Starts a background thread that keeps the database in sync with the
+        files of the loaded packs. The thread polls the packs every
+        :code:`interval` seconds and refreshes the components with modified
+        files (see :meth:`refresh_rp` and :meth:`refresh_bp`) after the
+        changes stop, so the changes are usually applied in less than
+        2 * :code:`interval` seconds.
+
+        :param interval: The time between the polls in seconds.
+        :param on_change: A function called from the watcher thread after
+            applying the changes. It receives a dictionary that maps the
+            paths to the packs to the results of the refresh.
+        :param workers: The number of worker processes used for parsing the
+            modified files.
+        :param include: A list of items of the resource packs and the
+            behavior packs to watch. It should be the same as the lists used
+            for loading the packs, otherwise the missing items are loaded
+            when their packs change.
+        :param exclude: A list of items to exclude.
+
+        The changes of the database files are applied on a separate
+        connection opened by the watcher, so they never mix with the
+        transactions of this database and they become visible after they're
+        committed. The in-memory databases share the connection with the
+        watcher (see :class:`PackWatcher`).
+
+        Returns the started :class:`PackWatcher`. Use its :code:`stop()`
+        method or the :code:`with` statement to stop it, and its
+        :code:`lock` to read the database without seeing partially applied
+        changes.
+        '''
+        def on_change_(results: dict[Path, RefreshResult]):
+            self._invalidate()
+            if on_change is not None:
+                on_change(results)
+        from ._watch import PackWatcher  # pylint: disable=import-outside-toplevel
+        db_path = self._file_path()
+        return PackWatcher(
+            self.connection, interval=interval, on_change=on_change_,
+            workers=workers,
+            names=[
+                name for name in PACK_COMPONENTS
+                if name in include and name not in exclude
+            ],
+            connect=None if db_path is None else partial(_connect, db_path)
+        ).start()
+
+    def _invalidate(self):
+        '''
+        Clears the :attr:`identity_map` before the data in the database
+        changes.
+        '''
+        if self.identity_map is not None:
+            self.identity_map.clear()
 
     def close(self):
         '''
-        Runs close() function on the database connection.
+        Runs close() function on the database connection and closes the
+        read connections.
         '''
+        if self.read_pool is not None:
+            self.read_pool.close()
         self.connection.close()
 
     def commit(self):
@@ -333,7 +988,9 @@ def build_easy_query(
         where: Optional[list[str]] = None,
         group_by: Optional[list[str]] = None,
         having: Optional[list[str]] = None,
-        order_by: Optional[list[str]] = None) -> str:
+        order_by: Optional[list[str]] = None,
+        hydrate: bool = False,
+        columns: Optional[list[str]] = None) -> str:
     '''
     Returns a string with a SQL query that can be used to query the
     sqlite_bedrock_packs database. The query is built using the class names
@@ -402,80 +1059,74 @@ def build_easy_query(
     :param order_by: A list of columns to order the results by. This is a
         list of strings with raw SQL code which is inserted into the ORDER BY
         part of the query.
+    :param hydrate: Whether to also select all of the columns of the selected
+        tables. By default it's False. The additional columns are named
+        '<table>.<column>' and are used by :func:`yield_from_any_query` to
+        fill the cache of the wrapper objects, so accessing their properties
+        doesn't run any additional queries.
+    :param columns: A list of additional columns to select after the primary
+        keys of the tables. This is a list of strings with raw SQL code which
+        is inserted into the SELECT part of the query. The results of the
+        queries with additional columns can't be wrapped by
+        :func:`yield_from_any_query` (see :func:`fetch_columns`).
     '''
-    all_tables: list[Union[type[AbstractDBView], Left[AbstractDBView]]] = [
-        root, *tables]
-    for t in all_tables:
-        t_name = t.value.__name__ if isinstance(t, Left) else t.__name__
-        if t_name not in RELATION_MAP.keys():
-            raise ValueError(
-                f"Table '{t_name}' does not exist in the database.")
-    prev_t = None
-    joined_connections: list[_EasyQueryConnection] = []
-    blacklist = list(blacklist)
-    for t in all_tables:
-        if prev_t is None:
-            prev_t = t
-            continue
-        left = False
-        if isinstance(t, Left):
-            left = True
-            t = t.value
-        connection = _find_connection(
-            prev_t.__name__, t.__name__, accept_non_pk, set(blacklist))
-        if connection is None:
-            raise ValueError(
-                f"No connection between {prev_t.__name__} and {t.__name__} "
-                f"after excluding tables: {', '.join(blacklist)}")
-        # if left and len(connection) > 1:
-        if left:
-            connection[-1].left_join = True
-        joined_connections.extend(connection)
-        prev_t = t
-    # Strip joined_connections of duplicates
-    reduced_joined_connections: list[_EasyQueryConnection] = []
-    if len(joined_connections) > 0:
-        known_connections = {joined_connections[0].left}
-        for jc in joined_connections:
-            if jc.right in known_connections:
-                continue
-            known_connections.add(jc.right)
-            reduced_joined_connections.append(jc)
+    _check_relation_map()
+    return _build_easy_query(
+        tuple(
+            (t.value.__name__, True) if isinstance(t, Left)
+            else (t.__name__, False)
+            for t in (root, *tables)),
+        tuple(blacklist), accept_non_pk, distinct, _as_tuple(where),
+        _as_tuple(group_by), _as_tuple(having), _as_tuple(order_by), hydrate,
+        _as_tuple(columns))
 
-    # Convert all tables to list[str] (we don't need Left objects anymore)
-    # the infromation is in the reduced_joined_queries
-    all_tables_str = [
-        t.value.__name__
-        if isinstance(t, Left)
-        else t.__name__
-        for t in all_tables]
-    # Build the quer
-    selection = ",\n\t".join([f"{t}_pk AS {t}" for t in all_tables_str])
-    select = "SELECT DISTINCT" if distinct else "SELECT"
-    query = f'{select}\n\t{selection}\nFROM {all_tables_str[0]}'
-    for c in reduced_joined_connections:
-        join = "LEFT JOIN" if c.left_join else "JOIN"
-        query += (
-            f'\n{join} {c.right}\n'
-            f'\tON {c.left}.{c.left_column} = {c.right}.{c.right_column}')
-    if where is not None:
-        if isinstance(where, str):
-            where = [where]
-        query += '\nWHERE\n\t'+"\n\tAND ".join(where)
-    if group_by is not None:
-        if isinstance(group_by, str):
-            group_by = [group_by]
-        query += '\nGROUP BY\n\t'+"\n\t, ".join(group_by)
-    if having is not None:
-        if isinstance(having, str):
-            having = [having]
-        query += '\nHAVING\n\t'+"\n\tAND ".join(having)
-    if order_by is not None:
-        if isinstance(order_by, str):
-            order_by = [order_by]
-        query += '\nORDER BY\n\t'+"\n\t, ".join(order_by)
-    return query
+class EasyQueryCacheInfo(NamedTuple):
+    '''
+    The statistics of the caches used by :func:`build_easy_query` returned by
+    :func:`easy_query_cache_info`.
+    '''
+
+    join_path_hits: int
+    '''The number of the paths between the tables found in the cache.'''
+
+    join_path_misses: int
+    '''The number of the paths between the tables that had to be found.'''
+
+    query_hits: int
+    '''The number of the SQL queries found in the cache.'''
+
+    query_misses: int
+    '''The number of the SQL queries that had to be built.'''
+
+    @property
+    def join_path_hit_rate(self) -> float:
+        '''The part of the paths found in the cache (from 0.0 to 1.0).'''
+        total = self.join_path_hits + self.join_path_misses
+        return 0.0 if total == 0 else self.join_path_hits / total
+
+    @property
+    def query_hit_rate(self) -> float:
+        '''The part of the queries found in the cache (from 0.0 to 1.0).'''
+        total = self.query_hits + self.query_misses
+        return 0.0 if total == 0 else self.query_hits / total
+
+def easy_query_cache_info() -> EasyQueryCacheInfo:
+    '''
+    Returns the statistics of the caches used by :func:`build_easy_query`
+    since they were last cleared.
+    '''
+    join_paths = _find_connection.cache_info()
+    queries = _build_easy_query.cache_info()
+    return EasyQueryCacheInfo(
+        join_paths.hits, join_paths.misses, queries.hits, queries.misses)
 
+def clear_easy_query_cache():
+    '''
+    Clears the caches used by :func:`build_easy_query`. The caches are
+    cleared automatically when the relation map changes.
+    '''
+    _find_connection.cache_clear()
+    _build_easy_query.cache_clear()
 @overload
 def yield_from_easy_query(
         db: Union[Connection, Database],
@@ -487,7 +1138,8 @@ def yield_from_easy_query(
         where: Optional[list[str]] = ...,
         group_by: Optional[list[str]] = ...,
         having: Optional[list[str]] = ...,
-        order_by: Optional[list[str]] = ...
+        order_by: Optional[list[str]] = ...,
+        hydrate: bool = ...
 ) -> Iterator[tuple[_T]]: ...
 @overload
 def yield_from_easy_query(
@@ -501,7 +1153,8 @@ def yield_from_easy_query(
         where: Optional[list[str]] = ...,
         group_by: Optional[list[str]] = ...,
         having: Optional[list[str]] = ...,
-        order_by: Optional[list[str]] = ...
+        order_by: Optional[list[str]] = ...,
+        hydrate: bool = ...
 ) -> Iterator[tuple[_T, _T2]]: ...
 @overload
 def yield_from_easy_query(
@@ -516,7 +1169,8 @@ def yield_from_easy_query(
         where: Optional[list[str]] = ...,
         group_by: Optional[list[str]] = ...,
         having: Optional[list[str]] = ...,
-        order_by: Optional[list[str]] = ...
+        order_by: Optional[list[str]] = ...,
+        hydrate: bool = ...
 ) -> Iterator[tuple[_T, _T2, _T3]]: ...
 @overload
 def yield_from_easy_query(
@@ -532,7 +1186,8 @@ def yield_from_easy_query(
         where: Optional[list[str]] = ...,
         group_by: Optional[list[str]] = ...,
         having: Optional[list[str]] = ...,
-        order_by: Optional[list[str]] = ...
+        order_by: Optional[list[str]] = ...,
+        hydrate: bool = ...
 ) -> Iterator[tuple[_T, _T2, _T3, _T4]]: ...
 @overload
 def yield_from_easy_query(
@@ -549,7 +1204,8 @@ def yield_from_easy_query(
         where: Optional[list[str]] = ...,
         group_by: Optional[list[str]] = ...,
         having: Optional[list[str]] = ...,
-        order_by: Optional[list[str]] = ...
+        order_by: Optional[list[str]] = ...,
+        hydrate: bool = ...
 ) -> Iterator[tuple[_T, _T2, _T3, _T4, _T5]]: ...
 @overload
 def yield_from_easy_query(
@@ -567,7 +1223,8 @@ def yield_from_easy_query(
         where: Optional[list[str]] = ...,
         group_by: Optional[list[str]] = ...,
         having: Optional[list[str]] = ...,
-        order_by: Optional[list[str]] = ...
+        order_by: Optional[list[str]] = ...,
+        hydrate: bool = ...
 ) -> Iterator[tuple[_T, _T2, _T3, _T4, _T5, _T6]]: ...
 @overload
 def yield_from_easy_query(
@@ -586,7 +1243,8 @@ def yield_from_easy_query(
         where: Optional[list[str]] = ...,
         group_by: Optional[list[str]] = ...,
         having: Optional[list[str]] = ...,
-        order_by: Optional[list[str]] = ...
+        order_by: Optional[list[str]] = ...,
+        hydrate: bool = ...
 ) -> Iterator[tuple[_T, _T2, _T3, _T4, _T5, _T6, _T7]]: ...
 @overload
 def yield_from_easy_query(
@@ -606,7 +1264,8 @@ def yield_from_easy_query(
         where: Optional[list[str]] = ...,
         group_by: Optional[list[str]] = ...,
         having: Optional[list[str]] = ...,
-        order_by: Optional[list[str]] = ...
+        order_by: Optional[list[str]] = ...,
+        hydrate: bool = ...
 ) -> Iterator[tuple[_T, _T2, _T3, _T4, _T5, _T6, _T7, _T8]]: ...
 @overload
 def yield_from_easy_query(
@@ -627,7 +1286,8 @@ def yield_from_easy_query(
         where: Optional[list[str]] = ...,
         group_by: Optional[list[str]] = ...,
         having: Optional[list[str]] = ...,
-        order_by: Optional[list[str]] = ...
+        order_by: Optional[list[str]] = ...,
+        hydrate: bool = ...
 ) -> Iterator[tuple[_T, _T2, _T3, _T4, _T5, _T6, _T7, _T8, _T9]]: ...
 
 def yield_from_easy_query(
@@ -641,7 +1301,8 @@ def yield_from_easy_query(
         where: Optional[list[str]] = None,
         group_by: Optional[list[str]] = None,
         having: Optional[list[str]] = None,
-        order_by: Optional[list[str]] = None) -> Iterator[tuple[AbstractDBView | None, ...]]:
+        order_by: Optional[list[str]] = None,
+        hydrate: bool = False) -> Iterator[tuple[AbstractDBView | None, ...]]:
     '''
     Returns an iterator that yields the wrapper classes from the query
     results. The arguments are the same as for :func:`build_easy_query`.
@@ -657,32 +1318,62 @@ def yield_from_easy_query(
         where=where,
         group_by=group_by,
         having=having,
-        order_by=order_by
+        order_by=order_by,
+        hydrate=hydrate
     )
     yield from yield_from_any_query(db, sql_query)
 
 def yield_from_any_query(
         db: Union[Connection, Database],
-        sql_query: str) -> Iterator[tuple[AbstractDBView | None, ...]]:
+        sql_query: str,
+        parameters: Union[Mapping[str, Any], Sequence[Any]] = ()
+) -> Iterator[tuple[AbstractDBView | None, ...]]:
     '''
     Yields the results from any query generated by :func:`build_easy_query`
     function and wraps them in the wrapper classes. This function in
     combination with :func:`build_easy_query` is equivalent to the
     :func:`yield_from_easy_query` function.
+
+    If the database has a :attr:`Database.read_pool`, the query runs on a
+    connection from the pool, which is used until the iteration ends.
+
+    If the query was built with :code:`hydrate=True`, the wrapper objects
+    are created with the cached results of their :code:`query_result`
+    method.
+
+    If the database has an :attr:`Database.identity_map`, the wrapper objects
+    are taken from it.
+
+    :param db: The Database object or the sqlite3.Connection.
+    :param sql_query: The query.
+    :param parameters: The values of the placeholders of the query (see
+        :class:`PreparedEasyQuery`).
     '''
-    if isinstance(db, Database):
-        db = db.connection
-    cursor = db.execute(sql_query)
-    wrappers = [
-        WRAPPER_CLASSES[d[0]] for d in cursor.description
-    ]
-    for row in cursor:
-        yield tuple(  # type: ignore
-            None if value is None else wrapper(db, value)
-            for value, wrapper in zip(row, wrappers)
-        )
+    wrap = wrap_query_row
+    if isinstance(db, Database) and db.identity_map is not None:
+        wrap = db.identity_map.wrap_query_row
+    with _query_connection(db) as connection:
+        cursor = connection.execute(sql_query, parameters)
+        wrappers = wrap_query_columns(cursor.description)
+        for row in cursor:
+            yield wrap(connection, row, wrappers)
 
 # Private functions
+@contextmanager
+def _query_connection(db: Union[Connection, Database]) -> Iterator[Connection]:
+    '''
+    A context manager that provides the connection used for running the
+    queries - a connection from the :attr:`Database.read_pool` if the
+    database has one, otherwise the connection of the database.
+    '''
+    if not isinstance(db, Database):
+        yield db
+    elif db.read_pool is not None:
+        with db.read_pool.connection() as connection:
+            yield connection
+    else:
+        yield db.connection
+
 @dataclass
 class _EasyQueryConnection:
     '''
@@ -695,43 +1386,210 @@ class _EasyQueryConnection:
     right_column: str
     left_join: bool = False
 
+_cached_relation_map_version = relation_map_version()
+
+def _check_relation_map():
+    '''
+    Clears the caches of :func:`build_easy_query` if the relation map changed
+    since they were filled.
+    '''
+    global _cached_relation_map_version  # pylint: disable=global-statement
+    version = relation_map_version()
+    if version != _cached_relation_map_version:
+        clear_easy_query_cache()
+        _cached_relation_map_version = version
+
+def _as_tuple(
+        value: Union[str, Iterable[str], None]) -> Optional[tuple[str, ...]]:
+    '''
+    Converts an optional list of the parts of the SQL query (or a single
+    string) into a tuple, so it can be used as a key of a cache.
+    '''
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return (value,)
+    return tuple(value)
+
+@lru_cache(maxsize=1024)
+def _build_easy_query(
+        tables: tuple[tuple[str, bool], ...],
+        blacklist: tuple[str, ...],
+        accept_non_pk: bool,
+        distinct: bool,
+        where: Optional[tuple[str, ...]],
+        group_by: Optional[tuple[str, ...]],
+        having: Optional[tuple[str, ...]],
+        order_by: Optional[tuple[str, ...]],
+        hydrate: bool,
+        columns: Optional[tuple[str, ...]]) -> str:
+    '''
+    Builds the query of :func:`build_easy_query`. The tables are the pairs of
+    the names of the tables and the flags that tell whether they're joined
+    with LEFT join. The other arguments are the same as in
+    :func:`build_easy_query`, but converted to tuples, so the results can be
+    cached.
+    '''
+    for t, _ in tables:
+        if t not in RELATION_MAP.keys():
+            raise ValueError(
+                f"Table '{t}' does not exist in the database.")
+    joined_connections: list[_EasyQueryConnection] = []
+    for (prev_t, _), (t, left) in zip(tables, tables[1:]):
+        connection = _find_connection(
+            prev_t, t, accept_non_pk, frozenset(blacklist))
+        if connection is None:
+            raise ValueError(
+                f"No connection between {prev_t} and {t} "
+                f"after excluding tables: {', '.join(blacklist)}")
+        # The connections are shared with the cache, so they're copied
+        connection = [replace(c) for c in connection]
+        # if left and len(connection) > 1:
+        if left:
+            connection[-1].left_join = True
+        joined_connections.extend(connection)
+    # Strip joined_connections of duplicates
+    reduced_joined_connections: list[_EasyQueryConnection] = []
+    if len(joined_connections) > 0:
+        known_connections = {joined_connections[0].left}
+        for jc in joined_connections:
+            if jc.right in known_connections:
+                continue
+            known_connections.add(jc.right)
+            reduced_joined_connections.append(jc)
+
+    # Build the quer
+    selected_columns: list[str] = []
+    for t, _ in tables:
+        selected_columns.append(f"{t}_pk AS {t}")
+        if hydrate:
+            selected_columns.extend(
+                f'{t}.{c} AS "{t}.{c}"'
+                for c in WRAPPER_CLASSES[t].query_result_columns)
+    if columns is not None:
+        selected_columns.extend(columns)
+    selection = ",\n\t".join(selected_columns)
+    select = "SELECT DISTINCT" if distinct else "SELECT"
+    query = f'{select}\n\t{selection}\nFROM {tables[0][0]}'
+    for c in reduced_joined_connections:
+        join = "LEFT JOIN" if c.left_join else "JOIN"
+        query += (
+            f'\n{join} {c.right}\n'
+            f'\tON {c.left}.{c.left_column} = {c.right}.{c.right_column}')
+    if where is not None:
+        query += '\nWHERE\n\t'+"\n\tAND ".join(where)
+    if group_by is not None:
+        query += '\nGROUP BY\n\t'+"\n\t, ".join(group_by)
+    if having is not None:
+        query += '\nHAVING\n\t'+"\n\tAND ".join(having)
+    if order_by is not None:
+        query += '\nORDER BY\n\t'+"\n\t, ".join(order_by)
+    return query
+
+@lru_cache(maxsize=4096)
 def _find_connection(
-        start: str, end: str, accept_non_pk: bool, visited: set[str]):
+        start: str, end: str, accept_non_pk: bool,
+        blacklist: frozenset[str]
+) -> Optional[tuple[_EasyQueryConnection, ...]]:
     '''
-    Finds a connnection between two tables in the database.
+    Finds the shortest connnection between two tables in the database. The
+    results are cached, so they must not be modified.
 
-    :param db: The database connection.
     :param start: The starting table.
     :param end: The ending table.
     :param accept_non_pk: Whether to accept non-primary key relations.
-    :param visited: A list of tables to ignore while searching.
+    :param blacklist: A set of tables to ignore while searching.
     '''
-    queue: deque[tuple[str, list[_EasyQueryConnection]]] = deque([(start, [])])
+    if start in blacklist:
+        return None
+    # Maps the visited tables to the connections used to reach them
+    parents: dict[str, Optional[_EasyQueryConnection]] = {start: None}
+    queue: deque[str] = deque([start])
     while len(queue) > 0:
         # Pop the first element (shortest path visited)
-        node, path = queue.popleft()
-        if node in visited:
-            continue
-        visited.add(node)
+        node = queue.popleft()
 
         # If node is the end, return the path
         if node == end:
-            return path
+            path: list[_EasyQueryConnection] = []
+            parent = parents[node]
+            while parent is not None:
+                path.append(parent)
+                parent = parents[parent.left]
+            return tuple(reversed(path))
 
         # Add all connections to the end of the queue
         for child, relation in RELATION_MAP.get(node, {}).items():
             if not accept_non_pk and not relation.is_pk:
                 continue
-            queue.append((child, path + [
-                _EasyQueryConnection(
-                    left=node,
-                    left_column=relation.columns[0],
-                    right=child,
-                    right_column=relation.columns[1]
-                )
-            ]))
+            if child in parents or child in blacklist:
+                continue
+            parents[child] = _EasyQueryConnection(
+                left=node,
+                left_column=relation.columns[0],
+                right=child,
+                right_column=relation.columns[1]
+            )
+            queue.append(child)
     return None
 
 # Finalize building dynamic classes
 assert validate_weak_connections()
 add_reverse_connections()
+WEAK_CONNECTION_INDEXES_BUILD_SCRIPT: str = (
+    build_weak_connection_indexes_script())
+
+# The asyncio facade, the columnar queries, the prepared queries and the
+# paginated queries use the Database class and the functions defined above.
+# They're imported when they're used for the first time, so the applications
+# that don't use them don't pay for importing asyncio. The same applies to
+# the tools used only by some of the loaders (the archives, the cache, the
+# manifests), the watcher, the read pool and the identity map.
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "RowBuffer": "._loading",
+    "load_components": "._loading",
+    "refresh_components": "._loading",
+    "refresh_transaction": "._loading",
+    "start_extraction": "._loading",
+    "RefreshResult": "._loading",
+    "LoadReport": "._loading",
+    "ComponentReport": "._loading",
+    "ProgressCallback": "._loading",
+    "PackManifest": "._manifest",
+    "scan_pack": "._manifest",
+    "PackWatcher": "._watch",
+    "ExtractionCache": "._cache",
+    "ArchivePath": "._archive",
+    "find_archive_packs": "._archive",
+    "is_archive": "._archive",
+    "ReadConnectionPool": "._pool",
+    "IdentityMap": "._identity",
+    "AsyncDatabase": "._async",
+    "DictionaryColumn": "._columns",
+    "fetch_columns": "._columns",
+    "PreparedEasyQuery": "._prepared",
+    "EasyQueryPage": "._pages",
+    "fetch_easy_query_page": "._pages",
+    "yield_easy_query_pages": "._pages",
+}
+
+def __getattr__(name: str) -> Any:
+    '''
+    Imports the attributes of the package listed in the _LAZY_ATTRIBUTES from
+    their modules on the first access.
+    '''
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(
+        importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
+
+# The star import imports the lazy attributes too
+__all__ = [
+    name for name in list(globals()) + list(_LAZY_ATTRIBUTES)
+    if not name.startswith("_")
+]
@@ -0,0 +1,253 @@
+'''
+This file contains the tools for loading the packs directly from the
+.mcpack, .mcaddon and .zip archives without extracting them. The files inside
+of the archives are represented by :class:`ArchivePath` objects, which
+support the subset of the :class:`pathlib.Path` API used by the loaders.
+'''
+from __future__ import annotations
+from io import BytesIO, TextIOWrapper
+from pathlib import Path, PurePath, PurePosixPath
+from threading import Lock
+from typing import IO, Any, Literal, NamedTuple, Optional, Union
+from zipfile import ZipFile
+import os
+
+from ._jsonc import loads_jsonc
+
+ARCHIVE_SUFFIXES: set[str] = {".mcpack", ".mcaddon", ".zip"}
+'''The suffixes of the files that are treated as archives with packs.'''
+
+_ARCHIVES: dict[tuple[str, ...], tuple[tuple[int, int], ZipFile]] = {}
+'''
+The open archives mapped to the state of the archive file from the moment it
+was opened (the modification time and the size).
+'''
+
+_ARCHIVES_LOCK = Lock()
+
+def _forget_archives():
+    '''
+    Forgets the archives opened by the parent process. The forked processes
+    share the file descriptors with the parent, so reading the same archive
+    from both of them would mix up the positions in the file.
+    '''
+    global _ARCHIVES_LOCK  # pylint: disable=global-statement
+    _ARCHIVES.clear()
+    _ARCHIVES_LOCK = Lock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_archives)
+
+def open_archive(chain: tuple[str, ...]) -> ZipFile:
+    '''
+    Returns the open archive. The archives are cached and opened again when
+    the archive file changes.
+
+    :param chain: The path to the archive file followed by the names of the
+        members of the archives nested in it (for example the .mcpack files
+        inside of an .mcaddon).
+    '''
+    stat = os.stat(chain[0])
+    state = (stat.st_mtime_ns, stat.st_size)
+    with _ARCHIVES_LOCK:
+        cached = _ARCHIVES.get(chain)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+    if len(chain) == 1:
+        archive = ZipFile(chain[0])
+    else:
+        # The nested archives are read into the memory because the members
+        # of the compressed archives can't be seeked efficiently
+        archive = ZipFile(BytesIO(open_archive(chain[:-1]).read(chain[-1])))
+    with _ARCHIVES_LOCK:
+        if cached is not None:
+            cached[1].close()
+        _ARCHIVES[chain] = (state, archive)
+    return archive
+
+class _ArchiveStat(NamedTuple):
+    '''
+    The part of the :class:`os.stat_result` provided by
+    :meth:`ArchivePath.stat`.
+    '''
+    st_size: int
+    st_mtime_ns: int
+
+class ArchivePath(PurePosixPath):
+    '''
+    A path to a file or a directory inside of an archive. The string form of
+    the path is the path to the archive file followed by the path inside of
+    the archive (for example "packs/addon.mcaddon/RP/entity/pig.json"), and
+    that's how the paths of the files from the archives are stored in the
+    database.
+
+    Use :meth:`create` to create the objects. The paths derived from the
+    archive paths with the methods of :class:`PurePosixPath` (like
+    :code:`parent` or :code:`with_suffix`) only support the pure path
+    operations.
+    '''
+    _chain: tuple[str, ...]
+    _member: str
+
+    @staticmethod
+    def create(chain: tuple[str, ...], member: str) -> ArchivePath:
+        '''
+        :param chain: The path to the archive file followed by the names of
+            the nested archives (see :func:`open_archive`).
+        :param member: The name of the file or the directory in the
+            innermost archive. An empty string for the root of the archive.
+        '''
+        if member == "":
+            path = ArchivePath(*chain)
+        else:
+            path = ArchivePath(*chain, member)
+        path._chain = chain
+        path._member = member
+        return path
+
+    @property
+    def chain(self) -> tuple[str, ...]:
+        '''
+        The path to the archive file followed by the names of the nested
+        archives.
+        '''
+        return self._chain
+
+    @property
+    def member(self) -> str:
+        '''
+        The name of the file or the directory in the innermost archive.
+        '''
+        return self._member
+
+    def __reduce__(self):
+        return (ArchivePath.create, (self._chain, self._member))
+
+    def __truediv__(self, key: Union[str, PurePath]) -> ArchivePath:
+        member = PurePosixPath(self._member, key).as_posix()
+        return ArchivePath.create(self._chain, member)
+
+    def open(
+            self, mode: str = "r", encoding: Optional[str] = None,
+            errors: Optional[str] = None,
+            newline: Optional[str] = None) -> IO[Any]:
+        '''
+        Opens the file for reading.
+        '''
+        if mode not in ("r", "rb", "rt"):
+            raise ValueError(f"The archive files can't be opened in '{mode}' mode")
+        file = open_archive(self._chain).open(self._member)
+        if mode == "rb":
+            return file
+        return TextIOWrapper(
+            file, encoding=encoding, errors=errors, newline=newline)
+
+    def read_bytes(self) -> bytes:
+        '''
+        Returns the content of the file.
+        '''
+        return open_archive(self._chain).read(self._member)
+
+    def read_text(self, encoding: Optional[str] = None) -> str:
+        '''
+        Returns the content of the file decoded as text.
+        '''
+        with self.open(encoding=encoding) as file:
+            return file.read()
+
+    def stat(self) -> _ArchiveStat:
+        '''
+        Returns the size of the file and the modification time of the
+        archive file. The time of the archive file is used because the
+        timestamps of the members of the archives don't change when the
+        archive is rebuilt.
+        '''
+        info = open_archive(self._chain).getinfo(self._member)
+        return _ArchiveStat(info.file_size, os.stat(self._chain[0]).st_mtime_ns)
+
+def is_archive(path: Union[Path, str]) -> bool:
+    '''
+    Checks if the path points to an archive file.
+    '''
+    path = Path(path)
+    return path.suffix.lower() in ARCHIVE_SUFFIXES and path.is_file()
+
+def resolve_pack_path(
+        path: Union[PurePath, str]) -> Union[Path, ArchivePath]:
+    '''
+    Returns the :class:`ArchivePath` if the path points to a directory
+    inside of an archive or to an archive file, otherwise returns the path
+    as :class:`Path`.
+
+    :param path: A path stored in the database.
+    '''
+    if isinstance(path, ArchivePath):
+        return path
+    path = Path(path)
+    if path.is_dir():
+        return path
+    # Find the archive file on the disk
+    for archive in (path, *path.parents):
+        if is_archive(archive):
+            break
+    else:
+        return path
+    chain = (archive.as_posix(),)
+    member_parts: list[str] = []
+    for part in path.relative_to(archive).parts:
+        member_parts.append(part)
+        if Path(part).suffix.lower() in ARCHIVE_SUFFIXES:
+            # Check if it's a nested archive
+            name = "/".join(member_parts)
+            try:
+                open_archive(chain).getinfo(name)
+            except KeyError:
+                continue
+            chain = chain + (name,)
+            member_parts.clear()
+    return ArchivePath.create(chain, "/".join(member_parts))
+
+def find_archive_packs(
+        archive: Union[Path, str]
+) -> list[tuple[Optional[Literal["rp", "bp"]], ArchivePath]]:
+    '''
+    Finds the packs in an archive. The packs are the directories with the
+    "manifest.json" files. The types of the packs are read from the modules
+    of the manifests ("resources" for the resource packs and "data" for the
+    behavior packs). The archives nested in the archive are also searched.
+    If the archive doesn't have any manifests, its root is returned as a
+    pack of unknown type (None).
+
+    :param archive: The path to the archive file.
+    '''
+    packs = _find_archive_packs((Path(archive).as_posix(),))
+    if len(packs) == 0:
+        return [(None, ArchivePath.create((Path(archive).as_posix(),), ""))]
+    return packs
+
+def _find_archive_packs(
+        chain: tuple[str, ...]
+) -> list[tuple[Optional[Literal["rp", "bp"]], ArchivePath]]:
+    result: list[tuple[Optional[Literal["rp", "bp"]], ArchivePath]] = []
+    for name in sorted(open_archive(chain).namelist()):
+        if name.endswith("/"):
+            continue
+        if PurePosixPath(name).suffix.lower() in ARCHIVE_SUFFIXES:
+            result.extend(_find_archive_packs(chain + (name,)))
+            continue
+        directory, _, file_name = name.rpartition("/")
+        if file_name != "manifest.json":
+            continue
+        pack_type: Optional[Literal["rp", "bp"]] = None
+        try:
+            manifest = loads_jsonc(
+                open_archive(chain).read(name).decode('utf8'))
+            for module in manifest.get("modules", []):
+                if module.get("type") == "resources":
+                    pack_type = "rp"
+                elif module.get("type") == "data":
+                    pack_type = "bp"
+        except (ValueError, AttributeError):
+            pass  # Invalid manifest, the type is unknown
+        result.append((pack_type, ArchivePath.create(chain, directory)))
+    return result
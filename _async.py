@@ -0,0 +1,322 @@
+'''
+This file contains the :class:`AsyncDatabase` class - a facade of the
+:class:`Database` for the asyncio applications.
+'''
+from __future__ import annotations
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from sqlite3 import Connection, Cursor
+from typing import (
+    Any, AsyncIterator, Callable, Iterable, Literal, Mapping, Optional, Type,
+    TypeVar, Union)
+import asyncio
+
+from . import (
+    Database, AbstractDBView, Left, LoadReport, PackLoadResult,
+    RefreshResult, build_easy_query)
+from ._views import wrap_query_columns, wrap_query_row
+
+_R = TypeVar("_R")
+
+def _execute(
+        connection: Connection, sql_query: str,
+        parameters: Union[Mapping[str, Any], Iterable[Any]]
+) -> tuple[Cursor, list[tuple[type, int, int, int]]]:
+    '''
+    Executes the query and returns the cursor and the instructions for
+    wrapping its rows in the wrapper classes.
+    '''
+    if not isinstance(parameters, Mapping):
+        parameters = tuple(parameters)
+    cursor = connection.execute(sql_query, parameters)
+    return cursor, wrap_query_columns(cursor.description)
+
+def _fetch(
+        connection: Connection, cursor: Cursor,
+        wrappers: list[tuple[type, int, int, int]], size: int,
+        wrap: Callable[..., tuple[AbstractDBView | None, ...]] = wrap_query_row
+) -> list[tuple[AbstractDBView | None, ...]]:
+    '''
+    Fetches the next chunk of the results of the query and wraps them in the
+    wrapper classes using the wrap function.
+    '''
+    return [
+        wrap(connection, row, wrappers)
+        for row in cursor.fetchmany(size)
+    ]
+
+class AsyncDatabase:
+    '''
+    A facade of the :class:`Database` that runs the blocking operations in
+    the threads, so they don't block the asyncio event loop.
+
+    The loading and the other operations that modify the database run one
+    at a time on a dedicated writer thread. The queries run on a pool of
+    reader threads with the connections from the :attr:`Database.read_pool`,
+    so multiple queries can run at the same time and the readers don't wait
+    for the writer. The databases without a file (in memory) can't be shared
+    between the connections, so their queries run on the writer thread.
+
+    The wrapper objects returned by the queries are bound to the read
+    connections. Reading their properties runs a query in the current
+    thread.
+
+    Example:
+
+    .. code-block:: python
+
+        async with AsyncDatabase.open("packs.db") as db:
+            await db.load_rp("RP")
+            async for entity, in db.yield_from_easy_query(Entity):
+                print(entity.identifier)
+    '''
+    def __init__(
+            self, database: Database, readers: int = 4,
+            chunk_size: int = 256):
+        '''
+        :param database: The database. It can't be used directly while it's
+            used by the AsyncDatabase.
+        :param readers: The size of the read pool opened if the database
+            doesn't have one (see :meth:`Database.open_read_pool`).
+        :param chunk_size: The default number of the rows fetched from the
+            database at once while iterating over the results of a query.
+        '''
+        self.database = database
+        self.chunk_size = chunk_size
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="AsyncDatabaseWriter")
+        has_file = database.connection.execute(
+            "PRAGMA database_list").fetchone()[2] != ""
+        if database.read_pool is None and has_file and readers > 0:
+            database.open_read_pool(readers)
+        self._readers: Executor = self._writer
+        # Limits the number of the tasks that use the read connections, so
+        # taking a connection from the pool doesn't block the reader threads.
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        if database.read_pool is not None:
+            self._readers = ThreadPoolExecutor(
+                max_workers=database.read_pool.size,
+                thread_name_prefix="AsyncDatabaseReader")
+            self._semaphore = asyncio.Semaphore(database.read_pool.size)
+
+    @staticmethod
+    def open(
+            db_path: Union[str, Path], readers: int = 4,
+            chunk_size: int = 256) -> AsyncDatabase:
+        '''
+        Opens an existing database file (see :meth:`Database.open`).
+        '''
+        return AsyncDatabase(Database.open(db_path), readers, chunk_size)
+
+    @staticmethod
+    def create(
+            db_path: Union[str, Path] = ":memory:", readers: int = 4,
+            chunk_size: int = 256) -> AsyncDatabase:
+        '''
+        Creates a new database (see :meth:`Database.create`).
+        '''
+        return AsyncDatabase(Database.create(db_path), readers, chunk_size)
+
+    async def write(self, function: Callable[[Database], _R]) -> _R:
+        '''
+        Runs the function with the :class:`Database` on the writer thread and
+        returns its result.
+
+        Cancelling the task that waits for the result doesn't stop the
+        function. It keeps running on the writer thread until it ends.
+        '''
+        return await asyncio.get_running_loop().run_in_executor(
+            self._writer, function, self.database)
+
+    async def load_rp(self, rp_path: Union[Path, str], **kwargs: Any) -> LoadReport:
+        '''
+        Runs :meth:`Database.load_rp` on the writer thread.
+        '''
+        return await self.write(lambda db: db.load_rp(rp_path, **kwargs))
+
+    async def load_bp(self, bp_path: Union[Path, str], **kwargs: Any) -> LoadReport:
+        '''
+        Runs :meth:`Database.load_bp` on the writer thread.
+        '''
+        return await self.write(lambda db: db.load_bp(bp_path, **kwargs))
+
+    async def load_many(
+            self,
+            packs: Iterable[tuple[Literal["rp", "bp"], Union[Path, str]]],
+            **kwargs: Any) -> list[PackLoadResult]:
+        '''
+        Runs :meth:`Database.load_many` on the writer thread.
+        '''
+        packs = list(packs)
+        return await self.write(lambda db: db.load_many(packs, **kwargs))
+
+    async def refresh_rp(self, rp_pk: int, **kwargs: Any) -> RefreshResult:
+        '''
+        Runs :meth:`Database.refresh_rp` on the writer thread.
+        '''
+        return await self.write(lambda db: db.refresh_rp(rp_pk, **kwargs))
+
+    async def refresh_bp(self, bp_pk: int, **kwargs: Any) -> RefreshResult:
+        '''
+        Runs :meth:`Database.refresh_bp` on the writer thread.
+        '''
+        return await self.write(lambda db: db.refresh_bp(bp_pk, **kwargs))
+
+    async def commit(self):
+        '''
+        Runs :meth:`Database.commit` on the writer thread.
+        '''
+        await self.write(lambda db: db.commit())
+
+    async def _acquire(self) -> Connection:
+        '''
+        Takes a read connection from the pool. Without the read pool, returns
+        the connection of the database.
+        '''
+        if self._semaphore is None or self.database.read_pool is None:
+            return self.database.connection
+        await self._semaphore.acquire()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._readers, self.database.read_pool.acquire)
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    def _release(self, connection: Connection):
+        '''
+        Returns the read connection to the pool.
+        '''
+        if self._semaphore is None or self.database.read_pool is None:
+            return
+        self.database.read_pool.release(connection)
+        self._semaphore.release()
+
+    async def _run(
+            self, connection: Connection, function: Callable[..., _R],
+            *args: Any) -> _R:
+        '''
+        Runs the function that uses the connection on a reader thread. If the
+        task is cancelled before the function starts, the function is
+        removed from the queue. Otherwise the running query is interrupted
+        and the function is awaited before passing the cancellation on, so
+        the connection can be safely reused. The queries that share the
+        connection with the writer (without the read pool) aren't
+        interrupted, because the interrupt could stop the statements of the
+        writer.
+        '''
+        task = self._readers.submit(function, *args)
+        future = asyncio.wrap_future(task)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if task.cancel():
+                raise  # The function didn't start
+            if connection is not self.database.connection:
+                connection.interrupt()
+            await asyncio.wait([future])
+            if not future.cancelled():
+                future.exception()  # Mark the exception as retrieved
+            raise
+
+    async def read(self, function: Callable[[Connection], _R]) -> _R:
+        '''
+        Runs the function with a read connection on a reader thread and
+        returns its result. Cancelling the task interrupts the query that
+        runs on the read connection. Without the read pool, the running
+        query isn't interrupted and the cancellation waits for it.
+        '''
+        connection = await self._acquire()
+        try:
+            return await self._run(connection, function, connection)
+        finally:
+            self._release(connection)
+
+    async def yield_from_any_query(
+            self, sql_query: str,
+            parameters: Union[Mapping[str, Any], Iterable[Any]] = (),
+            chunk_size: Optional[int] = None
+    ) -> AsyncIterator[tuple[AbstractDBView | None, ...]]:
+        '''
+        Yields the results of the query generated by
+        :func:`build_easy_query` wrapped in the wrapper classes (see
+        :func:`yield_from_any_query`). The results are fetched in the chunks
+        on a reader thread.
+
+        The read connection is used until the iteration ends. Use
+        :func:`contextlib.aclosing` to return it to the pool immediately when
+        the iteration is stopped early. Cancelling the task interrupts the
+        query.
+
+        :param sql_query: The query.
+        :param parameters: The parameters of the query (a mapping for the
+            named placeholders, see :class:`PreparedEasyQuery`).
+        :param chunk_size: The number of the rows fetched at once. By
+            default, it's the :code:`chunk_size` of the AsyncDatabase.
+        '''
+        if chunk_size is None:
+            chunk_size = self.chunk_size
+        wrap = wrap_query_row
+        if self.database.identity_map is not None:
+            wrap = self.database.identity_map.wrap_query_row
+        connection = await self._acquire()
+        cursor: Optional[Cursor] = None
+        try:
+            cursor, wrappers = await self._run(
+                connection, _execute, connection, sql_query, parameters)
+            while True:
+                rows = await self._run(
+                    connection, _fetch, connection, cursor, wrappers,
+                    chunk_size, wrap)
+                for row in rows:
+                    yield row
+                if len(rows) < chunk_size:
+                    break
+        finally:
+            if cursor is not None:
+                cursor.close()
+            self._release(connection)
+
+    def yield_from_easy_query(
+            self,
+            root: Type[AbstractDBView],
+            *tables: Type[AbstractDBView] | Left[AbstractDBView],
+            chunk_size: Optional[int] = None,
+            **kwargs: Any
+    ) -> AsyncIterator[tuple[AbstractDBView | None, ...]]:
+        '''
+        Yields the results of the easy query. The arguments are the same as
+        for :func:`build_easy_query` (see :meth:`yield_from_any_query`).
+        '''
+        return self.yield_from_any_query(
+            build_easy_query(root, *tables, **kwargs), chunk_size=chunk_size)
+
+    async def easy_query(
+            self,
+            root: Type[AbstractDBView],
+            *tables: Type[AbstractDBView] | Left[AbstractDBView],
+            **kwargs: Any) -> list[tuple[AbstractDBView | None, ...]]:
+        '''
+        Returns the list of all of the results of the easy query. The
+        arguments are the same as for :func:`build_easy_query`.
+        '''
+        return [
+            row async for row in self.yield_from_easy_query(
+                root, *tables, **kwargs)
+        ]
+
+    async def close(self):
+        '''
+        Waits for the running operations and closes the database.
+        '''
+        def close():
+            self._writer.shutdown()
+            self._readers.shutdown()
+            self.database.close()
+        await asyncio.get_running_loop().run_in_executor(None, close)
+
+    async def __aenter__(self) -> AsyncDatabase:
+        return self
+
+    async def __aexit__(self, *args: object):
+        await self.close()
@@ -0,0 +1,262 @@
+'''
+This file contains the :class:`ExtractionCache` - a persistent cache of the
+rows extracted from the files of the packs. The cache lets the loaders skip
+parsing the files that didn't change since the last time they were loaded,
+even if they're loaded into a new database.
+'''
+from __future__ import annotations
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Union
+import hashlib
+import importlib
+import pickle
+import sqlite3
+
+from ._components import PACK_COMPONENTS, ExtractedRow, FileRows, hash_file
+from ._manifest import ManifestEntry
+
+_SCHEMA_VERSION = 3
+'''
+The version of the schema of the cache stored in its "user_version". The
+caches with a different version are cleared when they're opened.
+'''
+
+_BUILD_SCRIPT = '''
+CREATE TABLE IF NOT EXISTS ExtractedRows (
+    component TEXT NOT NULL,
+    pack TEXT NOT NULL,
+    path TEXT NOT NULL,
+    contentHash TEXT NOT NULL,
+    mtime INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    version TEXT NOT NULL,
+    rows BLOB NOT NULL,
+    PRIMARY KEY (component, pack, path, contentHash)
+);
+'''
+
+@lru_cache(maxsize=None)
+def extractor_version(name: str) -> str:
+    '''
+    Returns the version of the extractor of a pack component. The version
+    is the hash of the source code of the module that defines the extractor
+    and the modules shared by all of the extractors (including the JSON
+    parsers), so it changes whenever the extraction logic changes.
+    '''
+    extract = PACK_COMPONENTS[name].extract
+    version = hashlib.sha1()
+    for module_name in (
+            extract.__module__, FileRows.__module__,
+            f"{__package__}.utils", f"{__package__}._jsonc",
+            f"{__package__}.better_json_tools"):
+        try:
+            module = importlib.import_module(module_name)
+            module_path = Path(module.__file__)  # type: ignore
+            if hasattr(module, "__path__"):
+                # A package, all of its modules are hashed
+                paths = sorted(module_path.parent.glob("*.py"))
+            else:
+                paths = [module_path]
+            for path in paths:
+                version.update(path.read_bytes())
+        except (ImportError, TypeError, OSError):
+            # Modules without the source files (for example frozen)
+            version.update(module_name.encode('utf8'))
+    return version.hexdigest()
+
+class ExtractionCache:
+    '''
+    A cache of the rows extracted from the files stored in an SQLite
+    database file. The rows are identified by the name of the component, the
+    absolute path to the pack, the path to the file relative to the pack and
+    the hash of its content. The
+    rows extracted by an older version of the extractor are ignored and
+    removed from the cache when it's opened.
+
+    The size and the modification time of the file are stored with the rows,
+    so the files that didn't change are found without reading them. The
+    files are only hashed when their state changed but the cache has rows
+    of the same path, and the files without any cached rows are parsed
+    directly.
+
+    The cache stores pickled objects, so it should only be shared between
+    trusted users.
+    '''
+    def __init__(self, path: Union[Path, str]):
+        '''
+        :param path: The path to the cache database file. It's created if it
+            doesn't exist.
+        '''
+        if isinstance(path, Path):
+            path = path.as_posix()
+        self.connection = sqlite3.connect(path)
+        if self.connection.execute(
+                "PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            self.connection.executescript(
+                "DROP TABLE IF EXISTS ExtractedRows;\n"
+                f"PRAGMA user_version = {_SCHEMA_VERSION};\n")
+        self.connection.executescript(_BUILD_SCRIPT)
+        self.hits = 0
+        '''The number of files loaded from the cache.'''
+        self.misses = 0
+        '''The number of files that had to be parsed.'''
+        # Remove the stale rows
+        self.connection.executemany(
+            "DELETE FROM ExtractedRows WHERE component = ? AND version != ?",
+            [(name, extractor_version(name)) for name in PACK_COMPONENTS])
+        self.connection.commit()
+        # Maps the names of the components to the (pack, relative path) of
+        # their cached files and the (contentHash, mtime, size) of every
+        # version of the file. They're loaded once per component, so the
+        # files that aren't cached don't need any queries.
+        self._states: dict[
+            str, dict[tuple[str, str], list[tuple[str, int, int]]]] = {}
+        # The rows added by put that aren't inserted yet
+        self._pending: list[
+            tuple[str, str, str, str, int, int, str, bytes]] = []
+
+    def _component_states(
+            self, name: str
+    ) -> dict[tuple[str, str], list[tuple[str, int, int]]]:
+        '''
+        Returns the states of the cached files of the component.
+        '''
+        states = self._states.get(name)
+        if states is None:
+            states = {}
+            rows = self.connection.execute(
+                "SELECT pack, path, contentHash, mtime, size "
+                "FROM ExtractedRows WHERE component = ?", (name,))
+            for pack, path, content_hash, mtime, size in rows:
+                states.setdefault((pack, path), []).append(
+                    (content_hash, mtime, size))
+            self._states[name] = states
+        return states
+
+    def get(
+            self, name: str, pack: str, relative_path: str,
+            entry: ManifestEntry) -> Optional[FileRows]:
+        '''
+        Returns the rows of the file from the cache or None if they're not
+        cached. The "*File" row is updated with the path and the state of the
+        file from the manifest entry.
+
+        :param name: The name of the pack component.
+        :param pack: The absolute path to the pack.
+        :param relative_path: The path to the file relative to the pack.
+        :param entry: The manifest entry of the file.
+        '''
+        states = self._component_states(name).get((pack, relative_path), [])
+        content_hash = next(
+            (
+                content_hash for content_hash, mtime, size in states
+                if mtime == entry.mtime_ns and size == entry.size
+            ),
+            None)
+        if content_hash is None and len(states) > 0:
+            # The file was modified or touched, it's the same file if its
+            # content didn't change
+            try:
+                file_hash: Optional[str] = hash_file(entry.path)
+            except OSError:
+                file_hash = None
+            if any(state[0] == file_hash for state in states):
+                content_hash = file_hash
+                self._flush()
+                self.connection.execute(
+                    "UPDATE ExtractedRows SET mtime = ?, size = ? "
+                    "WHERE component = ? AND pack = ? AND path = ? "
+                    "AND contentHash = ?",
+                    (
+                        entry.mtime_ns, entry.size, name, pack,
+                        relative_path, content_hash))
+                states[:] = [
+                    state if state[0] != content_hash
+                    else (content_hash, entry.mtime_ns, entry.size)
+                    for state in states
+                ]
+        row = None
+        if content_hash is not None:
+            self._flush()
+            row = self.connection.execute(
+                "SELECT rows FROM ExtractedRows WHERE component = ? "
+                "AND pack = ? AND path = ? AND contentHash = ?",
+                (name, pack, relative_path, content_hash)
+            ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        rows = [ExtractedRow._make(row) for row in pickle.loads(row[0])]
+        table, columns, values = rows[0]
+        file_values = dict(zip(columns, values))
+        file_values.update(
+            path=entry.path.as_posix(), mtime=entry.mtime_ns, size=entry.size)
+        rows[0] = ExtractedRow(table, columns, tuple(file_values.values()))
+        file_rows = FileRows.__new__(FileRows)
+        file_rows.path = entry.path
+        file_rows.rows = rows
+        file_rows._content = None  # pylint: disable=protected-access
+        return file_rows
+
+    def put(
+            self, name: str, pack: str, relative_path: str,
+            file_rows: FileRows):
+        '''
+        Adds the rows extracted from a file to the cache. The rows are
+        inserted into the database in batches.
+
+        :param name: The name of the pack component.
+        :param pack: The absolute path to the pack.
+        :param relative_path: The path to the file relative to the pack.
+        :param file_rows: The extracted rows.
+        '''
+        _, columns, values = file_rows.rows[0]
+        file_values = dict(zip(columns, values))
+        content_hash, mtime, size = (
+            file_values["contentHash"], file_values["mtime"],
+            file_values["size"])
+        if content_hash is None or mtime is None:
+            return  # The file couldn't be read or the extractor didn't read it
+        # The rows are pickled as plain tuples, which is much faster than
+        # pickling the named tuples
+        self._pending.append((
+            name, pack, relative_path, content_hash, mtime, size,
+            extractor_version(name),
+            pickle.dumps(
+                [tuple(row) for row in file_rows.rows],
+                pickle.HIGHEST_PROTOCOL)))
+        states = self._component_states(name).setdefault(
+            (pack, relative_path), [])
+        states[:] = [state for state in states if state[0] != content_hash]
+        states.append((content_hash, mtime, size))
+        if len(self._pending) >= 256:
+            self._flush()
+
+    def _flush(self):
+        '''
+        Inserts the rows added by :meth:`put` into the database.
+        '''
+        if len(self._pending) == 0:
+            return
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO ExtractedRows "
+            "(component, pack, path, contentHash, mtime, size, version, "
+            "rows) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            self._pending)
+        self._pending.clear()
+
+    def close(self):
+        '''
+        Saves the changes and closes the cache.
+        '''
+        self._flush()
+        self.connection.commit()
+        self.connection.close()
+
+    def __enter__(self) -> ExtractionCache:
+        return self
+
+    def __exit__(self, *args: object):
+        self.close()
@@ -0,0 +1,160 @@
+'''
+This file contains the :func:`fetch_columns` function, which returns the
+results of the easy queries as the columns of values instead of the rows of
+the wrapper objects.
+'''
+from __future__ import annotations
+from array import array
+from contextlib import ExitStack
+from dataclasses import dataclass
+from sqlite3 import Connection
+from typing import Any, Iterable, Optional, Type, Union
+
+from . import (
+    Database, AbstractDBView, Left, WRAPPER_CLASSES, build_easy_query,
+    _query_connection)
+
+@dataclass
+class DictionaryColumn:
+    '''
+    A dictionary-encoded column of the results of :func:`fetch_columns`.
+    Every distinct value of the column is stored once in :attr:`values` and
+    the rows store the indices of their values in :attr:`codes`.
+    '''
+
+    codes: Any
+    '''
+    The indices of the values of the rows in :attr:`values`. It's an
+    :class:`array.array` of integers or a NumPy array.
+    '''
+
+    values: list[Any]
+    '''The distinct values in the order of their first appearance.'''
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.values[self.codes[index]]
+
+    def decode(self) -> list[Any]:
+        '''
+        Returns the list of the values of the rows.
+        '''
+        values = self.values
+        return [values[code] for code in self.codes]
+
+def _column_type(column: str) -> type:
+    '''
+    Returns the type of the values of a column in the '<table>.<column>'
+    format.
+    '''
+    table, _, name = column.partition(".")
+    if table not in WRAPPER_CLASSES or name == "":
+        raise ValueError(
+            f"The column '{column}' must be a column of a table in the "
+            "'<table>.<column>' format.")
+    if name == f"{table}_pk":
+        return int
+    wrapper = WRAPPER_CLASSES[table]
+    if name not in wrapper.query_result_columns:  # type: ignore
+        raise ValueError(f"Table '{table}' does not have column '{name}'.")
+    return wrapper.__annotations__[name]
+
+def fetch_columns(
+        db: Union[Connection, Database],
+        root: Type[AbstractDBView],
+        /,
+        *tables: Type[AbstractDBView] | Left[AbstractDBView],
+        columns: Iterable[str],
+        encode_text: bool = False,
+        numpy: bool = False,
+        chunk_size: int = 1024,
+        **kwargs: Any) -> dict[str, Any]:
+    '''
+    Runs the easy query and returns the values of the selected columns of
+    its results as columns. The rows are read in chunks and they're not
+    wrapped in the wrapper classes.
+
+    The integer columns (including the primary keys and the foreign keys)
+    are returned as :code:`array.array('q')`, unless they contain NULL
+    values (for example the columns of the tables joined with LEFT join).
+    The other columns are returned as lists or, with :code:`encode_text`,
+    as :class:`DictionaryColumn` objects.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> result = fetch_columns(
+        ...     db, Texture, TextureFile,
+        ...     columns=["Texture.Texture_pk", "TextureFile.path"])
+        >>> result["Texture.Texture_pk"]
+        array('q', [1, 2, 3])
+
+    :param db: The Database object or the sqlite3.Connection.
+    :param root: The root table of the query (see :func:`build_easy_query`).
+    :param tables: The other tables of the query.
+    :param columns: The columns to return in the '<table>.<column>' format.
+        The tables of the columns must be a part of the query.
+    :param encode_text: Whether to return the columns that aren't integers as
+        :class:`DictionaryColumn` objects.
+    :param numpy: Whether to convert the columns to NumPy arrays. The arrays
+        of the columns that aren't integers have the object dtype. Requires
+        NumPy.
+    :param chunk_size: The number of the rows fetched from the database at
+        once.
+    :param kwargs: The other arguments of :func:`build_easy_query`.
+
+    Returns a dictionary that maps the names of the columns to their values.
+    '''
+    columns = list(columns)
+    types = [_column_type(column) for column in columns]
+    sql_query = build_easy_query(root, *tables, columns=columns, **kwargs)
+    encoders: list[Optional[dict[Any, int]]] = [
+        {} if encode_text and type_ is not int else None for type_ in types]
+    # The encoded columns store the codes of the values
+    buffers: list[Union[array[int], list[Any]]] = [
+        array('q') if type_ is int or encoder is not None else []
+        for type_, encoder in zip(types, encoders)]
+    with ExitStack() as stack:
+        connection = stack.enter_context(_query_connection(db))
+        cursor = connection.cursor()
+        stack.callback(cursor.close)
+        cursor.row_factory = None
+        cursor.execute(sql_query)
+        # The columns are selected after the primary keys of the tables (and
+        # their other columns with hydrate=True)
+        offset = len(cursor.description) - len(columns)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if len(rows) == 0:
+                break
+            for i, values in enumerate(list(zip(*rows))[offset:]):
+                encoder = encoders[i]
+                if encoder is not None:
+                    buffers[i].extend([
+                        encoder.setdefault(value, len(encoder))
+                        for value in values])
+                    continue
+                buffer = buffers[i]
+                if isinstance(buffer, array) and None in values:
+                    # The arrays can't store NULL values
+                    buffer = buffers[i] = buffer.tolist()
+                buffer.extend(values)
+    result: dict[str, Any] = {}
+    for column, buffer, encoder in zip(columns, buffers, encoders):
+        if encoder is not None:
+            result[column] = DictionaryColumn(buffer, list(encoder))
+        else:
+            result[column] = buffer
+    if numpy:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        for column, value in result.items():
+            if isinstance(value, DictionaryColumn):
+                value.codes = np.frombuffer(value.codes, dtype=np.int64)
+            elif isinstance(value, array):
+                result[column] = np.frombuffer(value, dtype=np.int64)
+            else:
+                result[column] = np.array(value, dtype=object)
+    return result
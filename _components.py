@@ -0,0 +1,241 @@
+'''
+This file contains the registry of the pack components and the
+:class:`FileRows` objects returned by their extractors. The components are
+registered when the _db_* modules are imported, so this module only contains
+what the extractors need. The tools for inserting the extracted rows into
+the database are in the _loading module, which is imported when the packs
+are loaded.
+'''
+from __future__ import annotations
+from pathlib import Path
+from sqlite3 import Connection
+from typing import Any, Callable, Literal, NamedTuple, Optional
+
+class RowRef(NamedTuple):
+    '''
+    A reference to a row extracted from the same file. It's used as the value
+    of the foreign key columns because the primary keys of the rows are not
+    known until they're inserted into the database.
+    '''
+    index: int
+    '''The index of the referenced row in :attr:`FileRows.rows`.'''
+
+PACK_REF = RowRef(-1)
+'''
+The reference to the pack (the ResourcePack or the BehaviorPack row) that owns
+the file.
+'''
+
+class ExtractedRow(NamedTuple):
+    '''
+    A single row that should be inserted into the database.
+    '''
+    table: str
+    columns: tuple[str, ...]
+    values: tuple[Any, ...]
+
+def hash_content(content: bytes) -> str:
+    '''
+    Returns the hash of the content of a file stored in the "contentHash"
+    column of the "*File" tables.
+    '''
+    import hashlib  # pylint: disable=import-outside-toplevel
+    return hashlib.sha1(content).hexdigest()
+
+def hash_file(path: Path) -> str:
+    '''
+    Returns the hash of the content of the file (see :func:`hash_content`).
+    '''
+    return hash_content(path.read_bytes())
+
+class FileRows:
+    '''
+    The rows extracted from a single file of a pack. The first row is always
+    the row of the "*File" table that represents the file itself. The object
+    is picklable so that it can be sent between processes.
+    '''
+    def __init__(self, table: str, path: Path, **values: Any):
+        '''
+        :param table: The name of the "*File" table of the component.
+        :param path: The path to the file.
+        :param values: Additional values of the "*File" row.
+        '''
+        self.path = path
+        self.rows: list[ExtractedRow] = []
+        # The content read by read_text, kept until set_state hashes it
+        self._content: Optional[bytes] = None
+        # The state of the file is set by the loaders after the extraction
+        # (see set_state). It must be the last three columns of the row.
+        self.add(
+            table, path=path.as_posix(),
+            **{f"{_PACK_TABLES[table]}_fk": PACK_REF}, **values,
+            mtime=None, size=None, contentHash=None)
+
+    def read_text(self) -> str:
+        '''
+        Reads the file as UTF-8 text with universal newlines. The content is
+        kept until :meth:`set_state`, so the file doesn't have to be read
+        again for hashing it.
+        '''
+        content = self.path.read_bytes()
+        self._content = content
+        text = content.decode('utf8')
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    def set_state(
+            self, size: Optional[int], mtime_ns: Optional[int],
+            with_hash: bool = False):
+        '''
+        Sets the state of the file stored in the "*File" row. The state is
+        used by :func:`refresh_components` for detecting the changes of the
+        files and by the :class:`ExtractionCache`.
+
+        :param size: The size of the file or None if it's unknown.
+        :param mtime_ns: The modification time of the file or None if it's
+            unknown.
+        :param with_hash: Whether to store the hash of the content. Only the
+            files read by the extractor with :meth:`read_text` are hashed.
+            Hashing is skipped by default because only the cache needs the
+            hashes.
+        '''
+        content_hash = None
+        if with_hash and self._content is not None:
+            content_hash = hash_content(self._content)
+        self._content = None
+        table, columns, values = self.rows[0]
+        self.rows[0] = ExtractedRow(
+            table, columns, values[:-3] + (mtime_ns, size, content_hash))
+
+    @property
+    def file_ref(self) -> RowRef:
+        '''
+        The reference to the "*File" row.
+        '''
+        return RowRef(0)
+
+    def add(self, table: str, **values: Any) -> RowRef:
+        '''
+        Adds a row to the list and returns a reference to it, which can be
+        used as a value of the foreign keys of the rows added later.
+        '''
+        self.rows.append(
+            ExtractedRow(table, tuple(values.keys()), tuple(values.values())))
+        return RowRef(len(self.rows) - 1)
+
+class PackComponent(NamedTuple):
+    '''
+    Describes a component of a pack (for example the geometries of the
+    resource pack), where to find its files and how to extract the rows from
+    them. The components are registered with the :func:`pack_component`
+    decorator.
+    '''
+    name: str
+    '''The name used in the include/exclude arguments of the loaders.'''
+
+    pack_table: Literal["ResourcePack", "BehaviorPack"]
+    '''The name of the table of the pack that owns the component.'''
+
+    file_table: str
+    '''The name of the "*File" table of the component.'''
+
+    directory: str
+    '''The path to the directory with the files relative to the pack.'''
+
+    patterns: tuple[str, ...]
+    '''The glob patterns of the files in the directory.'''
+
+    recursive: bool
+    '''Whether the files are also searched in the subdirectories.'''
+
+    extract: Callable[[Path, Path], FileRows]
+    '''
+    The function that takes the path to the file and the path to the pack and
+    returns the rows extracted from the file.
+    '''
+
+PACK_COMPONENTS: dict[str, PackComponent] = {}
+'''
+Maps the names of the pack components to their :class:`PackComponent`
+objects. It's filled by the :func:`pack_component` decorator when the
+database components are imported.
+'''
+
+_PACK_TABLES: dict[str, str] = {}
+'''
+Maps the names of the "*File" tables to the names of the pack tables that own
+them.
+'''
+
+def pack_component(
+        name: str,
+        pack_table: Literal["ResourcePack", "BehaviorPack"],
+        file_table: str,
+        directory: str,
+        patterns: list[str],
+        recursive: bool = True):
+    '''
+    A decorator that registers the function for extracting the rows from the
+    files of a pack component in the :data:`PACK_COMPONENTS` map. The
+    decorated function is returned unchanged.
+
+    :param name: The name of the component.
+    :param pack_table: The name of the table of the pack.
+    :param file_table: The name of the "*File" table of the component.
+    :param directory: The path to the directory with the files of the
+        component, relative to the pack.
+    :param patterns: The glob patterns of the files.
+    :param recursive: Whether to search for the files in the subdirectories.
+    '''
+    def decorator(
+            extract: Callable[[Path, Path], FileRows]
+    ) -> Callable[[Path, Path], FileRows]:
+        if name in PACK_COMPONENTS:
+            raise ValueError(
+                f"The pack component {name} is already registered.")
+        PACK_COMPONENTS[name] = PackComponent(
+            name, pack_table, file_table, directory, tuple(patterns),
+            recursive, extract)
+        _PACK_TABLES[file_table] = pack_table
+        return extract
+    return decorator
+
+def extract_file(
+        extract: Callable[[Path, Path], FileRows], path: Path,
+        pack_path: Path) -> FileRows:
+    '''
+    Extracts the rows from a single file that isn't in the manifest of the
+    pack and sets the state of the file (see :meth:`FileRows.set_state`).
+
+    :param extract: The extractor of the pack component.
+    :param path: The path to the file.
+    :param pack_path: The path to the pack.
+    '''
+    file_rows = extract(path, pack_path)
+    # The files that can't be read have no state, so they're always treated
+    # as modified by refresh_components
+    try:
+        stat = path.stat()
+        file_rows.set_state(stat.st_size, stat.st_mtime_ns)
+    except OSError:
+        file_rows.set_state(None, None)
+    return file_rows
+
+def load_file(db: Connection, name: str, path: Path, pack_pk: int) -> int:
+    '''
+    Loads a single file of a pack component into the database. Returns the
+    primary key of the "*File" row.
+    '''
+    from ._loading import get_pack_path, insert_file_rows  # pylint: disable=import-outside-toplevel
+    component = PACK_COMPONENTS[name]
+    pack_path = get_pack_path(db, component.pack_table, pack_pk)
+    return insert_file_rows(
+        db, extract_file(component.extract, path, pack_path), pack_pk)
+
+def load_component(db: Connection, name: str, pack_pk: int):
+    '''
+    Loads all files of a pack component into the database.
+    '''
+    from ._loading import load_components  # pylint: disable=import-outside-toplevel
+    load_components(db, [name], pack_pk)
@@ -2,13 +2,18 @@
 from sqlite3 import Connection
 from pathlib import Path
 import json
-from .better_json_tools import load_jsonc
+from .better_json_tools import JSONWalker
+from ._jsonc import loads_jsonc
 from ._views import dbtableview, WeakTableConnection
+from ._components import FileRows, pack_component, load_component, load_file
 
 
 @dbtableview(
     properties={
-        "path": (Path, "NOT NULL")
+        "path": (Path, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["ResourcePack"]
 )
@@ -134,155 +139,104 @@ def load_attachables(db: Connection, rp_id: int):
     '''
     Loads all attachables from the resource pack.
     '''
-    rp_path: Path = db.execute(
-        "SELECT path FROM ResourcePack WHERE ResourcePack_pk = ?",
-        (rp_id,)
-    ).fetchone()[0]
-
-    for attachable_path in (rp_path / "attachables").rglob("*.json"):
-        load_attachable(db, attachable_path, rp_id)
+    load_component(db, "attachables", rp_id)
 
 def load_attachable(db: Connection, attachable_path: Path, rp_id: int):
     '''
     Loads a single attachable from the resource pack.
     '''
-    cursor = db.cursor()
+    load_file(db, "attachables", attachable_path, rp_id)
+
+@pack_component(
+    "attachables", "ResourcePack", "AttachableFile", "attachables",
+    ["*.json"])
+def _extract_attachable(attachable_path: Path, rp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of a single attachable file from the resource pack.
+    '''
+    # pylint: disable=unused-argument
     # ATTACHABLE FILE
-    cursor.execute(
-        "INSERT INTO AttachableFile (path, ResourcePack_fk) VALUES (?, ?)",
-        (attachable_path.as_posix(), rp_id)
-    )
-    file_pk = cursor.lastrowid
+    rows = FileRows("AttachableFile", attachable_path)
     try:
-        walker = load_jsonc(attachable_path)
+        walker = JSONWalker(loads_jsonc(rows.read_text()))
     except json.JSONDecodeError:
         # sinlently skip invalid files. The file is in db but has no data
-        return
+        return rows
     # ATTACHABLE
     description = walker / "minecraft:attachable" / "description"
     identifier_walker = description / 'identifier'
     identifier_data = identifier_walker.data
     if not isinstance(identifier_data, str):
-        return
-    cursor.execute(
-        '''
-        INSERT INTO Attachable (
-            identifier, AttachableFile_fk
-        ) VALUES (?, ?)
-        ''',
-        (identifier_data, file_pk)
-    )
-    attachable_pk = cursor.lastrowid
+        return rows
+    attachable_ref = rows.add(
+        "Attachable",
+        identifier=identifier_data, AttachableFile_fk=rows.file_ref)
 
     # ATTACHABLE ITEM FIELD
     items = description / "item" // str
     if len(items) == 0:
-        cursor.execute(
-            '''
-            INSERT INTO AttachableItemField (
-                identifier, Attachable_fk, jsonPath
-            ) VALUES (?, ?, ?)
-            ''',
-            (identifier_data, attachable_pk, identifier_walker.path_str)
-        )
+        rows.add(
+            "AttachableItemField",
+            identifier=identifier_data, Attachable_fk=attachable_ref,
+            jsonPath=identifier_walker.path_str)
     else:
         for item in items:
             if not isinstance(item.data, str):
                 continue
-            cursor.execute(
-                '''
-                INSERT INTO AttachableItemField (
-                    identifier, Attachable_fk, condition,
-                    jsonPath
-                ) VALUES (?, ?, ?, ?)
-                ''',
-                (
-                    item.parent_key, attachable_pk,
-                    item.data, item.path_str
-                )
-            )
+            rows.add(
+                "AttachableItemField",
+                identifier=item.parent_key, Attachable_fk=attachable_ref,
+                condition=item.data, jsonPath=item.path_str)
 
     # ATTACHABLE MATERIAL FIELD
     materials = description / "materials" // str
     for material in materials:
         if not isinstance(material.data, str):
             continue
-        cursor.execute(
-            '''
-            INSERT INTO AttachableMaterialField (
-                shortName, identifier, Attachable_fk, jsonPath
-            ) VALUES (?, ?, ?, ?)
-            ''',
-            (
-                material.parent_key, material.data, attachable_pk,
-                material.path_str
-            )
-        )
+        rows.add(
+            "AttachableMaterialField",
+            shortName=material.parent_key, identifier=material.data,
+            Attachable_fk=attachable_ref, jsonPath=material.path_str)
 
     # ATTACHABLE TEXTURE FIELD
     textures = description / "textures" // str
     for texture in textures:
         if not isinstance(texture.data, str):
             continue
-        cursor.execute(
-            '''
-            INSERT INTO AttachableTextureField (
-                shortName, identifier, Attachable_fk, jsonPath
-            ) VALUES (?, ?, ?, ?)
-            ''',
-            (
-                texture.parent_key, texture.data, attachable_pk,
-                texture.path_str
-            )
-        )
+        rows.add(
+            "AttachableTextureField",
+            shortName=texture.parent_key, identifier=texture.data,
+            Attachable_fk=attachable_ref, jsonPath=texture.path_str)
 
     # ATTACHABLE GEOMETRY FIELD
     geometries = description / "geometry" // str
     for geometry in geometries:
         if not isinstance(geometry.data, str):
             continue
-        cursor.execute(
-            '''
-            INSERT INTO AttachableGeometryField (
-                shortName, identifier, Attachable_fk, jsonPath
-            ) VALUES (?, ?, ?, ?)
-            ''',
-            (
-                geometry.parent_key, geometry.data, attachable_pk,
-                geometry.path_str
-            )
-        )
+        rows.add(
+            "AttachableGeometryField",
+            shortName=geometry.parent_key, identifier=geometry.data,
+            Attachable_fk=attachable_ref, jsonPath=geometry.path_str)
 
     # ATTACHABLE RENDER CONTROLLER FIELD
     render_controllers = description / "render_controllers" // int
     for render_controller in render_controllers:
         if isinstance(render_controller.data, str):
-            cursor.execute(
-                '''
-                INSERT INTO AttachableRenderControllerField (
-                    identifier, Attachable_fk, jsonPath
-                ) VALUES (?, ?, ?)
-                ''',
-                (
-                    render_controller.data, attachable_pk,
-                    render_controller.path_str
-                )
-            )
+            rows.add(
+                "AttachableRenderControllerField",
+                identifier=render_controller.data,
+                Attachable_fk=attachable_ref,
+                jsonPath=render_controller.path_str)
         else:
             # Render contoroller can be an object with pair of values, name
             # and condition.
             for render_controller in render_controller // str:
-                cursor.execute(
-                    '''
-                    INSERT INTO AttachableRenderControllerField (
-                        identifier, condition, Attachable_fk, jsonPath
-                    ) VALUES (?, ?, ?, ?)
-                    ''',
-                    (
-                        render_controller.parent_key, render_controller.data,
-                        attachable_pk, render_controller.path_str
-                    )
-                )
+                rows.add(
+                    "AttachableRenderControllerField",
+                    identifier=render_controller.parent_key,
+                    condition=render_controller.data,
+                    Attachable_fk=attachable_ref,
+                    jsonPath=render_controller.path_str)
     # ANIMATIONS & ANIMATION CONTROLLERS
     for animation in description / "animations" // str:
         if isinstance(animation.data, str):
@@ -291,20 +245,14 @@ def load_attachable(db: Connection, attachable_path: Path, rp_id: int):
             continue
         if animation.data.startswith("controller.animation."):
             # Animations
-            cursor.execute(
-                '''
-                INSERT INTO AttachableAnimationControllerField (
-                    Attachable_fk, shortName, identifier, jsonPath
-                ) VALUES (?, ?, ?, ?)
-                ''',
-                (attachable_pk, animation.parent_key, identifier, animation.path_str))
+            rows.add(
+                "AttachableAnimationControllerField",
+                Attachable_fk=attachable_ref, shortName=animation.parent_key,
+                identifier=identifier, jsonPath=animation.path_str)
         elif animation.data.startswith("animation."):
             # Animation Controllers
-
-            cursor.execute(
-                '''
-                INSERT INTO AttachableAnimationField (
-                    Attachable_fk, shortName, identifier, jsonPath
-                ) VALUES (?, ?, ?, ?)
-                ''',
-                (attachable_pk, animation.parent_key, identifier, animation.path_str))
+            rows.add(
+                "AttachableAnimationField",
+                Attachable_fk=attachable_ref, shortName=animation.parent_key,
+                identifier=identifier, jsonPath=animation.path_str)
+    return rows
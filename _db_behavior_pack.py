@@ -1,6 +1,6 @@
 # pylint: disable=no-member, multiple-statements, missing-module-docstring, missing-class-docstring
 from sqlite3 import Connection
-from pathlib import Path
+from pathlib import Path, PurePath
 from typing import Union
 from ._views import dbtableview
 
@@ -14,11 +14,11 @@ class BehaviorPack: ...
 
 BEHAVIOR_PACK_BUILD_SCRIPT: str = BehaviorPack.build_script
 
-def load_behavior_pack(db: Connection, rp_path: Union[Path, str]) -> int:
+def load_behavior_pack(db: Connection, rp_path: Union[PurePath, str]) -> int:
     '''
     Loads a behavior pack into the database.
     '''
-    if isinstance(rp_path, Path):
+    if isinstance(rp_path, PurePath):
         rp_path = rp_path.as_posix()
     count = db.execute(
         "SELECT total(1) FROM BehaviorPack WHERE path = ?",
@@ -3,13 +3,18 @@ from typing import cast
 from sqlite3 import Connection
 from pathlib import Path
 import json
-from .better_json_tools import load_jsonc
+from .better_json_tools import JSONWalker
+from ._jsonc import JSONCPattern, SKIP_VALUE, project_jsonc
 from ._views import dbtableview
+from ._components import FileRows, pack_component, load_component, load_file
 
 
 @dbtableview(
     properties={
-        "path": (Path, "NOT NULL")
+        "path": (Path, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["BehaviorPack"]
 )
@@ -33,41 +38,42 @@ def load_bp_animations(db: Connection, bp_id: int):
     '''
     Loads all animations from the behavior pack.
     '''
-    bp_path: Path = db.execute(
-        "SELECT path FROM BehaviorPack WHERE BehaviorPack_pk = ?",
-        (bp_id,)
-    ).fetchone()[0]
-
-    for animation_path in (bp_path / "animations").rglob("*.json"):
-        load_bp_animation(db, animation_path, bp_id)
+    load_component(db, "bp_animations", bp_id)
 
 def load_bp_animation(db: Connection, animation_path: Path, bp_id: int):
     '''
     Loads an animation from the behavior pack.
     '''
-    cursor = db.cursor()
+    load_file(db, "bp_animations", animation_path, bp_id)
+
+# The parts of the animation files used by the extractor
+_BP_ANIMATION_PATTERNS: list[JSONCPattern] = [
+    ("animations", str, SKIP_VALUE),
+]
+
+@pack_component(
+    "bp_animations", "BehaviorPack", "BpAnimationFile", "animations",
+    ["*.json"])
+def _extract_bp_animation(animation_path: Path, bp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of an animation file from the behavior pack.
+    '''
+    # pylint: disable=unused-argument
     # BP ANIMATION FILE
-    cursor.execute(
-        "INSERT INTO BpAnimationFile (path, BehaviorPack_fk) VALUES (?, ?)",
-        (animation_path.as_posix(), bp_id)
-    )
-    file_pk = cursor.lastrowid
+    rows = FileRows("BpAnimationFile", animation_path)
     try:
-        animations_walker = load_jsonc(animation_path)
+        animations_walker = JSONWalker(project_jsonc(
+            rows.read_text(), _BP_ANIMATION_PATTERNS))
     except json.JSONDecodeError:
         # sinlently skip invalid files. The file is in db but has no data
-        return
+        return rows
 
     for animation_walker in animations_walker / "animations" // str:
         identifier_data: str = cast(str, animation_walker.parent_key)
         if not identifier_data.startswith("animation."):
             continue
-        cursor.execute(
-            '''
-            INSERT INTO BpAnimation (
-                BpAnimationFile_fk, identifier, jsonPath
-            ) VALUES (?, ?, ?)
-            ''',
-            (file_pk, identifier_data, animation_walker.path_str)
-        )
-        # bp_anim_pk = cursor.lastrowid
+        rows.add(
+            "BpAnimation",
+            BpAnimationFile_fk=rows.file_ref, identifier=identifier_data,
+            jsonPath=animation_walker.path_str)
+    return rows
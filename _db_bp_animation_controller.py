@@ -3,12 +3,17 @@ from typing import cast
 from sqlite3 import Connection
 from pathlib import Path
 import json
-from .better_json_tools import load_jsonc
+from .better_json_tools import JSONWalker
+from ._jsonc import loads_jsonc
 from ._views import dbtableview
+from ._components import FileRows, pack_component, load_component, load_file
 
 @dbtableview(
     properties={
-        "path": (Path, "NOT NULL")
+        "path": (Path, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["BehaviorPack"]
 )
@@ -33,42 +38,38 @@ def load_bp_animation_controllers(db: Connection, bp_id: int):
     '''
     Loads all animation controllers from the behavior pack.
     '''
-    bp_path: Path = db.execute(
-        "SELECT path FROM BehaviorPack WHERE BehaviorPack_pk = ?",
-        (bp_id,)
-    ).fetchone()[0]
-
-    for ac_path in (bp_path / "animation_controllers").rglob("*.json"):
-        load_bp_animation_controller(db, ac_path, bp_id)
+    load_component(db, "bp_animation_controllers", bp_id)
 
 
 def load_bp_animation_controller(db: Connection, animation_controller_path: Path, bp_id: int):
     '''
     Loads an animation controller from the behavior pack.
     '''
-    cursor = db.cursor()
+    load_file(db, "bp_animation_controllers", animation_controller_path, bp_id)
+
+@pack_component(
+    "bp_animation_controllers", "BehaviorPack", "BpAnimationControllerFile",
+    "animation_controllers", ["*.json"])
+def _extract_bp_animation_controller(
+        animation_controller_path: Path, bp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of an animation controller file from the behavior pack.
+    '''
+    # pylint: disable=unused-argument
     # BP ANIMATION FILE
-    cursor.execute(
-        "INSERT INTO BpAnimationControllerFile (path, BehaviorPack_fk) VALUES (?, ?)",
-        (animation_controller_path.as_posix(), bp_id)
-    )
-    file_pk = cursor.lastrowid
+    rows = FileRows("BpAnimationControllerFile", animation_controller_path)
     try:
-        acs_walker = load_jsonc(animation_controller_path)
+        acs_walker = JSONWalker(loads_jsonc(rows.read_text()))
     except json.JSONDecodeError:
         # sinlently skip invalid files. The file is in db but has no data
-        return
+        return rows
 
     for ac_walker in acs_walker / "animation_controllers" // str:
         identifier_data: str = cast(str, ac_walker.parent_key)
         if not identifier_data.startswith("controller.animation."):
             continue
-        cursor.execute(
-            '''
-            INSERT INTO BpAnimationController (
-                BpAnimationControllerFile_fk, identifier, jsonPath
-            ) VALUES (?, ?, ?)
-            ''',
-            (file_pk, identifier_data, ac_walker.path_str)
-        )
-        # bp_anim_pk = cursor.lastrowid
+        rows.add(
+            "BpAnimationController",
+            BpAnimationControllerFile_fk=rows.file_ref, identifier=identifier_data,
+            jsonPath=ac_walker.path_str)
+    return rows
@@ -3,12 +3,17 @@ from typing import cast
 from sqlite3 import Connection
 from pathlib import Path
 import json
-from .better_json_tools import load_jsonc
+from .better_json_tools import JSONWalker
+from ._jsonc import loads_jsonc
 from ._views import dbtableview, WeakTableConnection
+from ._components import FileRows, pack_component, load_component, load_file
 
 @dbtableview(
     properties={
-        "path": (Path, "NOT NULL")
+        "path": (Path, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["BehaviorPack"]
 )
@@ -82,43 +87,36 @@ def load_bp_blocks(db: Connection, bp_id: int):
     '''
     Loads all blocks from the behavior pack.
     '''
-    bp_path: Path = db.execute(
-        "SELECT path FROM BehaviorPack WHERE BehaviorPack_pk = ?",
-        (bp_id,)
-    ).fetchone()[0]
-    for bp_block_path in (bp_path / "blocks").rglob("*.json"):
-        load_bp_block(db, bp_block_path, bp_id)
+    load_component(db, "bp_blocks", bp_id)
 
 def load_bp_block(db: Connection, bp_block_path: Path, bp_id: int):
     '''
     Loads a block from the behavior pack.
     '''
-    cursor = db.cursor()
+    load_file(db, "bp_blocks", bp_block_path, bp_id)
+
+@pack_component(
+    "bp_blocks", "BehaviorPack", "BpBlockFile", "blocks", ["*.json"])
+def _extract_bp_block(bp_block_path: Path, bp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of a block file from the behavior pack.
+    '''
+    # pylint: disable=unused-argument
     # BP BLOCK FILE
-    cursor.execute(
-        "INSERT INTO BpBlockFile (path, BehaviorPack_fk) VALUES (?, ?)",
-        (bp_block_path.as_posix(), bp_id)
-    )
-    file_pk = cursor.lastrowid
+    rows = FileRows("BpBlockFile", bp_block_path)
     # BP BLOCK
     try:
-        bp_block_json = load_jsonc(bp_block_path)
+        bp_block_json = JSONWalker(loads_jsonc(rows.read_text()))
     except json.JSONDecodeError:
-        return  # Skip silently
+        return rows  # Skip silently
 
     block_walker = (
         bp_block_json / "minecraft:block")
     block_identifier = (block_walker / "description" / "identifier").data
     if not isinstance(block_identifier, str):
-        return  # Skip blocks without identifier
-    cursor.execute(
-        '''
-        INSERT INTO BpBlock (
-        identifier, BpBlockFile_fk
-        ) VALUES (?, ?)
-        ''',
-        (block_identifier, file_pk))
-    bp_block_pk = cursor.lastrowid
+        return rows  # Skip blocks without identifier
+    bp_block_ref = rows.add(
+        "BpBlock", identifier=block_identifier, BpBlockFile_fk=rows.file_ref)
 
     # BP BLOCK LOOT FIELD
     all_components_walker = (
@@ -129,38 +127,28 @@ def load_bp_block(db: Connection, bp_block_path: Path, bp_id: int):
         loot = loot_walker.data
         if not isinstance(loot, str):
             continue
-        cursor.execute(
-            '''
-            INSERT INTO BpBlockLootField (
-            identifier, jsonPath, BpBlock_fk
-            ) VALUES (?, ?, ?)
-            ''',
-            (loot, loot_walker.path_str, bp_block_pk))
+        rows.add(
+            "BpBlockLootField",
+            identifier=loot, jsonPath=loot_walker.path_str,
+            BpBlock_fk=bp_block_ref)
     # BP BLOCK GEOMETRY FIELD
     for geometry_walker in all_components_walker / "minecraft:geometry":
         geometry = geometry_walker.data
         if not isinstance(geometry, str):
             continue
-        cursor.execute(
-            '''
-            INSERT INTO BpBlockGeometryField (
-            identifier, jsonPath, BpBlock_fk
-            ) VALUES (?, ?, ?)
-            ''',
-            (geometry, geometry_walker.path_str, bp_block_pk))
+        rows.add(
+            "BpBlockGeometryField",
+            identifier=geometry, jsonPath=geometry_walker.path_str,
+            BpBlock_fk=bp_block_ref)
     # BP BLOCK MATERIAL INSTANCES FIELD
     for material_instances_walker in all_components_walker / "minecraft:material_instances":
         material_instance = material_instances_walker.data
         if not isinstance(material_instance, dict):
             continue
-        cursor.execute(
-            '''
-            INSERT INTO BpBlockMaterialInstancesField (
-            jsonPath, BpBlock_fk
-            ) VALUES (?, ?)
-            ''',
-            (material_instances_walker.path_str, bp_block_pk))
-        material_instances_pk = cursor.lastrowid
+        material_instances_ref = rows.add(
+            "BpBlockMaterialInstancesField",
+            jsonPath=material_instances_walker.path_str,
+            BpBlock_fk=bp_block_ref)
         # BP BLOCK MATERIAL INSTANCES FIELD INSTANCE
         for instance_walker in material_instances_walker // str:
             instance_identifier = instance_walker.parent_key
@@ -171,16 +159,11 @@ def load_bp_block(db: Connection, bp_block_path: Path, bp_id: int):
             instance_render_method = (instance_walker / "render_method").data
             if not isinstance(instance_render_method, str):
                 continue
-            cursor.execute(
-                '''
-                INSERT INTO BpBlockMaterialInstancesFieldInstance (
-                identifier, jsonPath, texture, renderMethod, BpBlockMaterialInstancesField_fk
-                ) VALUES (?, ?, ?, ?, ?)
-                ''',
-                (
-                    instance_identifier,
-                    instance_walker.path_str,
-                    instance_texture,
-                    instance_render_method,
-                    material_instances_pk
-                ))
+            rows.add(
+                "BpBlockMaterialInstancesFieldInstance",
+                identifier=instance_identifier,
+                jsonPath=instance_walker.path_str,
+                texture=instance_texture,
+                renderMethod=instance_render_method,
+                BpBlockMaterialInstancesField_fk=material_instances_ref)
+    return rows
@@ -3,13 +3,18 @@ from typing import Optional
 from sqlite3 import Connection
 from pathlib import Path
 import json
-from .better_json_tools import load_jsonc
+from .better_json_tools import JSONWalker
+from ._jsonc import loads_jsonc
 from .utils import parse_format_version
 from ._views import dbtableview
+from ._components import FileRows, pack_component, load_component, load_file
 
 @dbtableview(
     properties={
-        "path": (Path, "NOT NULL")
+        "path": (Path, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["BehaviorPack"]
 )
@@ -44,35 +49,33 @@ def load_bp_items(db: Connection, bp_id: int):
     '''
     Loads all items from the behavior pack.
     '''
-    bp_path: Path = db.execute(
-        "SELECT path FROM BehaviorPack WHERE BehaviorPack_pk = ?",
-        (bp_id,)
-    ).fetchone()[0]
-
-    for item_path in (bp_path / "items").rglob("*.json"):
-        load_bp_item(db, item_path, bp_id)
+    load_component(db, "bp_items", bp_id)
 
 def load_bp_item(db: Connection, item_path: Path, bp_id: int):
     '''
     Loads an item from the behavior pack.
     '''
-    cursor = db.cursor()
+    load_file(db, "bp_items", item_path, bp_id)
+
+@pack_component(
+    "bp_items", "BehaviorPack", "BpItemFile", "items", ["*.json"])
+def _extract_bp_item(item_path: Path, bp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of an item file from the behavior pack.
+    '''
+    # pylint: disable=unused-argument
     # BP ITEM FILE
-    cursor.execute(
-        "INSERT INTO BpItemFile (path, BehaviorPack_fk) VALUES (?, ?)",
-        (item_path.as_posix(), bp_id)
-    )
-    file_pk = cursor.lastrowid
+    rows = FileRows("BpItemFile", item_path)
     try:
-        item_walker = load_jsonc(item_path)
+        item_walker = JSONWalker(loads_jsonc(rows.read_text()))
     except json.JSONDecodeError:
         # sinlently skip invalid files. The file is in db but has no data
-        return
+        return rows
 
     # BP ITEM
     identifier = item_walker / "minecraft:item" / "description" / "identifier"
     if not isinstance(identifier.data, str):
-        return  # Silently skip items without an identifier
+        return rows  # Silently skip items without an identifier
 
     format_version_walker = item_walker / "format_version"
     parser_version: Optional[str] = None
@@ -99,12 +102,8 @@ def load_bp_item(db: Connection, item_path: Path, bp_id: int):
             parser_version = "1.10"
         else:
             parser_version = "1.16.100"
-    cursor.execute(
-        '''
-        INSERT INTO BpItem (
-            BpItemFile_fk, identifier, parserVersion, texture
-        ) VALUES (?, ?, ?, ?)
-        ''',
-        (file_pk, identifier.data, parser_version, texture)
-    )
-    # bp_anim_pk = cursor.lastrowid
+    rows.add(
+        "BpItem",
+        BpItemFile_fk=rows.file_ref, identifier=identifier.data,
+        parserVersion=parser_version, texture=texture)
+    return rows
@@ -2,12 +2,17 @@
 from sqlite3 import Connection
 from pathlib import Path
 import json
-from .better_json_tools import load_jsonc
+from .better_json_tools import JSONWalker
+from ._jsonc import loads_jsonc
 from ._views import dbtableview, WeakTableConnection
+from ._components import FileRows, pack_component, load_component, load_file
 
 @dbtableview(
     properties={
-        "path": (Path, "NOT NULL")
+        "path": (Path, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["ResourcePack"]
 )
@@ -117,110 +122,88 @@ def load_client_entities(db: Connection, rp_id: int):
     '''
     Loads all client entities from the resource pack.
     '''
-    rp_path: Path = db.execute(
-        "SELECT path FROM ResourcePack WHERE ResourcePack_pk = ?",
-        (rp_id,)
-    ).fetchone()[0]
-
-    for entity_path in (rp_path / "entity").rglob("*.json"):
-        load_client_entity(db, entity_path, rp_id)
+    load_component(db, "client_entities", rp_id)
 
 def load_client_entity(db: Connection, entity_path: Path, rp_id: int):
     '''
     Loads a client entity from the resource pack.
     '''
-    cursor = db.cursor()
-    # ENTITY FILE
-    cursor.execute(
-        "INSERT INTO ClientEntityFile (path, ResourcePack_fk) VALUES (?, ?)",
-        (entity_path.as_posix(), rp_id))
+    load_file(db, "client_entities", entity_path, rp_id)
 
-    file_pk = cursor.lastrowid
+@pack_component(
+    "client_entities", "ResourcePack", "ClientEntityFile", "entity",
+    ["*.json"])
+def _extract_client_entity(entity_path: Path, rp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of a client entity file from the resource pack.
+    '''
+    # pylint: disable=unused-argument
+    # ENTITY FILE
+    rows = FileRows("ClientEntityFile", entity_path)
     try:
-        entity_jsonc = load_jsonc(entity_path)
+        entity_jsonc = JSONWalker(loads_jsonc(rows.read_text()))
     except json.JSONDecodeError:
         # sinlently skip invalid files. The file is in db but has no data
-        return
+        return rows
     description = entity_jsonc / "minecraft:client_entity" / "description"
 
     # ENTITY - IDENTIFIER
     identifier = (description / "identifier").data
     if not isinstance(identifier, str):
-        return  # Skip entitites without identifier
-    cursor.execute(
-        '''
-        INSERT INTO ClientEntity (
-        identifier, ClientEntityFile_fk
-        ) VALUES (?, ?)
-        ''',
-        (identifier, file_pk))
-    entity_pk = cursor.lastrowid
+        return rows  # Skip entitites without identifier
+    entity_ref = rows.add(
+        "ClientEntity",
+        identifier=identifier, ClientEntityFile_fk=rows.file_ref)
     # RENDER CONTROLLERS - unconditional
     for rc in (description / "render_controllers" // int):
         if isinstance(rc.data, str):
             identifier = rc.data
         else:
             continue  # Probably conditional render controller
-        cursor.execute(
-            '''
-            INSERT INTO ClientEntityRenderControllerField (
-                ClientEntity_fk, identifier, jsonPath
-            ) VALUES (?, ?, ?)
-            ''',
-            (entity_pk, identifier, rc.path_str))
+        rows.add(
+            "ClientEntityRenderControllerField",
+            ClientEntity_fk=entity_ref, identifier=identifier,
+            jsonPath=rc.path_str)
     # RENDER CONTROLLERS - conditional
     for rc in (description / "render_controllers" // int // str):
         if isinstance(rc.data, str):
             condition = rc.data
         else:
             condition = None
-        cursor.execute(
-            '''
-            INSERT INTO ClientEntityRenderControllerField (
-                ClientEntity_fk, identifier, condition, jsonPath
-            ) VALUES (?, ?, ?, ?)
-            ''',
-            (entity_pk, rc.parent_key, condition, rc.path_str)
-        )
+        rows.add(
+            "ClientEntityRenderControllerField",
+            ClientEntity_fk=entity_ref, identifier=rc.parent_key,
+            condition=condition, jsonPath=rc.path_str)
     # MATERIALS
     for material in description / "materials" // str:
         if isinstance(material.data, str):
             identifier = material.data
         else:
             continue  #  identifier must be NOT null
-        cursor.execute(
-            '''
-            INSERT INTO ClientEntityMaterialField (
-                ClientEntity_fk, shortName, identifier, jsonPath
-            ) VALUES (?, ?, ?, ?)
-            ''',
-            (entity_pk, material.parent_key, identifier, material.path_str))
+        rows.add(
+            "ClientEntityMaterialField",
+            ClientEntity_fk=entity_ref, shortName=material.parent_key,
+            identifier=identifier, jsonPath=material.path_str)
     # TEXTURES
     for texture in description / "textures" // str:
         if isinstance(texture.data, str):
             identifier = texture.data
         else:
             continue  # identifier must be NOT null
-        cursor.execute(
-            '''
-            INSERT INTO ClientEntityTextureField (
-                ClientEntity_fk, shortName, identifier, jsonPath
-            ) VALUES (?, ?, ?, ?)
-            ''',
-            (entity_pk, texture.parent_key, identifier, texture.path_str))
+        rows.add(
+            "ClientEntityTextureField",
+            ClientEntity_fk=entity_ref, shortName=texture.parent_key,
+            identifier=identifier, jsonPath=texture.path_str)
     # GEOMETRIES
     for geometry in description / "geometry" // str:
         if isinstance(geometry.data, str):
             identifier = geometry.data
         else:
             continue  # identifier must be NOT null
-        cursor.execute(
-            '''
-            INSERT INTO ClientEntityGeometryField (
-                ClientEntity_fk, shortName, identifier, jsonPath
-            ) VALUES (?, ?, ?, ?)
-            ''',
-            (entity_pk, geometry.parent_key, identifier, geometry.path_str))
+        rows.add(
+            "ClientEntityGeometryField",
+            ClientEntity_fk=entity_ref, shortName=geometry.parent_key,
+            identifier=identifier, jsonPath=geometry.path_str)
     # ANIMATIONS & ANIMATION CONTROLLERS
     for animation in description / "animations" // str:
         if isinstance(animation.data, str):
@@ -229,19 +212,14 @@ def load_client_entity(db: Connection, entity_path: Path, rp_id: int):
             continue
         if animation.data.startswith("controller.animation."):
             # Animation Controllers
-            cursor.execute(
-                '''
-                INSERT INTO ClientEntityAnimationControllerField (
-                    ClientEntity_fk, shortName, identifier, jsonPath
-                ) VALUES (?, ?, ?, ?)
-                ''',
-                (entity_pk, animation.parent_key, identifier, animation.path_str))
+            rows.add(
+                "ClientEntityAnimationControllerField",
+                ClientEntity_fk=entity_ref, shortName=animation.parent_key,
+                identifier=identifier, jsonPath=animation.path_str)
         elif animation.data.startswith("animation."):
             # Animations
-            cursor.execute(
-                '''
-                INSERT INTO ClientEntityAnimationField (
-                    ClientEntity_fk, shortName, identifier, jsonPath
-                ) VALUES (?, ?, ?, ?)
-                ''',
-                (entity_pk, animation.parent_key, identifier, animation.path_str))
+            rows.add(
+                "ClientEntityAnimationField",
+                ClientEntity_fk=entity_ref, shortName=animation.parent_key,
+                identifier=identifier, jsonPath=animation.path_str)
+    return rows
@@ -2,12 +2,17 @@
 from sqlite3 import Connection
 from pathlib import Path
 import json
-from .better_json_tools import load_jsonc
+from .better_json_tools import JSONWalker
+from ._jsonc import loads_jsonc
 from ._views import dbtableview, WeakTableConnection
+from ._components import FileRows, pack_component, load_component, load_file
 
 @dbtableview(
     properties={
-        "path": (Path, "NOT NULL")
+        "path": (Path, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["BehaviorPack"]
 )
@@ -76,30 +81,28 @@ def load_entities(db: Connection, bp_id: int):
     '''
     Loads all entities from the behavior pack.
     '''
-    bp_path: Path = db.execute(
-        "SELECT path FROM BehaviorPack WHERE BehaviorPack_pk = ?",
-        (bp_id,)
-    ).fetchone()[0]
-
-    for entity_path in (bp_path / "entities").rglob("*.json"):
-        load_entity(db, entity_path, bp_id)
+    load_component(db, "entities", bp_id)
 
 def load_entity(db: Connection, entity_path: Path, bp_id: int):
     '''
     Loads an entity from the behavior pack.
     '''
-    cursor = db.cursor()
-    # ENTITY FILE
-    cursor.execute(
-        "INSERT INTO EntityFile (path, BehaviorPack_fk) VALUES (?, ?)",
-        (entity_path.as_posix(), bp_id))
+    load_file(db, "entities", entity_path, bp_id)
 
-    file_pk = cursor.lastrowid
+@pack_component(
+    "entities", "BehaviorPack", "EntityFile", "entities", ["*.json"])
+def _extract_entity(entity_path: Path, bp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of an entity file from the behavior pack.
+    '''
+    # pylint: disable=unused-argument
+    # ENTITY FILE
+    rows = FileRows("EntityFile", entity_path)
     try:
-        entity_jsonc = load_jsonc(entity_path)
+        entity_jsonc = JSONWalker(loads_jsonc(rows.read_text()))
     except json.JSONDecodeError:
         # sinlently skip invalid files. The file is in db but has no data
-        return
+        return rows
     entity_walker = entity_jsonc / "minecraft:entity"
     description = entity_walker / "description"
 
@@ -107,15 +110,9 @@ def load_entity(db: Connection, entity_path: Path, bp_id: int):
     entity_identifier = (description / "identifier").data
     if not isinstance(entity_identifier, str):
         # Skip entitites without identifiers
-        return
-    cursor.execute(
-        '''
-        INSERT INTO Entity (
-        identifier, EntityFile_fk
-        ) VALUES (?, ?)
-        ''',
-        (entity_identifier, file_pk))
-    entity_pk = cursor.lastrowid
+        return rows
+    entity_ref = rows.add(
+        "Entity", identifier=entity_identifier, EntityFile_fk=rows.file_ref)
 
 
     all_componet_groups = (
@@ -131,21 +128,14 @@ def load_entity(db: Connection, entity_path: Path, bp_id: int):
         loot_table = loot_table_walker.data
         if not isinstance(loot_table, str):
             continue
-        cursor.execute(
-            '''
-            INSERT INTO EntityLootField (
-            identifier, jsonPath, Entity_fk, componentType
-            ) VALUES (?, ?, ?, ?)
-            ''',
-            (
-                loot_table,
-                loot_table_walker.path_str,
-                entity_pk,
+        rows.add(
+            "EntityLootField",
+            identifier=loot_table,
+            jsonPath=loot_table_walker.path_str,
+            Entity_fk=entity_ref,
 
-                # minecraft:loot OR minecraft:equipment
-                loot_table_walker.parent.parent_key
-            )
-        )
+            # minecraft:loot OR minecraft:equipment
+            componentType=loot_table_walker.parent.parent_key)
 
     # TRADE
     trade_table_walkers = (
@@ -156,33 +146,19 @@ def load_entity(db: Connection, entity_path: Path, bp_id: int):
         trade_table = trade_table_walker.data
         if not isinstance(trade_table, str):
             continue
-        cursor.execute(
-            '''
-            INSERT INTO EntityTradeField (
-            identifier, jsonPath, Entity_fk, componentType
-            ) VALUES (?, ?, ?, ?)
-            ''',
-            (
-                trade_table,
-                trade_table_walker.path_str,
-                entity_pk,
-
-                # minecraft:trade_table OR minecraft:economy_trade_table
-                trade_table_walker.parent.parent_key
-            )
-        )
+        rows.add(
+            "EntityTradeField",
+            identifier=trade_table,
+            jsonPath=trade_table_walker.path_str,
+            Entity_fk=entity_ref,
+
+            # minecraft:trade_table OR minecraft:economy_trade_table
+            componentType=trade_table_walker.parent.parent_key)
     # SPAWN EGG
     spawn_egg_identifier = f'{entity_identifier}_spawn_egg'
     spawnable = (description / "is_spawnable").data
     if isinstance(spawnable, bool) and spawnable:
-        cursor.execute(
-            '''
-            INSERT INTO EntitySpawnEggField (
-            identifier, Entity_fk
-            ) VALUES (?, ?)
-            ''',
-            (
-                spawn_egg_identifier,
-                entity_pk
-            )
-        )
+        rows.add(
+            "EntitySpawnEggField",
+            identifier=spawn_egg_identifier, Entity_fk=entity_ref)
+    return rows
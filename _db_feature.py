@@ -2,8 +2,10 @@
 from sqlite3 import Connection
 from pathlib import Path
 import json
-from .better_json_tools import load_jsonc, JSONSplitWalker
+from .better_json_tools import JSONSplitWalker, JSONWalker
+from ._jsonc import loads_jsonc
 from ._views import dbtableview, WeakTableConnection
+from ._components import FileRows, pack_component, load_component, load_file
 
 FEATURE_TYPES = [
     "minecraft:aggregate_feature",
@@ -29,7 +31,10 @@ FEATURE_TYPES = [
 
 @dbtableview(
     properties={
-        "path": (Path, "NOT NULL")
+        "path": (Path, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["BehaviorPack"]
 )
@@ -99,30 +104,29 @@ def load_features(db: Connection, bp_id: int):
     '''
     Loads all features from the behavior pack.
     '''
-    bp_path: Path = db.execute(
-        "SELECT path FROM BehaviorPack WHERE BehaviorPack_pk = ?",
-        (bp_id,)
-    ).fetchone()[0]
-
-    for feature_rule_path in (bp_path / "features").glob("*.json"):
-        load_feature(db, feature_rule_path, bp_id)
+    load_component(db, "features", bp_id)
 
 def load_feature(db: Connection, feature_path: Path, bp_id: int):
     '''
     Loads a feature from the behavior pack.
     '''
-    cursor = db.cursor()
-    # FEATURE RULE FILE
-    cursor.execute(
-        "INSERT INTO FeatureFile (path, BehaviorPack_fk) VALUES (?, ?)",
-        (feature_path.as_posix(), bp_id))
+    load_file(db, "features", feature_path, bp_id)
 
-    file_pk = cursor.lastrowid
+@pack_component(
+    "features", "BehaviorPack", "FeatureFile", "features", ["*.json"],
+    recursive=False)
+def _extract_feature(feature_path: Path, bp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of a feature file from the behavior pack.
+    '''
+    # pylint: disable=unused-argument
+    # FEATURE RULE FILE
+    rows = FileRows("FeatureFile", feature_path)
     try:
-        feature_jsonc = load_jsonc(feature_path)
+        feature_jsonc = JSONWalker(loads_jsonc(rows.read_text()))
     except json.JSONDecodeError:
         # sinlently skip invalid files. The file is in db but has no data
-        return
+        return rows
 
     for feature_walker in feature_jsonc // str:
         feature_type = feature_walker.parent_key
@@ -136,19 +140,13 @@ def load_feature(db: Connection, feature_path: Path, bp_id: int):
         feature_rule_identifier = (description / "identifier").data
         if not isinstance(feature_rule_identifier, str):
             # Skip feature rules without identifiers
-            return
-        cursor.execute(
-            '''
-            INSERT INTO Feature (
-            identifier, jsonPath, featureType, FeatureFile_fk
-            ) VALUES (?, ?, ?, ?)
-            ''',
-            (
-                feature_rule_identifier, feature_walker.path_str,
-                feature_type, file_pk
-            )
-        )
-        feature_pk = cursor.lastrowid
+            return rows
+        feature_ref = rows.add(
+            "Feature",
+            identifier=feature_rule_identifier,
+            jsonPath=feature_walker.path_str,
+            featureType=feature_type,
+            FeatureFile_fk=rows.file_ref)
         
         # FEATURE PLACES FEATURE FIELD
         # Depends on the feature type. Gets a JSONSplitWalker that lists all
@@ -186,22 +184,13 @@ def load_feature(db: Connection, feature_path: Path, bp_id: int):
         for places_feature_walker in places_features_walker:
             if not isinstance(places_feature_walker.data, str):
                 continue
-            cursor.execute(
-                '''
-                INSERT INTO FeaturePlacesFeatureFieldValue (
-                identifier, jsonPath
-                ) VALUES (?, ?)
-                ''',
-                (
-                    places_feature_walker.data, places_feature_walker.path_str,
-                )
-            )
-            feature_places_feature_field_value_pk = cursor.lastrowid
-            cursor.execute(
-                '''
-                INSERT INTO FeaturePlacesFeatureField (
-                Feature_fk, FeaturePlacesFeatureFieldValue_fk
-                ) VALUES (?, ?)
-                ''',
-                (feature_pk, feature_places_feature_field_value_pk)
-            )
\ No newline at end of file
+            feature_places_feature_field_value_ref = rows.add(
+                "FeaturePlacesFeatureFieldValue",
+                identifier=places_feature_walker.data,
+                jsonPath=places_feature_walker.path_str)
+            rows.add(
+                "FeaturePlacesFeatureField",
+                Feature_fk=feature_ref,
+                FeaturePlacesFeatureFieldValue_fk=(
+                    feature_places_feature_field_value_ref))
+    return rows
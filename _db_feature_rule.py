@@ -2,12 +2,17 @@
 from sqlite3 import Connection
 from pathlib import Path
 import json
-from .better_json_tools import load_jsonc
+from .better_json_tools import JSONWalker
+from ._jsonc import loads_jsonc
 from ._views import dbtableview, WeakTableConnection
+from ._components import FileRows, pack_component, load_component, load_file
 
 @dbtableview(
     properties={
-        "path": (Path, "NOT NULL")
+        "path": (Path, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["BehaviorPack"]
 )
@@ -35,30 +40,29 @@ def load_feature_rules(db: Connection, bp_id: int):
     '''
     Loads all feature rules from the behavior pack.
     '''
-    bp_path: Path = db.execute(
-        "SELECT path FROM BehaviorPack WHERE BehaviorPack_pk = ?",
-        (bp_id,)
-    ).fetchone()[0]
-
-    for feature_rule_path in (bp_path / "feature_rules").glob("*.json"):
-        load_feature_rule(db, feature_rule_path, bp_id)
+    load_component(db, "feature_rules", bp_id)
 
 def load_feature_rule(db: Connection, feature_rule_path: Path, bp_id: int):
     '''
     Loads a feature rule from the behavior pack.
     '''
-    cursor = db.cursor()
-    # FEATURE RULE FILE
-    cursor.execute(
-        "INSERT INTO FeatureRuleFile (path, BehaviorPack_fk) VALUES (?, ?)",
-        (feature_rule_path.as_posix(), bp_id))
+    load_file(db, "feature_rules", feature_rule_path, bp_id)
 
-    file_pk = cursor.lastrowid
+@pack_component(
+    "feature_rules", "BehaviorPack", "FeatureRuleFile", "feature_rules",
+    ["*.json"], recursive=False)
+def _extract_feature_rule(feature_rule_path: Path, bp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of a feature rule file from the behavior pack.
+    '''
+    # pylint: disable=unused-argument
+    # FEATURE RULE FILE
+    rows = FileRows("FeatureRuleFile", feature_rule_path)
     try:
-        feature_rule_jsonc = load_jsonc(feature_rule_path)
+        feature_rule_jsonc = JSONWalker(loads_jsonc(rows.read_text()))
     except json.JSONDecodeError:
         # sinlently skip invalid files. The file is in db but has no data
-        return
+        return rows
 
     feature_rule_walker = feature_rule_jsonc / "minecraft:feature_rules"
     description = feature_rule_walker / "description"
@@ -67,14 +71,12 @@ def load_feature_rule(db: Connection, feature_rule_path: Path, bp_id: int):
     feature_rule_identifier = (description / "identifier").data
     if not isinstance(feature_rule_identifier, str):
         # Skip feature rules without identifiers
-        return
+        return rows
     places_feature = (description / "places_feature").data
     if not isinstance(places_feature, str):
         places_feature = None
-    cursor.execute(
-        '''
-        INSERT INTO FeatureRule (
-        identifier, placesFeature, FeatureRuleFile_fk
-        ) VALUES (?, ?, ?)
-        ''',
-        (feature_rule_identifier, places_feature, file_pk))
+    rows.add(
+        "FeatureRule",
+        identifier=feature_rule_identifier, placesFeature=places_feature,
+        FeatureRuleFile_fk=rows.file_ref)
+    return rows
@@ -3,12 +3,17 @@ from typing import cast, Optional
 from sqlite3 import Connection
 from pathlib import Path
 import json
-from .better_json_tools import load_jsonc
+from .better_json_tools import JSONWalker
+from ._jsonc import JSONCPattern, SKIP_VALUE, project_jsonc
 from ._views import dbtableview
+from ._components import FileRows, pack_component, load_component, load_file
 
 @dbtableview(
     properties={
-        "path": (Path, "NOT NULL")
+        "path": (Path, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["ResourcePack"]
 )
@@ -33,30 +38,35 @@ def load_geometries(db: Connection, rp_id: int):
     '''
     Loads all geometries from the resource pack.
     '''
-    rp_path: Path = db.execute(
-        "SELECT path FROM ResourcePack WHERE ResourcePack_pk = ?",
-        (rp_id,)
-    ).fetchone()[0]
-
-    for geometry_path in (rp_path / "models").rglob("*.json"):
-        load_geometry(db, geometry_path, rp_id)
+    load_component(db, "geometries", rp_id)
 
 def load_geometry(db: Connection, geometry_path: Path, rp_id: int):
     '''
     Loads a geometry from the resource pack.
     '''
-    cursor = db.cursor()
+    load_file(db, "geometries", geometry_path, rp_id)
+
+# The parts of the geometry files used by the extractor
+_GEOMETRY_PATTERNS: list[JSONCPattern] = [
+    (str, SKIP_VALUE),  # 1.8.0 format
+    ("minecraft:geometry", int, "description", "identifier"),  # 1.12.0 format
+]
+
+@pack_component(
+    "geometries", "ResourcePack", "GeometryFile", "models", ["*.json"])
+def _extract_geometry(geometry_path: Path, rp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of a geometry file from the resource pack.
+    '''
+    # pylint: disable=unused-argument
     # GEOMETRY FILE
-    cursor.execute(
-        "INSERT INTO GeometryFile (path, ResourcePack_fk) VALUES (?, ?)",
-        (geometry_path.as_posix(), rp_id)
-    )
-    file_pk = cursor.lastrowid
+    rows = FileRows("GeometryFile", geometry_path)
     try:
-        geometry_jsonc = load_jsonc(geometry_path)
+        geometry_jsonc = JSONWalker(project_jsonc(
+            rows.read_text(), _GEOMETRY_PATTERNS))
     except json.JSONDecodeError:
         # sinlently skip invalid files. The file is in db but has no data
-        return
+        return rows
     # Try with 1.8.0 format
     for identifier in geometry_jsonc // str:
         full_identifier = cast(str, identifier.parent_key)
@@ -68,14 +78,10 @@ def load_geometry(db: Connection, geometry_path: Path, rp_id: int):
         parent: Optional[str] = None
         if len(split)  == 2:
             id_, parent = split
-        cursor.execute(
-            '''
-            INSERT INTO Geometry (
-                identifier, parent, GeometryFile_fk, jsonPath
-            ) VALUES (?, ?, ?, ?)
-            ''',
-            (id_, parent, file_pk, identifier.path_str)
-        )
+        rows.add(
+            "Geometry",
+            identifier=id_, parent=parent, GeometryFile_fk=rows.file_ref,
+            jsonPath=identifier.path_str)
     # Try with 1.12.0 format
     geometries = geometry_jsonc / "minecraft:geometry" // int
     for geometry in geometries:
@@ -85,11 +91,8 @@ def load_geometry(db: Connection, geometry_path: Path, rp_id: int):
             continue
         if not identifier_data.startswith("geometry."):
             continue
-        cursor.execute(
-            '''
-            INSERT INTO Geometry (
-                identifier, GeometryFile_fk, jsonPath
-            ) VALUES (?, ?, ?)
-            ''',
-            (identifier_data, file_pk, geometry.path_str)
-        )
+        rows.add(
+            "Geometry",
+            identifier=identifier_data, GeometryFile_fk=rows.file_ref,
+            jsonPath=geometry.path_str)
+    return rows
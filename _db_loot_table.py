@@ -1,14 +1,20 @@
 # pylint: disable=no-member, multiple-statements, missing-module-docstring, missing-class-docstring
-from sqlite3 import Connection, Cursor
+from sqlite3 import Connection
 from pathlib import Path
 import json
 from typing import cast
-from .better_json_tools import load_jsonc, JSONWalker
+from .better_json_tools import JSONWalker
+from ._jsonc import loads_jsonc
 from ._views import dbtableview, WeakTableConnection
+from ._components import (
+    FileRows, RowRef, pack_component, load_component, extract_file)
 
 @dbtableview(
     properties={
-        "path": (Path, "NOT NULL")
+        "path": (Path, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["BehaviorPack"]
 )
@@ -84,59 +90,53 @@ def load_loot_tables(db: Connection, rp_id: int):
     '''
     Loads all loot tables from the behavior pack.
     '''
-    rp_path: Path = db.execute(
-        "SELECT path FROM BehaviorPack WHERE BehaviorPack_pk = ?",
-        (rp_id,)
-    ).fetchone()[0]
-
-    for loot_table_path in (rp_path / "loot_tables").rglob("*.json"):
-        load_loot_table(db, loot_table_path, rp_path, rp_id)
+    load_component(db, "loot_tables", rp_id)
 
 def load_loot_table(
         db: Connection, loot_table_path: Path, rp_path: Path, rp_id: int):
     '''
     Loads a single loot table from the behavior pack.
     '''
-    cursor = db.cursor()
+    from ._loading import insert_file_rows  # pylint: disable=import-outside-toplevel
+    insert_file_rows(
+        db, extract_file(_extract_loot_table, loot_table_path, rp_path),
+        rp_id)
+
+@pack_component(
+    "loot_tables", "BehaviorPack", "LootTableFile", "loot_tables",
+    ["*.json"])
+def _extract_loot_table(loot_table_path: Path, rp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of a single loot table file from the behavior pack.
+    '''
     # LOOT TABLE FILE
-    cursor.execute(
-        "INSERT INTO LootTableFile (path, BehaviorPack_fk) VALUES (?, ?)",
-        (loot_table_path.as_posix(), rp_id)
-    )
-    file_pk = cursor.lastrowid
+    rows = FileRows("LootTableFile", loot_table_path)
     try:
-        loot_table_jsonc = load_jsonc(loot_table_path)
+        loot_table_jsonc = JSONWalker(loads_jsonc(rows.read_text()))
     except json.JSONDecodeError:
         # sinlently skip invalid files. The file is in db but has no data
-        return
+        return rows
 
     # LOOT TABLE
     identifier = loot_table_path.relative_to(rp_path).as_posix()
-    cursor.execute(
-        '''
-        INSERT INTO LootTable (
-            identifier, LootTableFile_fk
-        ) VALUES (?, ?)
-        ''',
-        (identifier, file_pk)
-    )
-    loot_table_pk = cursor.lastrowid
-    loot_table_pk = cast(int, loot_table_pk)
+    loot_table_ref = rows.add(
+        "LootTable", identifier=identifier, LootTableFile_fk=rows.file_ref)
 
     # LOOT TABLE ITEM & LOOT TABLE FIELDS
     entry_walker = loot_table_jsonc / "pools" // int / "entries" // int
     while len(entry_walker) > 0:
         for ew in entry_walker:
             _load_loot_table_or_loot_table_item_field(
-                ew, cursor, loot_table_pk)
+                ew, rows, loot_table_ref)
         # Entry property can have pools. This is a nested structure.
         entry_walker = entry_walker / "pools" // int / "entries" // int
+    return rows
 
 
 def _load_loot_table_or_loot_table_item_field(
-        ew: JSONWalker, cursor: Cursor, loot_table_pk: int):
+        ew: JSONWalker, rows: FileRows, loot_table_ref: RowRef):
     '''
-    Helper function for load_loot_table to reduce nesting.
+    Helper function for _extract_loot_table to reduce nesting.
     '''
     ew_name = ew / "name"
     if not isinstance(ew_name.data, str):
@@ -145,33 +145,20 @@ def _load_loot_table_or_loot_table_item_field(
     ew_type = ew / "type"
     if ew_type.data == "item":
         # ITEM
-        cursor.execute(
-            '''
-            INSERT INTO LootTableItemField (
-                identifier, jsonPath, LootTable_fk
-            ) VALUES (?, ?, ?)
-            ''',
-            (entry_name, ew_name.path_str, loot_table_pk)
-        )
-        item_pk = cursor.lastrowid
+        item_ref = rows.add(
+            "LootTableItemField",
+            identifier=entry_name, jsonPath=ew_name.path_str,
+            LootTable_fk=loot_table_ref)
         # ITEM SPAWN EGG REFERENCE
         if entry_name.endswith("_spawn_egg"):
             # DIRECT REFERENCE
-            cursor.execute(
-                '''
-                INSERT INTO LootTableItemSpawnEggReferenceField (
-                    entityIdentifier, spawnEggIdentifier,
-                    connectionType, jsonPath, LootTableItemField_fk
-                ) VALUES (?, ?, ?, ?, ?)
-                ''',
-                (
-                    entry_name[:-10],  # remove "_spawn_egg"
-                    entry_name,
-                    "direct",
-                    ew_name.path_str,
-                    item_pk,
-                )
-            )
+            rows.add(
+                "LootTableItemSpawnEggReferenceField",
+                entityIdentifier=entry_name[:-10],  # remove "_spawn_egg"
+                spawnEggIdentifier=entry_name,
+                connectionType="direct",
+                jsonPath=ew_name.path_str,
+                LootTableItemField_fk=item_ref)
         elif entry_name == 'minecraft:spawn_egg':
             # REFERENCE USING set_actor_id FUNCTION
             functions_walker = ew / "functions" // int
@@ -184,28 +171,16 @@ def _load_loot_table_or_loot_table_item_field(
                 entity_identifier = fw / "id"
                 if not isinstance(entity_identifier.data, str):
                     continue
-                cursor.execute(
-                    '''
-                    INSERT INTO LootTableItemSpawnEggReferenceField (
-                        entityIdentifier, spawnEggIdentifier,
-                        connectionType, jsonPath, LootTableItemField_fk
-                    ) VALUES (?, ?, ?, ?, ?)
-                    ''',
-                    (
-                        entity_identifier.data,
-                        entity_identifier.data + "_spawn_egg",
-                        "set_actor_id_function",
-                        fw.path_str,
-                        item_pk,
-                    )
-                )
+                rows.add(
+                    "LootTableItemSpawnEggReferenceField",
+                    entityIdentifier=entity_identifier.data,
+                    spawnEggIdentifier=entity_identifier.data + "_spawn_egg",
+                    connectionType="set_actor_id_function",
+                    jsonPath=fw.path_str,
+                    LootTableItemField_fk=item_ref)
     elif ew_type.data == "loot_table":
         # LOOT TABLE
-        cursor.execute(
-            '''
-            INSERT INTO LootTableLootTableField (
-                identifier, jsonPath, LootTable_fk
-            ) VALUES (?, ?, ?)
-            ''',
-            (entry_name, ew_name.path_str, loot_table_pk)
-        )
+        rows.add(
+            "LootTableLootTableField",
+            identifier=entry_name, jsonPath=ew_name.path_str,
+            LootTable_fk=loot_table_ref)
@@ -2,12 +2,17 @@
 from sqlite3 import Connection
 from pathlib import Path
 import json
-from .better_json_tools import load_jsonc
+from .better_json_tools import JSONWalker
+from ._jsonc import loads_jsonc
 from ._views import dbtableview, WeakTableConnection
+from ._components import FileRows, pack_component, load_component, load_file
 
 @dbtableview(
     properties={
-        "path": (Path, "NOT NULL")
+        "path": (Path, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["ResourcePack"]
 )
@@ -35,30 +40,28 @@ def load_particles(db: Connection, rp_id: int):
     '''
     Loads all particles from the resource pack.
     '''
-    rp_path: Path = db.execute(
-        "SELECT path FROM ResourcePack WHERE ResourcePack_pk = ?",
-        (rp_id,)
-    ).fetchone()[0]
-
-    for particle_path in (rp_path / "particles").rglob("*.json"):
-        load_particle(db, particle_path, rp_id)
+    load_component(db, "particles", rp_id)
 
 def load_particle(db: Connection, particle_path: Path, rp_id: int):
     '''
     Loads a particle from the resource pack.
     '''
-    cursor = db.cursor()
+    load_file(db, "particles", particle_path, rp_id)
+
+@pack_component(
+    "particles", "ResourcePack", "ParticleFile", "particles", ["*.json"])
+def _extract_particle(particle_path: Path, rp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of a particle file from the resource pack.
+    '''
+    # pylint: disable=unused-argument
     # PARTICLE FILE
-    cursor.execute(
-        "INSERT INTO ParticleFile (path, ResourcePack_fk) VALUES (?, ?)",
-        (particle_path.as_posix(), rp_id)
-    )
-    file_pk = cursor.lastrowid
+    rows = FileRows("ParticleFile", particle_path)
     try:
-        particle_walker = load_jsonc(particle_path)
+        particle_walker = JSONWalker(loads_jsonc(rows.read_text()))
     except json.JSONDecodeError:
         # sinlently skip invalid files. The file is in db but has no data
-        return
+        return rows
     description = particle_walker / "particle_effect" / "description"
     basic_render_parameters = description / "basic_render_parameters"
 
@@ -68,18 +71,15 @@ def load_particle(db: Connection, particle_path: Path, rp_id: int):
 
     identifier_data = identifier.data
     if not isinstance(identifier_data, str):
-        return
+        return rows
     material_data = material.data
     if not isinstance(material.data, str):
         material_data = None
     texture_data = texture.data
     if not isinstance(texture.data, str):
         texture_data = None
-    cursor.execute(
-        '''
-        INSERT INTO Particle (
-            identifier, material, texture, ParticleFile_fk
-        ) VALUES (?, ?, ?, ?)
-        ''',
-        (identifier_data, material_data, texture_data, file_pk)
-    )
+    rows.add(
+        "Particle",
+        identifier=identifier_data, material=material_data,
+        texture=texture_data, ParticleFile_fk=rows.file_ref)
+    return rows
@@ -7,12 +7,17 @@ from copy import copy
 import json
 
 from ._views import dbtableview
-from .better_json_tools import JSONWalker, load_jsonc
+from .better_json_tools import JSONWalker
+from ._jsonc import loads_jsonc
 from .utils import find_molang_resources
+from ._components import FileRows, pack_component, load_component, load_file
 
 @dbtableview(
     properties={
-        "path": (Path, "NOT NULL")
+        "path": (Path, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["ResourcePack"]
 )
@@ -84,13 +89,7 @@ def load_render_controllers(db: Connection, rp_id: int):
     '''
     Loads all render controllers from the resource pack.
     '''
-    rp_path: Path = db.execute(
-        "SELECT path FROM ResourcePack WHERE ResourcePack_pk = ?",
-        (rp_id,)
-    ).fetchone()[0]
-
-    for geometry_path in (rp_path / "render_controllers").rglob("*.json"):
-        load_render_controller(db, geometry_path, rp_id)
+    load_component(db, "render_controllers", rp_id)
 
 
 class _LoadRcArraysItem(NamedTuple):
@@ -134,30 +133,31 @@ def load_render_controller(db: Connection, entity_path: Path, rp_id: int):
     '''
     Loads a render controller from the resource pack.
     '''
-    cursor = db.cursor()
+    load_file(db, "render_controllers", entity_path, rp_id)
+
+@pack_component(
+    "render_controllers", "ResourcePack", "RenderControllerFile",
+    "render_controllers", ["*.json"])
+def _extract_render_controller(entity_path: Path, rp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of a render controller file from the resource pack.
+    '''
+    # pylint: disable=unused-argument
     # RENDER CONTROLLER FILE
-    cursor.execute(
-        "INSERT INTO RenderControllerFile (path, ResourcePack_fk) VALUES (?, ?)",
-        (entity_path.as_posix(), rp_id))
-    file_pk = cursor.lastrowid
+    rows = FileRows("RenderControllerFile", entity_path)
     try:
-        entity_jsonc = load_jsonc(entity_path)
+        entity_jsonc = JSONWalker(loads_jsonc(rows.read_text()))
     except json.JSONDecodeError:
         # sinlently skip invalid files. The file is in db but has no data
-        return
+        return rows
     for rc in entity_jsonc / 'render_controllers' // str:
         rc_parent_key = cast(str, rc.parent_key)
         if not rc_parent_key.startswith("controller.render."):
             continue
-        cursor.execute(
-            '''
-            INSERT INTO RenderController (
-                identifier, RenderControllerFile_fk, jsonPath
-            ) VALUES (?, ?, ?)
-            ''',
-            (rc_parent_key, file_pk, rc.path_str)
-        )
-        rc_pk = cursor.lastrowid
+        rc_ref = rows.add(
+            "RenderController",
+            identifier=rc_parent_key, RenderControllerFile_fk=rows.file_ref,
+            jsonPath=rc.path_str)
         # LOAD TEXTURES
         texture_arrays = _load_rc_arrays(rc, "texture")
         for field in rc / "textures" // int:
@@ -166,35 +166,20 @@ def load_render_controller(db: Connection, entity_path: Path, rp_id: int):
             values = find_molang_resources(field.data, ["texture", "array"])
             # Direct access
             for short_name in values["texture"]:
-                cursor.execute(
-                    '''
-                    INSERT INTO RenderControllerTexturesField (
-                        RenderController_fk, shortName, jsonPath
-                    ) VALUES (?, ?, ?)
-                    ''',
-                    (rc_pk, short_name, field.path_str)
-                )
+                rows.add(
+                    "RenderControllerTexturesField",
+                    RenderController_fk=rc_ref, shortName=short_name,
+                    jsonPath=field.path_str)
             # Access through array
             for array_name in values["array"]:
                 for texture_reference in texture_arrays.get(array_name, []):
-                    cursor.execute(
-                        '''
-                        INSERT INTO RenderControllerTexturesField (
-                            RenderController_fk,
-                            shortName,
-                            jsonPath,
-                            ownerArray,
-                            inOwnerArrayJsonPath
-                        ) VALUES (?, ?, ?, ?, ?)
-                        ''',
-                        (
-                            rc_pk,
-                            texture_reference.short_name,
-                            field.path_str,
-                            array_name,
-                            texture_reference.json_path
-                        )
-                    )
+                    rows.add(
+                        "RenderControllerTexturesField",
+                        RenderController_fk=rc_ref,
+                        shortName=texture_reference.short_name,
+                        jsonPath=field.path_str,
+                        ownerArray=array_name,
+                        inOwnerArrayJsonPath=texture_reference.json_path)
         # LOAD MATERIALS
         material_arrays = _load_rc_arrays(rc, "material")
         for field in rc / "materials" // int // str:
@@ -204,38 +189,21 @@ def load_render_controller(db: Connection, entity_path: Path, rp_id: int):
             values = find_molang_resources(field.data, ["material", "array"])
             # Direct access
             for short_name in copy(values["material"]):
-                cursor.execute(
-                    '''
-                    INSERT INTO RenderControllerMaterialsField (
-                        RenderController_fk, shortName, jsonPath,
-                        boneNamePattern
-                    ) VALUES (?, ?, ?, ?)
-                    ''',
-                    (rc_pk, short_name, field.path_str, pattern)
-                )
+                rows.add(
+                    "RenderControllerMaterialsField",
+                    RenderController_fk=rc_ref, shortName=short_name,
+                    jsonPath=field.path_str, boneNamePattern=pattern)
             # Access through array
             for array_name in values["array"]:
                 for material_reference in material_arrays.get(array_name, []):
-                    cursor.execute(
-                        '''
-                        INSERT INTO RenderControllerMaterialsField (
-                            RenderController_fk,
-                            shortName,
-                            jsonPath,
-                            ownerArray,
-                            inOwnerArrayJsonPath,
-                            boneNamePattern
-                        ) VALUES (?, ?, ?, ?, ?, ?)
-                        ''',
-                        (
-                            rc_pk,
-                            material_reference.short_name,
-                            field.path_str,
-                            array_name,
-                            material_reference.json_path,
-                            pattern
-                        )
-                    )
+                    rows.add(
+                        "RenderControllerMaterialsField",
+                        RenderController_fk=rc_ref,
+                        shortName=material_reference.short_name,
+                        jsonPath=field.path_str,
+                        ownerArray=array_name,
+                        inOwnerArrayJsonPath=material_reference.json_path,
+                        boneNamePattern=pattern)
 
         # LOAD GEOMETRIES
         geo_arrays = _load_rc_arrays(rc, "geometry")
@@ -244,32 +212,18 @@ def load_render_controller(db: Connection, entity_path: Path, rp_id: int):
             values = find_molang_resources(field.data, ["geometry", "array"])
             # Direct access
             for short_name in copy(values["geometry"]):
-                cursor.execute(
-                    '''
-                    INSERT INTO RenderControllerGeometryField (
-                        RenderController_fk, shortName, jsonPath
-                    ) VALUES (?, ?, ?)
-                    ''',
-                    (rc_pk, short_name, field.path_str)
-                )
+                rows.add(
+                    "RenderControllerGeometryField",
+                    RenderController_fk=rc_ref, shortName=short_name,
+                    jsonPath=field.path_str)
             # Access through array
             for array_name in values["array"]:
                 for geometry_reference in geo_arrays.get(array_name, []):
-                    cursor.execute(
-                        '''
-                        INSERT INTO RenderControllerGeometryField (
-                            RenderController_fk,
-                            shortName,
-                            jsonPath,
-                            ownerArray,
-                            inOwnerArrayJsonPath
-                        ) VALUES (?, ?, ?, ?, ?)
-                        ''',
-                        (
-                            rc_pk,
-                            geometry_reference.short_name,
-                            field.path_str,
-                            array_name,
-                            geometry_reference.json_path
-                        )
-                    )
+                    rows.add(
+                        "RenderControllerGeometryField",
+                        RenderController_fk=rc_ref,
+                        shortName=geometry_reference.short_name,
+                        jsonPath=field.path_str,
+                        ownerArray=array_name,
+                        inOwnerArrayJsonPath=geometry_reference.json_path)
+    return rows
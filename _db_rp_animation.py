@@ -3,12 +3,17 @@ from typing import cast
 from sqlite3 import Connection
 from pathlib import Path
 import json
-from .better_json_tools import load_jsonc
+from .better_json_tools import JSONWalker
+from ._jsonc import JSONCPattern, SKIP_VALUE, project_jsonc
 from ._views import dbtableview
+from ._components import FileRows, pack_component, load_component, load_file
 
 @dbtableview(
     properties={
-        "path": (Path, "NOT NULL")
+        "path": (Path, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["ResourcePack"]
 )
@@ -52,68 +57,63 @@ def load_rp_animations(db: Connection, rp_id: int):
     '''
     Loads all animations from the resource pack.
     '''
-    rp_path: Path = db.execute(
-        "SELECT path FROM ResourcePack WHERE ResourcePack_pk = ?",
-        (rp_id,)
-    ).fetchone()[0]
-
-    for animation_path in (rp_path / "animations").rglob("*.json"):
-        load_rp_animation(db, animation_path, rp_id)
+    load_component(db, "rp_animations", rp_id)
 
 def load_rp_animation(db: Connection, animation_path: Path, rp_id: int):
     '''
     Loads an animation from the resource pack.
     '''
-    cursor = db.cursor()
+    load_file(db, "rp_animations", animation_path, rp_id)
+
+# The parts of the animation files used by the extractor
+_RP_ANIMATION_PATTERNS: list[JSONCPattern] = [
+    ("animations", str, SKIP_VALUE),
+    ("animations", str, "particle_effects", str, "effect"),
+    ("animations", str, "sound_effects", str, "effect"),
+]
+
+@pack_component(
+    "rp_animations", "ResourcePack", "RpAnimationFile", "animations",
+    ["*.json"])
+def _extract_rp_animation(animation_path: Path, rp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of an animation file from the resource pack.
+    '''
+    # pylint: disable=unused-argument
     # RP ANIMATION FILE
-    cursor.execute(
-        "INSERT INTO RpAnimationFile (path, ResourcePack_fk) VALUES (?, ?)",
-        (animation_path.as_posix(), rp_id)
-    )
-    file_pk = cursor.lastrowid
+    rows = FileRows("RpAnimationFile", animation_path)
     try:
-        animations_walker = load_jsonc(animation_path)
+        animations_walker = JSONWalker(project_jsonc(
+            rows.read_text(), _RP_ANIMATION_PATTERNS))
     except json.JSONDecodeError:
         # sinlently skip invalid files. The file is in db but has no data
-        return
+        return rows
 
     for animation_walker in animations_walker / "animations" // str:
         identifier_data: str = cast(str, animation_walker.parent_key)
         if not identifier_data.startswith("animation."):
             continue
-        cursor.execute(
-            '''
-            INSERT INTO RpAnimation (
-                RpAnimationFile_fk, identifier, jsonPath
-            ) VALUES (?, ?, ?)
-            ''',
-            (file_pk, identifier_data, animation_walker.path_str)
-        )
-        rpanim_pk = cursor.lastrowid
+        rpanim_ref = rows.add(
+            "RpAnimation",
+            RpAnimationFile_fk=rows.file_ref, identifier=identifier_data,
+            jsonPath=animation_walker.path_str)
         # LOAD PARTICLE EFFECTS
         for particle_effect_walker in (
                 animation_walker / "particle_effects" // str):
             short_name = particle_effect_walker / "effect"
             if not isinstance(short_name.data, str):
                 continue
-            cursor.execute(
-                '''
-                INSERT INTO RpAnimationParticleEffect (
-                    RpAnimation_fk, shortName, jsonPath
-                ) VALUES (?, ?, ?)
-                ''',
-                (rpanim_pk, short_name.data, particle_effect_walker.path_str)
-            )
+            rows.add(
+                "RpAnimationParticleEffect",
+                RpAnimation_fk=rpanim_ref, shortName=short_name.data,
+                jsonPath=particle_effect_walker.path_str)
         # LOAD SOUND EFFECTS
         for sound_effect_walker in animation_walker / "sound_effects" // str:
             short_name = sound_effect_walker / "effect"
             if not isinstance(short_name.data, str):
                 continue
-            cursor.execute(
-                '''
-                INSERT INTO RpAnimationSoundEffect (
-                    RpAnimation_fk, shortName, jsonPath
-                ) VALUES (?, ?, ?)
-                ''',
-                (rpanim_pk, short_name.data, sound_effect_walker.path_str)
-            )
+            rows.add(
+                "RpAnimationSoundEffect",
+                RpAnimation_fk=rpanim_ref, shortName=short_name.data,
+                jsonPath=sound_effect_walker.path_str)
+    return rows
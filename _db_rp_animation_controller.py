@@ -3,12 +3,17 @@ from typing import cast
 from sqlite3 import Connection
 from pathlib import Path
 import json
-from .better_json_tools import load_jsonc
+from .better_json_tools import JSONWalker
+from ._jsonc import loads_jsonc
 from ._views import dbtableview
+from ._components import FileRows, pack_component, load_component, load_file
 
 @dbtableview(
     properties={
-        "path": (Path, "NOT NULL")
+        "path": (Path, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["ResourcePack"]
 )
@@ -52,45 +57,40 @@ def load_rp_animation_controllers(db: Connection, rp_id: int):
     '''
     Loads all animation controllers from the resource pack.
     '''
-    rp_path: Path = db.execute(
-        "SELECT path FROM ResourcePack WHERE ResourcePack_pk = ?",
-        (rp_id,)
-    ).fetchone()[0]
-
-    for ac_path in (rp_path / "animation_controllers").rglob("*.json"):
-        load_rp_animation_controller(db, ac_path, rp_id)
+    load_component(db, "rp_animation_controllers", rp_id)
 
 
 def load_rp_animation_controller(db: Connection, animation_controller_path: Path, rp_id: int):
     '''
     Loads an animation controller from the resource pack.
     '''
-    cursor = db.cursor()
+    load_file(db, "rp_animation_controllers", animation_controller_path, rp_id)
+
+@pack_component(
+    "rp_animation_controllers", "ResourcePack", "RpAnimationControllerFile",
+    "animation_controllers", ["*.json"])
+def _extract_rp_animation_controller(
+        animation_controller_path: Path, rp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of an animation controller file from the resource pack.
+    '''
+    # pylint: disable=unused-argument
     # RP ANIMATION FILE
-    cursor.execute(
-        "INSERT INTO RpAnimationControllerFile (path, ResourcePack_fk) VALUES (?, ?)",
-        (animation_controller_path.as_posix(), rp_id)
-    )
-    file_pk = cursor.lastrowid
+    rows = FileRows("RpAnimationControllerFile", animation_controller_path)
     try:
-        acs_walker = load_jsonc(animation_controller_path)
+        acs_walker = JSONWalker(loads_jsonc(rows.read_text()))
     except json.JSONDecodeError:
         # sinlently skip invalid files. The file is in db but has no data
-        return
+        return rows
 
     for ac_walker in acs_walker / "animation_controllers" // str:
         identifier_data: str = cast(str, ac_walker.parent_key)
         if not identifier_data.startswith("controller.animation."):
             continue
-        cursor.execute(
-            '''
-            INSERT INTO RpAnimationController (
-                RpAnimationControllerFile_fk, identifier, jsonPath
-            ) VALUES (?, ?, ?)
-            ''',
-            (file_pk, identifier_data, ac_walker.path_str)
-        )
-        rpanim_pk = cursor.lastrowid
+        rpanim_ref = rows.add(
+            "RpAnimationController",
+            RpAnimationControllerFile_fk=rows.file_ref,
+            identifier=identifier_data, jsonPath=ac_walker.path_str)
 
         states = ac_walker / "states" // str
         # LOAD PARTICLE EFFECTS
@@ -98,24 +98,19 @@ def load_rp_animation_controller(db: Connection, animation_controller_path: Path
             short_name = particle_effect_walker / "effect"
             if not isinstance(short_name.data, str):
                 continue
-            cursor.execute(
-                '''
-                INSERT INTO RpAnimationControllerParticleEffect (
-                    RpAnimationController_fk, shortName, jsonPath
-                ) VALUES (?, ?, ?)
-                ''',
-                (rpanim_pk, short_name.data, particle_effect_walker.path_str)
-            )
+            rows.add(
+                "RpAnimationControllerParticleEffect",
+                RpAnimationController_fk=rpanim_ref,
+                shortName=short_name.data,
+                jsonPath=particle_effect_walker.path_str)
         # LOAD SOUND EFFECTS
         for sound_effect_walker in states / "sound_effects" // int:
             short_name = sound_effect_walker / "effect"
             if not isinstance(short_name.data, str):
                 continue
-            cursor.execute(
-                '''
-                INSERT INTO RpAnimationControllerSoundEffect (
-                    RpAnimationController_fk, shortName, jsonPath
-                ) VALUES (?, ?, ?)
-                ''',
-                (rpanim_pk, short_name.data, sound_effect_walker.path_str)
-            )
+            rows.add(
+                "RpAnimationControllerSoundEffect",
+                RpAnimationController_fk=rpanim_ref,
+                shortName=short_name.data,
+                jsonPath=sound_effect_walker.path_str)
+    return rows
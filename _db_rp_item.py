@@ -3,12 +3,17 @@ from typing import Optional
 from sqlite3 import Connection
 from pathlib import Path
 import json
-from .better_json_tools import load_jsonc
+from .better_json_tools import JSONWalker
+from ._jsonc import loads_jsonc
 from ._views import dbtableview
+from ._components import FileRows, pack_component, load_component, load_file
 
 @dbtableview(
     properties={
-        "path": (Path, "NOT NULL")
+        "path": (Path, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["ResourcePack"]
 )
@@ -32,47 +37,40 @@ def load_rp_items(db: Connection, rp_id: int):
     '''
     Loads all items from the resource pack.
     '''
-    rp_path: Path = db.execute(
-        "SELECT path FROM ResourcePack WHERE ResourcePack_pk = ?",
-        (rp_id,)
-    ).fetchone()[0]
-
-    for item_path in (rp_path / "items").rglob("*.json"):
-        load_rp_item(db, item_path, rp_id)
+    load_component(db, "rp_items", rp_id)
 
 def load_rp_item(db: Connection, item_path: Path, rp_id: int):
     '''
     Loads an item from the resource pack.
     '''
-    cursor = db.cursor()
+    load_file(db, "rp_items", item_path, rp_id)
+
+@pack_component(
+    "rp_items", "ResourcePack", "RpItemFile", "items", ["*.json"])
+def _extract_rp_item(item_path: Path, rp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of an item file from the resource pack.
+    '''
+    # pylint: disable=unused-argument
     # RP ITEM FILE
-    cursor.execute(
-        "INSERT INTO RpItemFile (path, ResourcePack_fk) VALUES (?, ?)",
-        (item_path.as_posix(), rp_id)
-    )
-    file_pk = cursor.lastrowid
+    rows = FileRows("RpItemFile", item_path)
     try:
-        item_walker = load_jsonc(item_path)
+        item_walker = JSONWalker(loads_jsonc(rows.read_text()))
     except json.JSONDecodeError:
         # sinlently skip invalid files. The file is in db but has no data
-        return
+        return rows
 
     # RP ITEM
     identifier = item_walker / "minecraft:item" / "description" / "identifier"
     if not isinstance(identifier.data, str):
-        return  # Silently skip items without an identifier
+        return rows  # Silently skip items without an identifier
 
     icon: Optional[str] = None
     icon_walker = (
         item_walker / "minecraft:item" / "components" / "minecraft:icon")
     if isinstance(icon_walker.data, str):
         icon = icon_walker.data
-    cursor.execute(
-        '''
-        INSERT INTO RpItem (
-            RpItemFile_fk, identifier, icon
-        ) VALUES (?, ?, ?)
-        ''',
-        (file_pk, identifier.data, icon)
-    )
-    # rp_anim_pk = cursor.lastrowid
+    rows.add(
+        "RpItem",
+        RpItemFile_fk=rows.file_ref, identifier=identifier.data, icon=icon)
+    return rows
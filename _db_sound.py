@@ -2,6 +2,7 @@
 from sqlite3 import Connection
 from pathlib import Path
 from ._views import dbtableview
+from ._components import FileRows, pack_component, load_component, extract_file
 
 @dbtableview(
     properties={
@@ -9,7 +10,10 @@ from ._views import dbtableview
 
         # The identifier is the path without extension. This is added to the DB to
         # make searches easier.
-        "identifier": (str, "NOT NULL")
+        "identifier": (str, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["ResourcePack"]
 )
@@ -21,33 +25,24 @@ def load_sounds(db: Connection, rp_id: int):
     '''
     Loads all sounds from the resource pack.
     '''
-    rp_path: Path = db.execute(
-        "SELECT path FROM ResourcePack WHERE ResourcePack_pk = ?",
-        (rp_id,)
-    ).fetchone()[0]
-
-    for sound_path in (rp_path / "sounds").rglob("*.wav"):
-        load_sound(db, sound_path, rp_path, rp_id)
-    for sound_path in (rp_path / "sounds").rglob("*.ogg"):
-        load_sound(db, sound_path, rp_path, rp_id)
-    for sound_path in (rp_path / "sounds").rglob("*.fsb"):
-        load_sound(db, sound_path, rp_path, rp_id)
+    load_component(db, "sounds", rp_id)
 
 def load_sound(db: Connection, sound_path: Path, rp_path: Path, rp_id: int):
     '''
     Loads a sound from the resource pack.
     '''
-    cursor = db.cursor()
+    from ._loading import insert_file_rows  # pylint: disable=import-outside-toplevel
+    insert_file_rows(
+        db, extract_file(_extract_sound, sound_path, rp_path), rp_id)
+
+@pack_component(
+    "sounds", "ResourcePack", "SoundFile", "sounds",
+    ["*.wav", "*.ogg", "*.fsb"])
+def _extract_sound(sound_path: Path, rp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of a sound file from the resource pack.
+    '''
     # SOUND FILE AND ITS IDENTIFIER
-    cursor.execute(
-        """
-        INSERT INTO SoundFile (
-            path, identifier, ResourcePack_fk
-        ) VALUES (?, ?, ?)
-        """,
-        (
-            sound_path.as_posix(),
-            sound_path.relative_to(rp_path).with_suffix("").as_posix(),
-            rp_id
-        )
-    )
+    return FileRows(
+        "SoundFile", sound_path,
+        identifier=sound_path.relative_to(rp_path).with_suffix("").as_posix())
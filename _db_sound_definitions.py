@@ -3,12 +3,17 @@ from typing import cast
 from sqlite3 import Connection
 from pathlib import Path
 import json
-from .better_json_tools import load_jsonc
+from .better_json_tools import JSONWalker
+from ._jsonc import loads_jsonc
 from ._views import dbtableview, WeakTableConnection
+from ._components import FileRows, pack_component, load_component, load_file
 
 @dbtableview(
     properties={
-        "path": (Path, "NOT NULL")
+        "path": (Path, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["ResourcePack"]
 )
@@ -45,32 +50,31 @@ def load_sound_definitions(db: Connection, rp_id: int):
     '''
     Loads all sound definitions from the resource pack.
     '''
-    rp_path: Path = db.execute(
-        "SELECT path FROM ResourcePack WHERE ResourcePack_pk = ?",
-        (rp_id,)
-    ).fetchone()[0]
-
-    sound_definitions_path = rp_path / "sounds" / "sound_definitions.json"
-    if sound_definitions_path.exists():
-        load_sound_definition(db, sound_definitions_path, rp_id)
+    load_component(db, "sound_definitions", rp_id)
 
 
 def load_sound_definition(db: Connection, sound_definition_path: Path, rp_id: int):
     '''
     Loads a sound definition from the resource pack.
     '''
-    cursor = db.cursor()
+    load_file(db, "sound_definitions", sound_definition_path, rp_id)
+
+@pack_component(
+    "sound_definitions", "ResourcePack", "SoundDefinitionsFile", "sounds",
+    ["sound_definitions.json"], recursive=False)
+def _extract_sound_definition(
+        sound_definition_path: Path, rp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of the sound definitions file from the resource pack.
+    '''
+    # pylint: disable=unused-argument
     # GEOMETRY FILE
-    cursor.execute(
-        "INSERT INTO SoundDefinitionsFile (path, ResourcePack_fk) VALUES (?, ?)",
-        (sound_definition_path.as_posix(), rp_id)
-    )
-    file_pk = cursor.lastrowid
+    rows = FileRows("SoundDefinitionsFile", sound_definition_path)
     try:
-        sound_definitions_jsonc = load_jsonc(sound_definition_path)
+        sound_definitions_jsonc = JSONWalker(loads_jsonc(rows.read_text()))
     except json.JSONDecodeError:
         # sinlently skip invalid files. The file is in db but has no data
-        return
+        return rows
     # Try to load from the "sound_definitions" key, if it doesn't exist,
     # load from the root of the file (old format)
     if (sound_definitions_jsonc / "sound_definitions").exists:
@@ -83,15 +87,11 @@ def load_sound_definition(db: Connection, sound_definition_path: Path, rp_id: in
         if old_format and sound_definition.parent_key == "format_version":
             continue
         sound_definition_identifier = cast(str, sound_definition.parent_key)
-        cursor.execute(
-            '''
-            INSERT INTO SoundDefinition (
-                identifier, jsonPath, SoundDefinitionsFile_fk
-            ) VALUES (?, ?, ?)
-            ''',
-            (sound_definition_identifier, sound_definition.path_str, file_pk)
-        )
-        sound_definition_pk = cursor.lastrowid
+        sound_definition_ref = rows.add(
+            "SoundDefinition",
+            identifier=sound_definition_identifier,
+            jsonPath=sound_definition.path_str,
+            SoundDefinitionsFile_fk=rows.file_ref)
         for sound in sound_definition / "sounds" // int:
             if isinstance(sound.data, str):
                 sound_identifier = sound.data
@@ -104,11 +104,8 @@ def load_sound_definition(db: Connection, sound_definition_path: Path, rp_id: in
                 sound_identifier = sound_name_walker.data
             else:
                 continue
-            cursor.execute(
-                '''
-                INSERT INTO SoundDefinitionSoundField (
-                    identifier, jsonPath, SoundDefinition_fk
-                ) VALUES (?, ?, ?)
-                ''',
-                (sound_identifier, sound.path_str, sound_definition_pk)
-            )
+            rows.add(
+                "SoundDefinitionSoundField",
+                identifier=sound_identifier, jsonPath=sound.path_str,
+                SoundDefinition_fk=sound_definition_ref)
+    return rows
@@ -3,13 +3,19 @@ from typing import cast, Optional, NamedTuple, Iterator, TYPE_CHECKING
 from sqlite3 import Connection
 from pathlib import Path
 import json
-from .better_json_tools import load_jsonc, JSONWalker
+from .better_json_tools import JSONWalker
+from ._jsonc import loads_jsonc
 from ._views import dbtableview, WeakTableConnection
+from ._components import (
+    FileRows, RowRef, pack_component, load_component, load_file)
 
 
 @dbtableview(
     properties={
-        "path": (Path, "NOT NULL")
+        "path": (Path, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["ResourcePack"]
 )
@@ -71,35 +77,34 @@ def load_terrain_texture(db: Connection, rp_id: int):
     '''
     Loads the terrain_texture.json file from the resource pack.
     '''
-    rp_path: Path = db.execute(
-        "SELECT path FROM ResourcePack WHERE ResourcePack_pk = ?",
-        (rp_id,)
-    ).fetchone()[0]
-
-    terrain_texture_path = rp_path / "textures" / "terrain_texture.json"
-    if not terrain_texture_path.exists():
-        return
-    load_terrain_texture_items(db, terrain_texture_path, rp_id)
+    load_component(db, "terrain_texture", rp_id)
 
 def load_terrain_texture_items(db: Connection, terrain_texture_path: Path, rp_id: int):
     '''
     Loads all terrain textures from the terrain_texture.json file.
     '''
-    cursor = db.cursor()
+    load_file(db, "terrain_texture", terrain_texture_path, rp_id)
+
+@pack_component(
+    "terrain_texture", "ResourcePack", "TerrainTextureFile", "textures",
+    ["terrain_texture.json"], recursive=False)
+def _extract_terrain_texture_items(
+        terrain_texture_path: Path, rp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of all terrain textures from the terrain_texture.json
+    file.
+    '''
+    # pylint: disable=unused-argument
     # TERRAIN TEXTURE FILE
-    cursor.execute(
-        "INSERT INTO TerrainTextureFile (path, ResourcePack_fk) VALUES (?, ?)",
-        (terrain_texture_path.as_posix(), rp_id)
-    )
-    file_pk = cursor.lastrowid
+    rows = FileRows("TerrainTextureFile", terrain_texture_path)
     try:
-        terrain_texture_json = load_jsonc(terrain_texture_path)
+        terrain_texture_json = JSONWalker(loads_jsonc(rows.read_text()))
     except json.JSONDecodeError:
-        return
+        return rows
 
     # We will inset the TerrainTexture only if it has at least one valid
     # variation. This function reduces the boilerplate code.
-    inserted_textures: dict[str, int] = {}
+    inserted_textures: dict[str, RowRef] = {}
     def _insert_terrain_texture_variation(
             terrain_texture_identifier: str,
             identifier: str,
@@ -114,35 +119,26 @@ def load_terrain_texture_items(db: Connection, terrain_texture_path: Path, rp_id
         to specified TerrainTexture. If the TerrainTexture doesn't exist,
         it will be created.
         '''
-        # Get or create the TerrainTexture PK
+        # Get or create the TerrainTexture reference
         if terrain_texture_identifier in inserted_textures:
-            terrain_texture_pk = inserted_textures[terrain_texture_identifier]
+            terrain_texture_ref = inserted_textures[terrain_texture_identifier]
         else:
-            cursor.execute(
-                "INSERT INTO TerrainTexture "
-                "(identifier, TerrainTextureFile_fk) VALUES (?, ?)",
-                (terrain_texture_identifier, file_pk)
-            )
-            terrain_texture_pk = cursor.lastrowid
-            terrain_texture_pk = cast(int, terrain_texture_pk)
-            inserted_textures[terrain_texture_identifier] = terrain_texture_pk
+            terrain_texture_ref = rows.add(
+                "TerrainTexture",
+                identifier=terrain_texture_identifier,
+                TerrainTextureFile_fk=rows.file_ref)
+            inserted_textures[terrain_texture_identifier] = terrain_texture_ref
 
-        cursor.execute(
-            "INSERT INTO TerrainTextureVariation "
-            "(identifier, jsonPath, variantIndex, variationIndex, weight, "
-            "tintColor, overlayColor, TerrainTexture_fk) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-            (
-                identifier,
-                json_path,
-                variant_index,
-                variation_index,
-                weight,
-                tint_color,
-                overlay_color,
-                terrain_texture_pk
-            )
-        )
+        rows.add(
+            "TerrainTextureVariation",
+            identifier=identifier,
+            jsonPath=json_path,
+            variantIndex=variant_index,
+            variationIndex=variation_index,
+            weight=weight,
+            tintColor=tint_color,
+            overlayColor=overlay_color,
+            TerrainTexture_fk=terrain_texture_ref)
 
     for terrain_texture_walker in terrain_texture_json / "texture_data" // str:
         identifier = terrain_texture_walker.parent_key
@@ -185,7 +181,7 @@ def load_terrain_texture_items(db: Connection, terrain_texture_path: Path, rp_id
             try:
                 variant_data = _get_variant_data(textures_walker)
             except ValueError:
-                return
+                return rows
             if variant_data.is_variation:
                 if TYPE_CHECKING:  # We know that from is_variation.
                     assert isinstance(variant_data.path, str)
@@ -209,7 +205,8 @@ def load_terrain_texture_items(db: Connection, terrain_texture_path: Path, rp_id
                         overlay_color=variant_data.overlay_color
                     )
         else:
-            return # Skip silently
+            return rows # Skip silently
+    return rows
 
 # Following functions are used to remove massive amount of boilerplate code
 # that would be required to parse all possible JSON paths to variations and
@@ -2,6 +2,7 @@
 from sqlite3 import Connection
 from pathlib import Path
 from ._views import dbtableview
+from ._components import FileRows, pack_component, load_component, extract_file
 
 @dbtableview(
     properties={
@@ -9,7 +10,10 @@ from ._views import dbtableview
 
         # The identifier is the path without extension. This is added to the DB to
         # make searches easier.
-        "identifier": (str, "NOT NULL")
+        "identifier": (str, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["ResourcePack"]
 )
@@ -21,33 +25,24 @@ def load_textures(db: Connection, rp_id: int):
     '''
     Loads all textures from the resource pack.
     '''
-    rp_path: Path = db.execute(
-        "SELECT path FROM ResourcePack WHERE ResourcePack_pk = ?",
-        (rp_id,)
-    ).fetchone()[0]
-
-    for texture_path in (rp_path / "textures").rglob("*.png"):
-        load_texture(db, texture_path, rp_path, rp_id)
-    for texture_path in (rp_path / "textures").rglob("*.tga"):
-        load_texture(db, texture_path, rp_path, rp_id)
-    for texture_path in (rp_path / "textures").rglob("*.jpg"):
-        load_texture(db, texture_path, rp_path, rp_id)
+    load_component(db, "textures", rp_id)
 
 def load_texture(db: Connection, texture_path: Path, rp_path: Path, rp_id: int):
     '''
     Loads a texture from the resource pack.
     '''
-    cursor = db.cursor()
+    from ._loading import insert_file_rows  # pylint: disable=import-outside-toplevel
+    insert_file_rows(
+        db, extract_file(_extract_texture, texture_path, rp_path), rp_id)
+
+@pack_component(
+    "textures", "ResourcePack", "TextureFile", "textures",
+    ["*.png", "*.tga", "*.jpg"])
+def _extract_texture(texture_path: Path, rp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of a texture file from the resource pack.
+    '''
     # TEXTURE FILE AND ITS IDENTIFIER
-    cursor.execute(
-        """
-        INSERT INTO TextureFile (
-            path, identifier, ResourcePack_fk
-        ) VALUES (?, ?, ?)
-        """,
-        (
-            texture_path.as_posix(),
-            texture_path.relative_to(rp_path).with_suffix("").as_posix(),
-            rp_id
-        )
-    )
+    return FileRows(
+        "TextureFile", texture_path,
+        identifier=texture_path.relative_to(rp_path).with_suffix("").as_posix())
@@ -2,13 +2,18 @@
 from sqlite3 import Connection
 from pathlib import Path
 import json
-from .better_json_tools import load_jsonc
+from .better_json_tools import JSONWalker
+from ._jsonc import loads_jsonc
 from .utils import split_item_name
 from ._views import dbtableview, WeakTableConnection
+from ._components import FileRows, pack_component, load_component, extract_file
 
 @dbtableview(
     properties={
-        "path": (Path, "NOT NULL")
+        "path": (Path, "NOT NULL"),
+        "mtime": (int, ""),
+        "size": (int, ""),
+        "contentHash": (str, "")
     },
     connects_to=["BehaviorPack"]
 )
@@ -63,43 +68,36 @@ def load_trade_tables(db: Connection, rp_id: int):
     '''
     Loads all trade tables from the behavior pack.
     '''
-    rp_path: Path = db.execute(
-        "SELECT path FROM BehaviorPack WHERE BehaviorPack_pk = ?",
-        (rp_id,)
-    ).fetchone()[0]
-
-    for trade_table_path in (rp_path / "trading").rglob("*.json"):
-        load_trade_table(db, trade_table_path, rp_path, rp_id)
+    load_component(db, "trade_tables", rp_id)
 
 def load_trade_table(
         db: Connection, trade_table_path: Path, rp_path: Path, rp_id: int):
     '''
     Loads a trade table from the behavior pack.
     '''
-    cursor = db.cursor()
+    from ._loading import insert_file_rows  # pylint: disable=import-outside-toplevel
+    insert_file_rows(
+        db, extract_file(_extract_trade_table, trade_table_path, rp_path),
+        rp_id)
+
+@pack_component(
+    "trade_tables", "BehaviorPack", "TradeTableFile", "trading", ["*.json"])
+def _extract_trade_table(trade_table_path: Path, rp_path: Path) -> FileRows:
+    '''
+    Extracts the rows of a trade table file from the behavior pack.
+    '''
     # LOOT TABLE FILE
-    cursor.execute(
-        "INSERT INTO TradeTableFile (path, BehaviorPack_fk) VALUES (?, ?)",
-        (trade_table_path.as_posix(), rp_id)
-    )
-    file_pk = cursor.lastrowid
+    rows = FileRows("TradeTableFile", trade_table_path)
     try:
-        trade_table_jsonc = load_jsonc(trade_table_path)
+        trade_table_jsonc = JSONWalker(loads_jsonc(rows.read_text()))
     except json.JSONDecodeError:
         # sinlently skip invalid files. The file is in db but has no data
-        return
+        return rows
 
     # LOOT TABLE
     identifier = trade_table_path.relative_to(rp_path).as_posix()
-    cursor.execute(
-        '''
-        INSERT INTO TradeTable (
-            identifier, TradeTableFile_fk
-        ) VALUES (?, ?)
-        ''',
-        (identifier, file_pk)
-    )
-    trade_table_pk = cursor.lastrowid
+    trade_table_ref = rows.add(
+        "TradeTable", identifier=identifier, TradeTableFile_fk=rows.file_ref)
 
     # LOOT TABLE ITEM FIELDS
     tier_walker = trade_table_jsonc / "tiers" // int
@@ -121,15 +119,10 @@ def load_trade_table(
         if not isinstance(iw_item_walker.data, str):
             continue
         namespace, name, data_value = split_item_name(iw_item_walker.data)
-        cursor.execute(
-            '''
-            INSERT INTO TradeTableItemField (
-                identifier, dataValue, jsonPath, TradeTable_fk
-            ) VALUES (?, ?, ?, ?)
-            ''',
-            (f'{namespace}:{name}', data_value, iw.path_str, trade_table_pk)
-        )
-        item_pk = cursor.lastrowid
+        item_ref = rows.add(
+            "TradeTableItemField",
+            identifier=f'{namespace}:{name}', dataValue=data_value,
+            jsonPath=iw.path_str, TradeTable_fk=trade_table_ref)
         # THE SPAWN EGG
         if name == 'spawn_egg':
             functions_walker = iw / "functions" // int
@@ -142,17 +135,10 @@ def load_trade_table(
                 entity_identifier = fw / "id"
                 if not isinstance(entity_identifier.data, str):
                     continue
-                cursor.execute(
-                    '''
-                    INSERT INTO TradeTableItemSpawnEggReferenceField (
-                        entityIdentifier, spawnEggIdentifier, jsonPath,
-                        TradeTableItemField_fk
-                    ) VALUES (?, ?, ?, ?)
-                    ''',
-                    (
-                        entity_identifier.data,
-                        entity_identifier.data + "_spawn_egg",
-                        fw.path_str,
-                        item_pk,
-                    )
-                )
+                rows.add(
+                    "TradeTableItemSpawnEggReferenceField",
+                    entityIdentifier=entity_identifier.data,
+                    spawnEggIdentifier=entity_identifier.data + "_spawn_egg",
+                    jsonPath=fw.path_str,
+                    TradeTableItemField_fk=item_ref)
+    return rows
@@ -0,0 +1,108 @@
+'''
+This file contains the :class:`IdentityMap` - a cache of the wrapper objects
+that lets the queries return the same object for the same row of the
+database.
+'''
+from __future__ import annotations
+from collections import OrderedDict
+from sqlite3 import Connection
+from threading import Lock
+from typing import Any
+
+from ._views import AbstractDBView
+
+# pylint: disable=protected-access
+
+class IdentityMap:
+    '''
+    A bounded cache of the wrapper objects identified by the names of their
+    tables and their primary keys. The queries that use the identity map
+    return the same wrapper object every time they find the same row, so
+    the results of its :code:`query_result` method are fetched and stored
+    once. The least recently used objects are removed when the map is full.
+
+    The map must be cleared (see :meth:`clear`) when the data in the database
+    changes. The :class:`Database` does it after loading and refreshing the
+    packs.
+    '''
+    def __init__(self, maxsize: int = 4096):
+        '''
+        :param maxsize: The maximal number of the stored wrapper objects.
+        '''
+        if maxsize < 1:
+            raise ValueError("The size of the identity map must be at least 1.")
+        self.maxsize = maxsize
+        self._wrappers: OrderedDict[tuple[str, int], AbstractDBView] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        '''The number of the rows found in the map.'''
+        self.misses = 0
+        '''The number of the rows that weren't in the map.'''
+
+    def get(
+            self, wrapper: type, connection: Connection, pk: int,
+            query_result: Any = None) -> AbstractDBView:
+        '''
+        Returns the wrapper object of the row of a table. If the object isn't
+        in the map, it's created and added to the map.
+
+        :param wrapper: The wrapper class of the table.
+        :param connection: The connection used by the new object.
+        :param pk: The primary key of the row.
+        :param query_result: The result of the :code:`query_result` method of
+            the object if it's already known or None. It replaces the result
+            cached by the object found in the map.
+        '''
+        key = (wrapper.__name__, pk)
+        with self._lock:
+            obj = self._wrappers.get(key)
+            if obj is not None:
+                self.hits += 1
+                self._wrappers.move_to_end(key)
+                if query_result is not None:
+                    # The row is fresh, the cached one could be stale
+                    obj._query_result_cache = query_result  # type: ignore
+                return obj
+            self.misses += 1
+            obj = wrapper(connection, pk)
+            obj._query_result_cache = query_result  # type: ignore
+            self._wrappers[key] = obj
+            if len(self._wrappers) > self.maxsize:
+                self._wrappers.popitem(last=False)
+            return obj
+
+    def wrap_query_row(
+            self, connection: Connection, row: tuple[Any, ...],
+            wrappers: list[tuple[type, int, int, int]]
+    ) -> tuple[AbstractDBView | None, ...]:
+        '''
+        Wraps the row of the results of a query like
+        :func:`_views.wrap_query_row`, but takes the wrapper objects from the
+        map.
+        '''
+        return tuple(
+            None if row[pk] is None else self.get(
+                wrapper, connection, row[pk],
+                row[start:stop] if start != stop else None)
+            for wrapper, pk, start, stop in wrappers
+        )
+
+    def clear(self):
+        '''
+        Removes all of the objects from the map. The objects that are still
+        used keep their cached data.
+        '''
+        with self._lock:
+            self._wrappers.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        '''
+        The part of the lookups that found the object in the map (from 0.0 to
+        1.0).
+        '''
+        total = self.hits + self.misses
+        return 0.0 if total == 0 else self.hits / total
+
+    def __len__(self) -> int:
+        return len(self._wrappers)
@@ -0,0 +1,396 @@
+'''
+This file contains the tools for loading the JSONC files used by the
+loaders.
+
+The :func:`load_jsonc` function is a faster replacement of the function with
+the same name from :mod:`better_json_tools`. Most of the files don't have
+any comments, so they're parsed with a C-accelerated JSON decoder first. The
+comments are only removed when that fails.
+
+The :func:`load_jsonc_projection` function builds a sparse copy of the
+document which contains only the values matched by the path patterns. The
+files without comments are decoded with the C-accelerated decoder and the
+matched values are selected from the result, which is much faster than
+scanning the text in Python. The files with comments are scanned, and the
+parts of the document that don't match the patterns are skipped without
+creating the Python objects for them.
+
+The patterns are tuples of keys, similar to the keys used with the `/` and
+`//` operators of :class:`JSONWalker`:
+
+- a string or an integer - matches a specific key of an object or an index
+  of an array (like the `/` operator),
+- :code:`str` - matches any key of an object,
+- :code:`int` - matches any item of an array,
+- :code:`None` - matches any key of an object or any item of an array,
+- a compiled regular expression - matches the keys of an object that
+  fully match the expression,
+- :code:`SKIP_LIST` - matches the items of an array or the value itself if
+  it's not an array,
+- :code:`SKIP_VALUE` - can only be used at the end of a pattern. It means
+  that only the existence of the value is needed. The objects and arrays
+  matched this way are replaced with empty objects and arrays.
+
+The values matched by the patterns are loaded fully. The scalar values on
+the paths of the patterns are also loaded, the keys that don't match any
+pattern are omitted and the items of the arrays that don't match any
+pattern are replaced with None to preserve the indices of the other items.
+As a result, using the same keys with the :class:`JSONWalker` of the
+projection gives the same results (including the :code:`path_str` values)
+as using them with the walker of the full document.
+'''
+from __future__ import annotations
+from json import JSONDecodeError, JSONDecoder
+from json.decoder import scanstring  # type: ignore
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+import json
+import re
+
+from .better_json_tools import JSONCDecoder, JSONWalker, SKIP_LIST
+
+class SKIP_VALUE:  # pylint: disable=invalid-name
+    '''
+    Used at the end of the patterns of :func:`load_jsonc_projection` to
+    match the values without loading them.
+    '''
+
+JSONCPatternKey = Union[str, int, type, None, re.Pattern[str]]
+JSONCPattern = tuple[JSONCPatternKey, ...]
+
+# Whitespaces and comments between the tokens
+_SPACE = re.compile(
+    r'(?:[ \t\n\r]+|//[^\n]*|/\*.*?\*/)*', re.DOTALL).match
+# Everything except of the brackets (including the strings, the comments and
+# the arrays and objects without nested arrays and objects)
+_STRING = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_FLAT = re.compile(
+    r'[^"\[\]{}/]*'
+    r'(?:(?:' + _STRING + r'|//[^\n]*|/\*.*?\*/|\[[^"\[\]{}/]*\]|'
+    r'\{[^"\[\]{}/]*(?:' + _STRING + r'[^"\[\]{}/]*)*\})[^"\[\]{}/]*)*',
+    re.DOTALL).match
+_CLOSING_BRACKETS = {"[": "]", "{": "}"}
+# The strings (group 1) and the comments
+_COMMENT = re.compile(
+    r'(' + _STRING + r')|//[^\n]*|/\*.*?\*/', re.DOTALL)
+_NOT_NEWLINE = re.compile(r'[^\n]')
+
+_fast_decoder: Optional[Callable[[str], Any]] = None
+
+_scan_json = JSONDecoder().scan_once
+_scan_jsonc = JSONCDecoder().scan_once
+
+# The states of the scanner are the pairs of the indices of the patterns
+# and the indices of the keys in the patterns.
+_States = frozenset[tuple[int, int]]
+
+def set_json_decoder(decoder: Optional[Callable[[str], Any]]):
+    '''
+    Sets a faster function used by :func:`load_jsonc` to decode the JSON
+    files before trying the :func:`json.loads` function (for example
+    :code:`orjson.loads`). The function must raise a :class:`ValueError`
+    when it can't decode the text and return the same values as
+    :func:`json.loads` otherwise. Note that some of the popular decoders
+    load the large integers as floats.
+
+    :param decoder: The decoder function or None to only use
+        :func:`json.loads`.
+    '''
+    global _fast_decoder  # pylint: disable=global-statement
+    _fast_decoder = decoder
+
+def load_jsonc(jsonc_path: Union[Path, str]) -> JSONWalker:
+    '''
+    Loads JSONC file into a JSON walker object.
+
+    :raises: :class:`json.JSONDecodeError` when the file is not a valid JSONC
+        file.
+    '''
+    if isinstance(jsonc_path, str):
+        jsonc_path = Path(jsonc_path)
+    return JSONWalker(loads_jsonc(jsonc_path.read_text(encoding='utf8')))
+
+def loads_jsonc(text: str) -> Any:
+    '''
+    Decodes a JSONC text. The text is decoded as JSON first and the comments
+    are removed only if that fails.
+
+    :raises: :class:`json.JSONDecodeError` when the text is not a valid JSONC.
+    '''
+    try:
+        return _loads_json(text)
+    except JSONDecodeError:
+        if "/" not in text:
+            raise
+    # Replace the comments with spaces to keep the error positions
+    return json.loads(_COMMENT.sub(
+        lambda match: match.group(1) or _NOT_NEWLINE.sub(" ", match.group()),
+        text))
+
+def _loads_json(text: str) -> Any:
+    '''
+    Decodes a JSON text with the decoder set by :func:`set_json_decoder`
+    or with :func:`json.loads`.
+
+    :raises: :class:`json.JSONDecodeError` when the text is not a valid
+        JSON.
+    '''
+    if _fast_decoder is not None:
+        try:
+            return _fast_decoder(text)
+        except ValueError:
+            pass  # Has comments or uses the features of the json module
+    return json.loads(text)
+
+def load_jsonc_projection(
+        jsonc_path: Union[Path, str],
+        patterns: list[JSONCPattern]) -> JSONWalker:
+    '''
+    Loads the parts of a JSONC file that match the patterns into a JSON
+    walker object (see the module documentation for the syntax of the
+    patterns).
+
+    The parts of the file that are skipped are only checked for matching
+    brackets and terminated strings and comments, so some of the invalid
+    files that would be rejected by :func:`load_jsonc` are accepted.
+
+    :raises: :class:`json.JSONDecodeError` when the file is not a valid JSONC
+        file.
+    '''
+    if isinstance(jsonc_path, str):
+        jsonc_path = Path(jsonc_path)
+    return JSONWalker(
+        project_jsonc(jsonc_path.read_text(encoding='utf8'), patterns))
+
+def project_jsonc(text: str, patterns: list[JSONCPattern]) -> Any:
+    '''
+    Returns the sparse copy of the JSONC document that contains only the
+    values that match the patterns.
+
+    :param text: The JSONC text.
+    :param patterns: The path patterns (see the module documentation).
+    '''
+    for pattern in patterns:
+        if SKIP_VALUE in pattern[:-1]:
+            raise ValueError("SKIP_VALUE can only be used at the end of a pattern.")
+    scanner = _Projection(text, patterns)
+    states = frozenset((i, 0) for i in range(len(patterns)))
+    try:
+        return scanner.project(_loads_json(text), states)
+    except JSONDecodeError:
+        pass  # Has comments or is invalid
+    value, end = scanner.value(_SPACE(text, 0).end(), states)
+    end = _SPACE(text, end).end()
+    if end != len(text):
+        raise JSONDecodeError("Extra data", text, end)
+    return value
+
+class _Projection:
+    '''
+    The state of :func:`project_jsonc`.
+    '''
+    def __init__(self, text: str, patterns: list[JSONCPattern]):
+        self.text = text
+        self.patterns = patterns
+
+    def value(self, pos: int, states: _States) -> tuple[Any, int]:
+        '''
+        Reads the value that starts at the position. Returns the value and
+        the position after it.
+        '''
+        text = self.text
+        char = text[pos:pos + 1]
+        is_list = char == "["
+        is_container = is_list or char == "{"
+        resolved, full, deeper = self.resolve(states, is_list)
+        if full or not is_container:
+            return self.full_value(pos)
+        if not deeper:
+            end = self.skip(pos)
+            return ([] if is_list else {}), end
+        if is_list:
+            return self.array(pos, resolved)
+        return self.object(pos, resolved)
+
+    def project(self, value: Any, states: _States) -> Any:
+        '''
+        Returns the sparse copy of a value that is already decoded. It's the
+        counterpart of :meth:`value` for the documents without comments.
+        '''
+        is_list = isinstance(value, list)
+        resolved, full, deeper = self.resolve(states, is_list)
+        if full or not (is_list or isinstance(value, dict)):
+            return value
+        if not deeper:
+            return [] if is_list else {}
+        if is_list:
+            items: list[Any] = []
+            for i, item in enumerate(value):
+                child_states = self.children(resolved, i)
+                items.append(
+                    self.project(item, child_states) if child_states
+                    else None)
+            return items
+        result: dict[str, Any] = {}
+        for key, item in value.items():
+            child_states = self.children(resolved, key)
+            if child_states:
+                result[key] = self.project(item, child_states)
+        return result
+
+    def resolve(
+            self, states: _States,
+            is_list: bool) -> tuple[set[tuple[int, int]], bool, bool]:
+        '''
+        Resolves the SKIP_LIST keys of the states of a value. Returns the
+        resolved states, whether any pattern matches the entire value and
+        whether any pattern continues inside of the value.
+        '''
+        patterns = self.patterns
+        # Resolve SKIP_LIST
+        resolved: set[tuple[int, int]] = set()
+        pending = list(states)
+        while pending:
+            state = pending.pop()
+            pattern_id, key_id = state
+            pattern = patterns[pattern_id]
+            if key_id < len(pattern) and pattern[key_id] is SKIP_LIST:
+                if not is_list:
+                    pending.append((pattern_id, key_id + 1))
+                    continue
+                pattern_id = -pattern_id - 1  # Marks SKIP_LIST as int
+            resolved.add((pattern_id, key_id))
+        deeper = False
+        for pattern_id, key_id in resolved:
+            if pattern_id >= 0 and key_id == len(patterns[pattern_id]):
+                return resolved, True, deeper
+            if pattern_id < 0 or patterns[pattern_id][key_id] is not SKIP_VALUE:
+                deeper = True
+        return resolved, False, deeper
+
+    def children(
+            self, states: set[tuple[int, int]],
+            key: Union[str, int]) -> _States:
+        '''
+        Returns the states of the value stored under the key.
+        '''
+        result: list[tuple[int, int]] = []
+        for pattern_id, key_id in states:
+            if pattern_id < 0:  # SKIP_LIST resolved as int
+                pattern_id = -pattern_id - 1
+                if isinstance(key, int):
+                    result.append((pattern_id, key_id + 1))
+                continue
+            pattern_key = self.patterns[pattern_id][key_id]
+            if pattern_key is None:
+                matches = True
+            elif pattern_key is str or pattern_key is int:
+                matches = isinstance(key, pattern_key)
+            elif isinstance(pattern_key, (str, int)):
+                matches = (
+                    pattern_key == key and
+                    isinstance(key, str) == isinstance(pattern_key, str))
+            elif isinstance(pattern_key, re.Pattern):
+                matches = (
+                    isinstance(key, str) and
+                    pattern_key.fullmatch(key) is not None)
+            else:  # SKIP_VALUE
+                matches = False
+            if matches:
+                result.append((pattern_id, key_id + 1))
+        return frozenset(result)
+
+    def object(
+            self, pos: int,
+            states: set[tuple[int, int]]) -> tuple[dict[str, Any], int]:
+        '''
+        Reads the object that starts at the position.
+        '''
+        text = self.text
+        result: dict[str, Any] = {}
+        pos = _SPACE(text, pos + 1).end()
+        if text[pos:pos + 1] == "}":
+            return result, pos + 1
+        while True:
+            if text[pos:pos + 1] != '"':
+                raise JSONDecodeError(
+                    "Expecting property name enclosed in double quotes",
+                    text, pos)
+            key, pos = scanstring(text, pos + 1)
+            pos = _SPACE(text, pos).end()
+            if text[pos:pos + 1] != ":":
+                raise JSONDecodeError("Expecting ':' delimiter", text, pos)
+            pos = _SPACE(text, pos + 1).end()
+            child_states = self.children(states, key)
+            if child_states:
+                result[key], pos = self.value(pos, child_states)
+            else:
+                pos = self.skip(pos)
+            pos = _SPACE(text, pos).end()
+            char = text[pos:pos + 1]
+            if char == "}":
+                return result, pos + 1
+            if char != ",":
+                raise JSONDecodeError("Expecting ',' delimiter", text, pos)
+            pos = _SPACE(text, pos + 1).end()
+
+    def array(
+            self, pos: int,
+            states: set[tuple[int, int]]) -> tuple[list[Any], int]:
+        '''
+        Reads the array that starts at the position.
+        '''
+        text = self.text
+        result: list[Any] = []
+        pos = _SPACE(text, pos + 1).end()
+        if text[pos:pos + 1] == "]":
+            return result, pos + 1
+        while True:
+            child_states = self.children(states, len(result))
+            if child_states:
+                item, pos = self.value(pos, child_states)
+            else:
+                item, pos = None, self.skip(pos)
+            result.append(item)
+            pos = _SPACE(text, pos).end()
+            char = text[pos:pos + 1]
+            if char == "]":
+                return result, pos + 1
+            if char != ",":
+                raise JSONDecodeError("Expecting ',' delimiter", text, pos)
+            pos = _SPACE(text, pos + 1).end()
+
+    def full_value(self, pos: int) -> tuple[Any, int]:
+        '''
+        Loads the entire value that starts at the position.
+        '''
+        try:
+            return _scan_json(self.text, pos)
+        except (StopIteration, JSONDecodeError):
+            pass
+        # The value is invalid or contains comments
+        try:
+            return _scan_jsonc(self.text, pos)
+        except StopIteration as err:
+            raise JSONDecodeError(
+                "Expecting value", self.text, err.value) from None
+
+    def skip(self, pos: int) -> int:
+        '''
+        Skips the value that starts at the position without loading it.
+        Returns the position after the value.
+        '''
+        text = self.text
+        char = text[pos:pos + 1]
+        if char not in _CLOSING_BRACKETS:
+            return self.full_value(pos)[1]
+        expected: list[str] = []
+        while True:
+            char = text[pos:pos + 1]
+            if char in _CLOSING_BRACKETS:
+                expected.append(_CLOSING_BRACKETS[char])
+            elif len(expected) == 0 or char != expected.pop():
+                raise JSONDecodeError("Expecting value", text, pos)
+            elif len(expected) == 0:
+                return pos + 1
+            pos = _FLAT(text, pos + 1).end()
@@ -0,0 +1,650 @@
+'''
+This file contains the tools used for loading the files of the packs into the
+database. Loading a file is split into two steps:
+
+- extraction - reading and parsing the file and collecting the rows that
+  should be inserted into the database (see :class:`FileRows` and the
+  extractors registered in the _components module),
+- insertion - inserting the collected rows into the database.
+
+The extraction doesn't need the database connection, so it can run in worker
+processes while a single writer inserts the results in the same order as the
+serial loader would. The module is imported when the packs are loaded, so it
+doesn't slow down importing the package.
+'''
+from __future__ import annotations
+from collections import deque
+from contextlib import contextmanager, ExitStack
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from sqlite3 import Connection
+from time import perf_counter, process_time
+from typing import (
+    Any, Callable, Iterator, NamedTuple, Optional, TYPE_CHECKING)
+import os
+
+from ._views import RELATION_MAP
+from ._components import (
+    PACK_COMPONENTS, FileRows, PackComponent, RowRef, hash_file)
+
+# The modules used only while loading the packs are imported when they're
+# used, so they don't slow down importing the package
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+    from ._cache import ExtractionCache
+    from ._manifest import ManifestEntry, PackManifest
+
+@dataclass
+class ComponentReport:
+    '''
+    The statistics of loading the files of a single pack component. The
+    times are in seconds. The times of the parsing are summed over all of the
+    files, so with the worker processes they can be longer than the time of
+    the loading.
+    '''
+    files_discovered: int = 0
+    '''The number of the files of the component found in the pack.'''
+
+    files_parsed: int = 0
+    '''The number of the files that were read and parsed.'''
+
+    files_cached: int = 0
+    '''The number of the files loaded from the :class:`ExtractionCache`.'''
+
+    files_skipped: int = 0
+    '''
+    The number of the files that didn't provide any data except of their
+    "*File" rows (for example the invalid JSON files or the files without
+    the identifiers). The files of the components that only have the
+    "*File" tables (like the textures) are never skipped.
+    '''
+
+    bytes_read: int = 0
+    '''
+    The total size of the parsed files. The files loaded from the cache
+    aren't read, so they're not included.
+    '''
+
+    rows: dict[str, int] = field(default_factory=dict)
+    '''The numbers of the inserted rows mapped to the names of the tables.'''
+
+    discovery_time: float = 0.0
+    discovery_cpu_time: float = 0.0
+    parse_time: float = 0.0
+    parse_cpu_time: float = 0.0
+    insert_time: float = 0.0
+    insert_cpu_time: float = 0.0
+
+    def add(self, other: ComponentReport):
+        '''
+        Adds the statistics of another report to this report.
+        '''
+        for name, value in vars(other).items():
+            if name == "rows":
+                for table, count in value.items():
+                    self.rows[table] = self.rows.get(table, 0) + count
+            else:
+                setattr(self, name, getattr(self, name) + value)
+
+@dataclass
+class LoadReport:
+    '''
+    The statistics of loading the packs, returned by the loaders of the
+    :class:`Database`.
+    '''
+    pack_pks: list[int] = field(default_factory=list)
+    '''The primary keys of the loaded packs.'''
+
+    components: dict[str, ComponentReport] = field(default_factory=dict)
+    '''The statistics of the loaded components mapped to their names.'''
+
+    seconds: float = 0.0
+    '''The total time of the loading.'''
+
+    def component(self, name: str) -> ComponentReport:
+        '''
+        Returns the statistics of the component, creating them if they don't
+        exist.
+        '''
+        report = self.components.get(name)
+        if report is None:
+            report = self.components[name] = ComponentReport()
+        return report
+
+    @property
+    def total(self) -> ComponentReport:
+        '''
+        The sum of the statistics of all of the components.
+        '''
+        total = ComponentReport()
+        for report in self.components.values():
+            total.add(report)
+        return total
+
+ProgressCallback = Callable[[str, int, int], None]
+'''
+A function called by the loaders after inserting every file with the name of
+the component, the number of the inserted files of the component and the
+number of all of the files of the component. Before the loading starts,
+it's also called with zero inserted files for every component.
+'''
+
+@lru_cache(maxsize=None)
+def _insert_sql(table: str, columns: tuple[str, ...]) -> str:
+    '''
+    Returns the INSERT statement for given table and columns.
+    '''
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' * len(columns))})")
+
+class RowBuffer:
+    '''
+    Collects the rows extracted from the files and inserts them into the
+    database in batches with one :code:`executemany` call per table.
+
+    The primary keys of the rows are assigned when the rows are added to the
+    buffer, so the foreign keys of the child rows can be resolved without
+    inserting their parents first. The buffer assumes that it's the only
+    object that inserts the rows into the tables of the components until it's
+    flushed.
+    '''
+    def __init__(self, db: Connection, batch_size: int = 10000):
+        '''
+        :param db: The database connection.
+        :param batch_size: The number of buffered rows that triggers the
+            :meth:`flush`.
+        '''
+        self.db = db
+        self.batch_size = batch_size
+        self._next_pks: dict[str, int] = {}
+        self._rows: dict[tuple[str, tuple[str, ...]], list[tuple[Any, ...]]] = {}
+        self._rows_count = 0
+
+    def _first_pk(self, table: str) -> int:
+        '''
+        Returns the first free primary key of the table. The tables use
+        AUTOINCREMENT so the keys of the deleted rows are never reused.
+        '''
+        seq = self.db.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = ?",
+            (table,)
+        ).fetchone()
+        max_pk = self.db.execute(
+            f"SELECT max({table}_pk) FROM {table}").fetchone()[0]
+        return max(
+            0 if seq is None else seq[0],
+            0 if max_pk is None else max_pk) + 1
+
+    def add(self, file_rows: FileRows, pack_pk: int) -> int:
+        '''
+        Adds the rows extracted from a file to the buffer. Returns the
+        primary key assigned to the "*File" row.
+        '''
+        next_pks, batches = self._next_pks, self._rows
+        # The primary keys of the rows are shifted by one, so PACK_REF (-1)
+        # resolves to the pack
+        pks: list[int] = [pack_pk]
+        for table, columns, values in file_rows.rows:
+            pk = next_pks.get(table)
+            if pk is None:
+                pk = self._first_pk(table)
+            next_pks[table] = pk + 1
+            pks.append(pk)
+            batch = batches.get((table, columns))
+            if batch is None:
+                batch = batches[(table, columns)] = []
+            batch.append((pk, *[
+                pks[v[0] + 1] if type(v) is RowRef else v  # pylint: disable=unidiomatic-typecheck
+                for v in values
+            ]))
+        self._rows_count += len(file_rows.rows)
+        if self._rows_count >= self.batch_size:
+            self.flush()
+        return pks[1]
+
+    def flush(self):
+        '''
+        Inserts all of the buffered rows into the database. The tables are
+        inserted in the order of their definition, so the parent rows are
+        always inserted before the rows that reference them.
+        '''
+        cursor = self.db.cursor()
+        table_order = _table_order()
+        for (table, columns), batch in sorted(
+                self._rows.items(), key=lambda item: table_order[item[0][0]]):
+            cursor.executemany(
+                _insert_sql(table, (f"{table}_pk",) + columns), batch)
+        self._rows.clear()
+        self._rows_count = 0
+
+@lru_cache(maxsize=None)
+def _table_order() -> dict[str, int]:
+    '''
+    Maps the names of the tables to their positions in the RELATION_MAP. The
+    tables are registered in the RELATION_MAP in the order of their
+    definition and they can only reference previously defined tables.
+    '''
+    return {table: i for i, table in enumerate(RELATION_MAP)}
+
+@lru_cache(maxsize=None)
+def _has_child_tables(table: str) -> bool:
+    '''
+    Checks if any table references the table with a foreign key.
+    '''
+    return any(
+        connection.is_pk and connection.columns[0] == f"{table}_pk"
+        for connection in RELATION_MAP[table].values())
+
+def insert_file_rows(db: Connection, file_rows: FileRows, pack_pk: int) -> int:
+    '''
+    Inserts the rows extracted from a file into the database. Returns the
+    primary key of the "*File" row.
+    '''
+    buffer = RowBuffer(db)
+    file_pk = buffer.add(file_rows, pack_pk)
+    buffer.flush()
+    return file_pk
+
+def get_pack_path(db: Connection, pack_table: str, pack_pk: int) -> Path:
+    '''
+    Returns the path to the pack with given primary key. The paths to the
+    packs inside of the archives are returned as :class:`ArchivePath`.
+    '''
+    row = db.execute(
+        f"SELECT path FROM {pack_table} WHERE {pack_table}_pk = ?",
+        (pack_pk,)
+    ).fetchone()
+    if row is None:
+        raise ValueError(f"{pack_table} {pack_pk} is not loaded.")
+    from ._archive import resolve_pack_path  # pylint: disable=import-outside-toplevel
+    return resolve_pack_path(row[0])  # type: ignore
+
+def _extract_file(
+        name: str, entry: ManifestEntry, pack_path: Path,
+        with_hash: bool) -> tuple[FileRows, float, float]:
+    '''
+    Extracts the rows from a file of a pack component and sets the state of
+    the file from its manifest entry (see :meth:`FileRows.set_state`).
+    Returns the rows and the wall and CPU time of the extraction. This
+    function runs in the worker processes of :func:`load_components`.
+    '''
+    start, start_cpu = perf_counter(), process_time()
+    file_rows = PACK_COMPONENTS[name].extract(entry.path, pack_path)
+    file_rows.set_state(entry.size, entry.mtime_ns, with_hash)
+    return file_rows, perf_counter() - start, process_time() - start_cpu
+
+def _extract_chunk(
+        files: list[tuple[str, ManifestEntry]], pack_path: Path,
+        with_hash: bool) -> list[tuple[FileRows, float, float]]:
+    '''
+    Extracts the rows from a chunk of the files (see :func:`_extract_file`).
+    '''
+    return [
+        _extract_file(name, entry, pack_path, with_hash)
+        for name, entry in files
+    ]
+
+def _chunk_results(
+        executor: Executor,
+        futures: deque[Future[list[tuple[FileRows, float, float]]]],
+        chunks: Iterator[list[tuple[str, ManifestEntry]]],
+        pack_path: Path,
+        with_hash: bool) -> Iterator[tuple[FileRows, float, float]]:
+    '''
+    Yields the results of the submitted chunks in order. Every time a chunk
+    is done, the next one is submitted, so the number of the chunks in
+    flight doesn't grow.
+    '''
+    try:
+        while len(futures) > 0:
+            results = futures.popleft().result()
+            chunk = next(chunks, None)
+            if chunk is not None:
+                futures.append(executor.submit(
+                    _extract_chunk, chunk, pack_path, with_hash))
+            yield from results
+    finally:
+        for future in futures:
+            future.cancel()
+
+def start_extraction(
+        jobs: list[tuple[str, ManifestEntry]], pack_path: Path,
+        cache: Optional[ExtractionCache] = None,
+        executor: Optional[Executor] = None,
+        workers: int = 1,
+        report: Optional[LoadReport] = None) -> Iterator[FileRows]:
+    '''
+    Starts extracting the rows from the files of the pack components. The
+    files are looked up in the cache and the first chunks of the remaining
+    files are submitted to the executor immediately. The following chunks
+    are submitted while iterating over the results, with at most 2 chunks
+    per worker in flight, so the extracted rows don't pile up in memory
+    when they're inserted slower than they're parsed. Returns an iterator
+    of the extracted rows in the order of the jobs.
+
+    :param jobs: The pairs of the names of the components and the manifest
+        entries of the files.
+    :param pack_path: The path to the pack.
+    :param cache: The cache of the extracted rows.
+    :param executor: The executor of the worker processes. If it's None, the
+        files are extracted in the current process while iterating over the
+        results.
+    :param workers: The number of the workers of the executor. It's used for
+        splitting the jobs into chunks.
+    :param report: The report that receives the statistics of the parsing.
+    '''
+    # The files found in the cache. None marks the files that must be parsed.
+    cached: list[Optional[FileRows]] = [None] * len(jobs)
+    relative_paths: list[str] = []
+    # The files of different packs can have the same relative paths, so the
+    # cached files are identified by the pack too
+    pack = os.path.abspath(pack_path)
+    if cache is not None:
+        # The paths in the manifest start with the path to the pack
+        prefix_length = len(str(pack_path).rstrip("/\\")) + 1
+        for i, (name, entry) in enumerate(jobs):
+            start, start_cpu = perf_counter(), process_time()
+            relative_path = str(entry.path)[prefix_length:].replace("\\", "/")
+            relative_paths.append(relative_path)
+            cached[i] = cache.get(name, pack, relative_path, entry)
+            if report is not None and cached[i] is not None:
+                component_report = report.component(name)
+                component_report.files_cached += 1
+                component_report.parse_time += perf_counter() - start
+                component_report.parse_cpu_time += process_time() - start_cpu
+    misses = [
+        job for job, file_rows in zip(jobs, cached) if file_rows is None]
+    # Only the cache needs the hashes of the files
+    with_hash = cache is not None
+    extracted: Iterator[tuple[FileRows, float, float]]
+    if executor is None or len(misses) == 0:
+        extracted = (
+            _extract_file(name, entry, pack_path, with_hash)
+            for name, entry in misses)
+    else:
+        # Small chunks keep all of the workers busy, large chunks reduce the
+        # overhead of sending the tasks between the processes.
+        chunksize = max(1, min(64, len(misses) // (workers * 4)))
+        chunks = (
+            misses[i:i + chunksize] for i in range(0, len(misses), chunksize))
+        futures = deque(
+            executor.submit(_extract_chunk, chunk, pack_path, with_hash)
+            for chunk in islice(chunks, 2 * workers))
+        extracted = _chunk_results(
+            executor, futures, chunks, pack_path, with_hash)
+
+    def merge() -> Iterator[FileRows]:
+        for i, (name, entry) in enumerate(jobs):
+            file_rows = cached[i]
+            if file_rows is None:
+                file_rows, seconds, cpu_seconds = next(extracted)
+                if report is not None:
+                    component_report = report.component(name)
+                    component_report.files_parsed += 1
+                    component_report.bytes_read += entry.size
+                    component_report.parse_time += seconds
+                    component_report.parse_cpu_time += cpu_seconds
+                if cache is not None:
+                    cache.put(name, pack, relative_paths[i], file_rows)
+            yield file_rows
+    return merge()
+
+def insert_files(
+        db: Connection, jobs: list[tuple[str, ManifestEntry]],
+        extracted: Iterator[FileRows], pack_pk: int,
+        report: Optional[LoadReport] = None,
+        progress: Optional[ProgressCallback] = None):
+    '''
+    Inserts the rows extracted from the files into the database. The rows
+    are flushed after every component, so the time of inserting them can be
+    measured separately.
+
+    :param db: The database connection.
+    :param jobs: The pairs of the names of the components and the manifest
+        entries of the files in the order of the extracted rows.
+    :param extracted: The rows extracted from the files of the jobs (see
+        :func:`start_extraction`).
+    :param pack_pk: The primary key of the pack.
+    :param report: The report that receives the statistics of the insertion.
+    :param progress: The function called after inserting every file.
+    '''
+    totals: dict[str, int] = {}
+    for name, _ in jobs:
+        totals[name] = totals.get(name, 0) + 1
+    buffer = RowBuffer(db)
+    component_report = ComponentReport()
+    current: Optional[str] = None
+    done = 0
+    for (name, _), file_rows in zip(jobs, extracted):
+        start, start_cpu = perf_counter(), process_time()
+        if name != current:
+            buffer.flush()
+            current, done = name, 0
+            if report is not None:
+                component_report = report.component(name)
+        buffer.add(file_rows, pack_pk)
+        done += 1
+        if done == totals[name]:
+            buffer.flush()
+        component_report.insert_time += perf_counter() - start
+        component_report.insert_cpu_time += process_time() - start_cpu
+        if len(file_rows.rows) == 1 and _has_child_tables(
+                file_rows.rows[0].table):
+            component_report.files_skipped += 1
+        for table, _, _ in file_rows.rows:
+            component_report.rows[table] = (
+                component_report.rows.get(table, 0) + 1)
+        if progress is not None:
+            progress(name, done, totals[name])
+    buffer.flush()
+
+def _load_files(
+        db: Connection, jobs: list[tuple[str, ManifestEntry]],
+        pack_path: Path, pack_pk: int, workers: Optional[int],
+        cache: Optional[ExtractionCache] = None,
+        report: Optional[LoadReport] = None,
+        progress: Optional[ProgressCallback] = None):
+    '''
+    Loads the files of the pack components into the database.
+
+    :param db: The database connection.
+    :param jobs: The pairs of the names of the components and the manifest
+        entries of the files in the order of loading.
+    :param pack_path: The path to the pack.
+    :param pack_pk: The primary key of the pack.
+    :param workers: The number of worker processes (see
+        :func:`load_components`).
+    :param cache: The cache of the extracted rows.
+    :param report: The report that receives the statistics of the loading.
+    :param progress: The function called after inserting every file.
+    '''
+    with ExitStack() as stack:
+        executor: Optional[Executor] = None
+        if workers is not None and workers >= 2:
+            # Importing multiprocessing is slow, so it's done only when it's
+            # used
+            from concurrent.futures import ProcessPoolExecutor  # pylint: disable=import-outside-toplevel
+            # The processes are started only if there are files to parse
+            executor = stack.enter_context(
+                ProcessPoolExecutor(max_workers=workers))
+        insert_files(
+            db, jobs,
+            start_extraction(
+                jobs, pack_path, cache, executor, workers or 1, report),
+            pack_pk, report, progress)
+
+def load_components(
+        db: Connection, names: list[str], pack_pk: int,
+        workers: Optional[int] = None,
+        cache: Optional[ExtractionCache] = None,
+        report: Optional[LoadReport] = None,
+        progress: Optional[ProgressCallback] = None):
+    '''
+    Loads multiple components of a pack into the database.
+
+    :param db: The database connection.
+    :param names: The names of the components to load in the order of loading.
+    :param pack_pk: The primary key of the pack.
+    :param workers: The number of worker processes used for reading and
+        parsing the files. If it's None or less than 2, the files are loaded
+        in the current process. Otherwise the workers extract the rows from
+        the files, and the current process inserts them in the same order as
+        the serial loader, so the primary keys are the same.
+    :param cache: The cache of the extracted rows. The files found in the
+        cache are not parsed, and the rows of the parsed files are added to
+        it.
+    :param report: The report that receives the statistics of the loading.
+    :param progress: The function called after inserting every file (see
+        :data:`ProgressCallback`).
+    '''
+    if len(names) == 0:
+        return
+    # All of the components belong to the same pack
+    pack_path = get_pack_path(
+        db, PACK_COMPONENTS[names[0]].pack_table, pack_pk)
+    # The components that share a directory are scanned together, the time
+    # of the scan is split between them
+    by_directory: dict[str, list[PackComponent]] = {}
+    for name in names:
+        component = PACK_COMPONENTS[name]
+        by_directory.setdefault(component.directory, []).append(component)
+    from ._manifest import scan_pack  # pylint: disable=import-outside-toplevel
+    manifest: PackManifest = {}
+    for components in by_directory.values():
+        start, start_cpu = perf_counter(), process_time()
+        manifest.update(scan_pack(pack_path, components))
+        if report is not None:
+            seconds = (perf_counter() - start) / len(components)
+            cpu_seconds = (process_time() - start_cpu) / len(components)
+            for component in components:
+                component_report = report.component(component.name)
+                component_report.files_discovered += len(
+                    manifest[component.name])
+                component_report.discovery_time += seconds
+                component_report.discovery_cpu_time += cpu_seconds
+    if progress is not None:
+        for name in names:
+            progress(name, 0, len(manifest[name]))
+    _load_files(
+        db,
+        [(name, entry) for name in names for entry in manifest[name]],
+        pack_path, pack_pk, workers, cache, report, progress)
+
+class RefreshResult(NamedTuple):
+    '''
+    The paths to the files that were changed by :func:`refresh_components`.
+    '''
+    added: list[Path]
+    '''The new files that were loaded into the database.'''
+
+    modified: list[Path]
+    '''The files that were removed from the database and loaded again.'''
+
+    removed: list[Path]
+    '''The files that no longer exist and were removed from the database.'''
+
+def refresh_components(
+        db: Connection, names: list[str], pack_pk: int,
+        workers: Optional[int] = None,
+        manifest: Optional[PackManifest] = None) -> RefreshResult:
+    '''
+    Updates the components of a pack that is already loaded into the
+    database. The pack is scanned again and the state of every file is
+    compared to the state stored in its "*File" row. The files with a
+    different size or modification time are loaded again, unless their
+    content matches the stored hash (the files are only hashed when they're
+    loaded with the :class:`ExtractionCache`). The rows of the modified and
+    removed files are deleted through the "ON DELETE CASCADE" foreign keys,
+    so the foreign keys must be enabled on the connection.
+
+    :param db: The database connection.
+    :param names: The names of the components to refresh.
+    :param pack_pk: The primary key of the pack.
+    :param workers: The number of worker processes (see
+        :func:`load_components`).
+    :param manifest: The result of :func:`scan_pack` for the components if
+        the pack is already scanned.
+    '''
+    result = RefreshResult([], [], [])
+    if len(names) == 0:
+        return result
+    pack_table = PACK_COMPONENTS[names[0]].pack_table
+    pack_path = get_pack_path(db, pack_table, pack_pk)
+    if manifest is None:
+        from ._manifest import scan_pack  # pylint: disable=import-outside-toplevel
+        manifest = scan_pack(
+            pack_path, [PACK_COMPONENTS[name] for name in names])
+    jobs: list[tuple[str, ManifestEntry]] = []
+    for name in names:
+        file_table = PACK_COMPONENTS[name].file_table
+        deleted_pks: list[tuple[int]] = []
+        updated_states: list[tuple[int, int, int]] = []
+        # The cast skips the converter of the Path type
+        loaded = {
+            path: (pk, mtime, size, content_hash)
+            for pk, path, mtime, size, content_hash in db.execute(
+                f"SELECT {file_table}_pk, CAST(path AS TEXT), mtime, size, "
+                f"contentHash FROM {file_table} WHERE {pack_table}_fk = ?",
+                (pack_pk,))
+        }
+        for entry in manifest[name]:
+            state = loaded.pop(entry.path.as_posix(), None)
+            if state is None:
+                result.added.append(entry.path)
+                jobs.append((name, entry))
+                continue
+            pk, mtime, size, content_hash = state
+            if mtime == entry.mtime_ns and size == entry.size:
+                continue
+            try:
+                unchanged = (
+                    content_hash is not None and
+                    hash_file(entry.path) == content_hash)
+            except OSError:
+                unchanged = False
+            if unchanged:
+                updated_states.append((entry.mtime_ns, entry.size, pk))
+                continue
+            result.modified.append(entry.path)
+            deleted_pks.append((pk,))
+            jobs.append((name, entry))
+        for pk, _, _, _ in loaded.values():
+            deleted_pks.append((pk,))
+        result.removed.extend(Path(path) for path in loaded)
+        db.executemany(
+            f"DELETE FROM {file_table} WHERE {file_table}_pk = ?",
+            deleted_pks)
+        db.executemany(
+            f"UPDATE {file_table} SET mtime = ?, size = ? "
+            f"WHERE {file_table}_pk = ?",
+            updated_states)
+    _load_files(db, jobs, pack_path, pack_pk, workers)
+    return result
+
+@contextmanager
+def refresh_transaction(db: Connection) -> Iterator[None]:
+    '''
+    A context manager that runs the :func:`refresh_components` calls in a
+    single transaction. The transaction is committed at the end, or rolled
+    back if an exception is raised.
+
+    The rows of the modified files are deleted by the ON DELETE CASCADE
+    foreign keys, so they're enabled for the duration of the transaction.
+    '''
+    # The pragma can't be changed inside of a transaction
+    db.commit()
+    foreign_keys = db.execute("PRAGMA foreign_keys").fetchone()[0]
+    if not foreign_keys:
+        db.execute("PRAGMA foreign_keys = ON")
+    try:
+        yield
+        db.commit()
+    except BaseException:
+        db.rollback()
+        raise
+    finally:
+        if not foreign_keys:
+            db.execute("PRAGMA foreign_keys = OFF")
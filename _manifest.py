@@ -0,0 +1,153 @@
+'''
+This file contains the functions for discovering the files of the pack
+components. The files of all components of a pack are found in a single pass
+over the directories of the pack using :func:`os.scandir`. The results are
+stored in a manifest that maps the names of the components to the lists of
+their files.
+'''
+from __future__ import annotations
+from fnmatch import translate
+from pathlib import Path
+from typing import Callable, Iterable, NamedTuple, Optional, TYPE_CHECKING
+import os
+import re
+
+from ._archive import ArchivePath, open_archive
+
+if TYPE_CHECKING:
+    from ._components import PackComponent
+
+IGNORED_DIRECTORIES: set[str] = {
+    ".git", ".svn", ".hg", ".vscode", ".idea", "__pycache__"}
+'''
+The names of the directories that are skipped while searching for the files
+of the pack components.
+'''
+
+class ManifestEntry(NamedTuple):
+    '''
+    A single file of a pack component found while scanning the pack.
+    '''
+    path: Path
+    '''The path to the file.'''
+
+    size: int
+    '''The size of the file in bytes.'''
+
+    mtime_ns: int
+    '''The modification time of the file in nanoseconds.'''
+
+PackManifest = dict[str, list[ManifestEntry]]
+'''
+Maps the names of the pack components to the lists of their files sorted by
+the path.
+'''
+
+def _compile_patterns(patterns: Iterable[str]) -> Callable[[str], Optional[re.Match[str]]]:
+    '''
+    Compiles the glob patterns into a single function that matches the file
+    names. Just like in :meth:`Path.glob`, the matching is case-insensitive
+    only on Windows.
+    '''
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    return re.compile(
+        "|".join(f"(?:{translate(p)})" for p in patterns), flags).match
+
+def scan_pack(
+        pack_path: Path, components: Iterable[PackComponent]) -> PackManifest:
+    '''
+    Finds the files of the pack components in the pack. Every directory of
+    the pack is visited at most once, even if it's shared by multiple
+    components (like the "textures" directory).
+
+    :param pack_path: The path to the pack. If it's an
+        :class:`ArchivePath`, the files are listed from the central directory
+        of the archive.
+    :param components: The components to search for.
+    '''
+    if isinstance(pack_path, ArchivePath):
+        return _scan_archive(pack_path, components)
+    # The entries are collected as tuples that start with the path string,
+    # because sorting the Path objects is much slower. The Path objects of the
+    # files are joined to the Path of their directory, which is faster than
+    # parsing the full paths.
+    found: dict[str, list[tuple[str, int, int, Path, str]]] = {}
+    by_directory: dict[str, list[PackComponent]] = {}
+    for component in components:
+        found[component.name] = []
+        by_directory.setdefault(component.directory, []).append(component)
+    for directory, directory_components in by_directory.items():
+        matchers = [
+            (found[c.name], _compile_patterns(c.patterns), c.recursive)
+            for c in directory_components
+        ]
+        recursive = any(c.recursive for c in directory_components)
+        stack: list[tuple[Path, bool]] = [(Path(pack_path, directory), True)]
+        while len(stack) > 0:
+            current, is_root = stack.pop()
+            try:
+                entries = os.scandir(current)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if recursive and entry.name not in IGNORED_DIRECTORIES:
+                            stack.append((current / entry.name, False))
+                        continue
+                    for files, match, component_recursive in matchers:
+                        if not is_root and not component_recursive:
+                            continue
+                        if match(entry.name):
+                            stat = entry.stat()
+                            files.append((
+                                entry.path, stat.st_size, stat.st_mtime_ns,
+                                current, entry.name))
+    return {
+        name: [
+            ManifestEntry(parent / name, size, mtime_ns)
+            for _, size, mtime_ns, parent, name in sorted(files)
+        ]
+        for name, files in found.items()
+    }
+
+def _scan_archive(
+        pack_path: ArchivePath,
+        components: Iterable[PackComponent]) -> PackManifest:
+    '''
+    Finds the files of the pack components in a pack inside of an archive.
+    The modification times of the files are the modification time of the
+    archive file (see :meth:`ArchivePath.stat`).
+    '''
+    archive = open_archive(pack_path.chain)
+    mtime_ns = os.stat(pack_path.chain[0]).st_mtime_ns
+    prefix = "" if pack_path.member == "" else f"{pack_path.member}/"
+    found: dict[str, list[tuple[str, int]]] = {}
+    matchers: list[tuple[str, list[tuple[str, int]], Callable[[str], Optional[re.Match[str]]], bool]] = []
+    for c in components:
+        found[c.name] = []
+        matchers.append((
+            f"{prefix}{c.directory}/", found[c.name],
+            _compile_patterns(c.patterns), c.recursive))
+    for info in archive.infolist():
+        if info.is_dir():
+            continue
+        name = info.filename
+        for directory, files, match, recursive in matchers:
+            if not name.startswith(directory):
+                continue
+            *subdirectories, file_name = name[len(directory):].split("/")
+            if len(subdirectories) > 0 and (
+                    not recursive or
+                    any(d in IGNORED_DIRECTORIES for d in subdirectories)):
+                continue
+            if match(file_name):
+                files.append((name, info.file_size))
+    return {
+        name: [
+            ManifestEntry(
+                ArchivePath.create(pack_path.chain, member), size, mtime_ns)
+            for member, size in sorted(files)
+        ]
+        for name, files in found.items()
+    }
@@ -0,0 +1,188 @@
+'''
+This file contains the functions that split the results of the easy queries
+into pages using the keyset pagination.
+'''
+from __future__ import annotations
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from sqlite3 import Connection
+from typing import Any, Iterator, Mapping, NamedTuple, Optional, Type, Union
+import binascii
+import hashlib
+import json
+
+from . import (
+    Database, AbstractDBView, Left, build_easy_query, _query_connection)
+from ._views import wrap_query_columns, wrap_query_row
+
+class EasyQueryPage(NamedTuple):
+    '''
+    A page of the results of an easy query returned by
+    :func:`fetch_easy_query_page`.
+    '''
+
+    rows: list[tuple[AbstractDBView | None, ...]]
+    '''The results of the query on this page.'''
+
+    token: Optional[str]
+    '''
+    The token of the next page or None if this is the last page. The token
+    is an opaque string that can only be used with the same query.
+    '''
+
+def _encode_token(sql_query: str, keys: tuple[int, ...]) -> str:
+    '''
+    Creates the token of the page that starts after the row with given
+    primary keys.
+    '''
+    data = json.dumps([_query_signature(sql_query), *keys]).encode('utf8')
+    return urlsafe_b64encode(data).decode('ascii').rstrip("=")
+
+def _decode_token(sql_query: str, token: str, size: int) -> tuple[int, ...]:
+    '''
+    Returns the primary keys stored in the token of a page.
+
+    :raises: :class:`ValueError` if the token is invalid or it belongs to a
+        different query.
+    '''
+    try:
+        data = json.loads(urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid page token.") from None
+    if (
+            not isinstance(data, list) or len(data) != size + 1 or
+            data[0] != _query_signature(sql_query) or
+            not all(type(key) is int for key in data[1:])):  # pylint: disable=unidiomatic-typecheck
+        raise ValueError("The page token doesn't belong to this query.")
+    return tuple(data[1:])
+
+def _query_signature(sql_query: str) -> str:
+    '''
+    Returns a short hash of the query stored in the tokens of its pages.
+    '''
+    return hashlib.blake2b(
+        sql_query.encode('utf8'), digest_size=6).hexdigest()
+
+def fetch_easy_query_page(
+        db: Union[Connection, Database],
+        root: Type[AbstractDBView],
+        /,
+        *tables: Type[AbstractDBView] | Left[AbstractDBView],
+        page_size: int = 100,
+        token: Optional[str] = None,
+        parameters: Optional[Mapping[str, Any]] = None,
+        chunk_size: int = 256,
+        **kwargs: Any) -> EasyQueryPage:
+    '''
+    Returns a page of the results of the easy query. The results are sorted
+    by the primary keys of the tables and every page starts with a search
+    for the row after the last row of the previous page (keyset
+    pagination), so the following pages are as fast as the first one and
+    the pages don't need an open transaction between them.
+
+    Example:
+
+    .. code-block:: python
+
+        page = fetch_easy_query_page(db, Entity, ClientEntity, page_size=50)
+        while page.token is not None:
+            page = fetch_easy_query_page(
+                db, Entity, ClientEntity, page_size=50, token=page.token)
+
+    :param db: The Database object or the sqlite3.Connection.
+    :param root: The root table of the query (see :func:`build_easy_query`).
+    :param tables: The other tables of the query.
+    :param page_size: The maximal number of the rows on the page.
+    :param token: The token of the page from the :attr:`EasyQueryPage.token`
+        of the previous page or None for the first page.
+    :param parameters: The values of the named placeholders of the query
+        (see :class:`PreparedEasyQuery`).
+    :param chunk_size: The number of the rows fetched from the database at
+        once.
+    :param kwargs: The other arguments of :func:`build_easy_query`. The
+        results can't be sorted or grouped and they must be distinct.
+    '''
+    if page_size < 1:
+        raise ValueError("The size of the page must be at least 1.")
+    for name in ("order_by", "group_by", "having"):
+        if kwargs.get(name) is not None:
+            raise ValueError(
+                f"The paginated queries don't support the '{name}' argument, "
+                "the results are sorted by the primary keys.")
+    if not kwargs.get("distinct", True):
+        raise ValueError("The results of the paginated queries must be distinct.")
+    # The primary keys of the tables joined with LEFT join can be NULL. The
+    # primary keys are positive, so they're replaced with 0.
+    keys = [
+        f"IFNULL({t.value.__name__}.{t.value.__name__}_pk, 0)"
+        if isinstance(t, Left) else f"{t.__name__}.{t.__name__}_pk"
+        for t in (root, *tables)]
+    where = kwargs.pop("where", None)
+    if where is None:
+        where = []
+    elif isinstance(where, str):
+        where = [where]
+    else:
+        where = list(where)
+    query_parameters = dict(parameters or {})
+    base_query = build_easy_query(
+        root, *tables, where=where or None, order_by=keys, **kwargs)
+    if token is not None:
+        after = _decode_token(base_query, token, len(keys))
+        placeholders = [f":_page_after_{i}" for i in range(len(keys))]
+        # The first condition lets SQLite use the index of the first key
+        where = where + [
+            f"{keys[0]} >= {placeholders[0]}",
+            f"({', '.join(keys)}) > ({', '.join(placeholders)})"]
+        query_parameters |= {
+            placeholder[1:]: key for placeholder, key in zip(placeholders, after)}
+    sql_query = build_easy_query(
+        root, *tables, where=where or None, order_by=keys, **kwargs)
+    sql_query += "\nLIMIT :_page_size"
+    # One additional row tells whether there is a next page
+    query_parameters["_page_size"] = page_size + 1
+
+    wrap = wrap_query_row
+    if isinstance(db, Database) and db.identity_map is not None:
+        wrap = db.identity_map.wrap_query_row
+    rows: list[tuple[AbstractDBView | None, ...]] = []
+    last_keys: tuple[int, ...] = ()
+    with _query_connection(db) as connection:
+        cursor = connection.execute(sql_query, query_parameters)
+        try:
+            wrappers = wrap_query_columns(cursor.description)
+            while len(rows) < page_size:
+                chunk = cursor.fetchmany(min(chunk_size, page_size - len(rows)))
+                if len(chunk) == 0:
+                    break
+                rows.extend(wrap(connection, row, wrappers) for row in chunk)
+                last_keys = tuple(
+                    0 if chunk[-1][pk] is None else chunk[-1][pk]
+                    for _, pk, _, _ in wrappers)
+            has_next = cursor.fetchone() is not None
+        finally:
+            cursor.close()
+    return EasyQueryPage(
+        rows, _encode_token(base_query, last_keys) if has_next else None)
+
+def yield_easy_query_pages(
+        db: Union[Connection, Database],
+        root: Type[AbstractDBView],
+        /,
+        *tables: Type[AbstractDBView] | Left[AbstractDBView],
+        page_size: int = 1000,
+        token: Optional[str] = None,
+        **kwargs: Any) -> Iterator[EasyQueryPage]:
+    '''
+    Yields the pages of the results of the easy query starting from the page
+    of the token (see :func:`fetch_easy_query_page`). Every page is fetched
+    with a separate query, so the database isn't locked between the pages
+    and the token of any page can be used to resume the iteration later.
+    The arguments are the same as for :func:`fetch_easy_query_page`.
+    '''
+    while True:
+        page = fetch_easy_query_page(
+            db, root, *tables, page_size=page_size, token=token, **kwargs)
+        yield page
+        if page.token is None:
+            return
+        token = page.token
@@ -0,0 +1,88 @@
+'''
+This file contains the :class:`ReadConnectionPool` - a pool of read-only
+connections used for querying the database from multiple threads.
+'''
+from __future__ import annotations
+from contextlib import contextmanager
+from sqlite3 import Connection
+from threading import BoundedSemaphore, Lock
+from typing import Callable, Iterator, Optional
+
+class ReadConnectionPool:
+    '''
+    A bounded pool of read-only connections to a database file. The
+    connections are opened when they're needed for the first time and
+    reused later. The database should use the WAL journal mode, so the
+    readers don't wait for the writer and see the last committed state of
+    the database.
+    '''
+    def __init__(self, connect: Callable[[], Connection], size: int = 4):
+        '''
+        :param connect: The function that opens a new read-only connection.
+        :param size: The maximal number of the connections.
+        '''
+        if size < 1:
+            raise ValueError("The size of the pool must be at least 1.")
+        self.size = size
+        self._connect = connect
+        self._semaphore = BoundedSemaphore(size)
+        self._lock = Lock()
+        self._idle: list[Connection] = []
+        self._closed = False
+
+    def acquire(self, timeout: Optional[float] = None) -> Connection:
+        '''
+        Takes a connection from the pool. Waits until a connection is
+        available if all of them are in use. The connection must be returned
+        with :meth:`release`.
+
+        :param timeout: The maximal time of waiting in seconds or None to wait
+            without a limit.
+        :raises: :class:`TimeoutError` when the timeout ends.
+        '''
+        if not self._semaphore.acquire(timeout=timeout):
+            raise TimeoutError("All of the read connections are in use.")
+        try:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("The pool is closed.")
+                if len(self._idle) > 0:
+                    return self._idle.pop()
+            return self._connect()
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    def release(self, connection: Connection):
+        '''
+        Returns the connection to the pool.
+        '''
+        with self._lock:
+            if self._closed:
+                connection.close()
+            else:
+                self._idle.append(connection)
+        self._semaphore.release()
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[Connection]:
+        '''
+        A context manager that takes a connection from the pool and returns
+        it at the end (see :meth:`acquire`).
+        '''
+        connection = self.acquire(timeout)
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def close(self):
+        '''
+        Closes the idle connections. The connections that are in use are
+        closed when they're released.
+        '''
+        with self._lock:
+            self._closed = True
+            for connection in self._idle:
+                connection.close()
+            self._idle.clear()
@@ -0,0 +1,59 @@
+'''
+This file contains the :class:`PreparedEasyQuery` class - an easy query
+built once and run many times with different values of its parameters.
+'''
+from __future__ import annotations
+from sqlite3 import Connection
+from typing import Any, Iterator, Mapping, Optional, Type, Union
+
+from . import (
+    Database, AbstractDBView, Left, build_easy_query, yield_from_any_query)
+
+class PreparedEasyQuery:
+    '''
+    An easy query with named placeholders (like :code:`:identifier`) in its
+    SQL clauses. The query is built once (see :func:`build_easy_query`) and
+    run with different values of the placeholders. The SQL code of the query
+    doesn't change, so the statement prepared by SQLite is reused from the
+    statement cache of the connection (see :data:`CACHED_STATEMENTS`)
+    instead of being prepared again every time the query runs.
+
+    Example:
+
+    .. code-block:: python
+
+        query = PreparedEasyQuery(
+            Entity, ClientEntity,
+            where=["Entity.identifier = :identifier"])
+        for entity, client_entity in query.execute(
+                db, {"identifier": "minecraft:pig"}):
+            print(client_entity.identifier)
+    '''
+    def __init__(
+            self,
+            root: Type[AbstractDBView],
+            *tables: Type[AbstractDBView] | Left[AbstractDBView],
+            **kwargs: Any):
+        '''
+        The arguments are the same as for :func:`build_easy_query`.
+        '''
+        self.sql_code = build_easy_query(root, *tables, **kwargs)
+        '''The SQL code of the query.'''
+
+    def execute(
+            self, db: Union[Connection, Database],
+            parameters: Optional[Mapping[str, Any]] = None
+    ) -> Iterator[tuple[AbstractDBView | None, ...]]:
+        '''
+        Runs the query and yields its results wrapped in the wrapper classes
+        (see :func:`yield_from_any_query`). The query can run on any
+        connection to a sqlite_bedrock_packs database.
+
+        :param db: The Database object or the sqlite3.Connection.
+        :param parameters: The values of the named placeholders of the query.
+        '''
+        return yield_from_any_query(
+            db, self.sql_code, {} if parameters is None else parameters)
+
+    def __repr__(self) -> str:
+        return f"PreparedEasyQuery({self.sql_code!r})"
@@ -39,6 +39,24 @@ generated by the decorators while creating the database tables. It's used to
 build the easy queries.
 '''
 
+_relation_map_version = 0
+
+def relation_map_changed():
+    '''
+    Marks the RELATION_MAP as changed, which invalidates the caches of the
+    join paths and the queries of the easy queries. It's called by the
+    functions of this module that modify the map. It must be called after
+    modifying the map directly.
+    '''
+    global _relation_map_version  # pylint: disable=global-statement
+    _relation_map_version += 1
+
+def relation_map_version() -> int:
+    '''
+    Returns the number that changes every time the RELATION_MAP is changed.
+    '''
+    return _relation_map_version
+
 WRAPPER_CLASSES: dict[str, type] = {}
 '''
 The WRAPPER_CLASSES maps all of the wrapper classes annotaded with the
@@ -47,6 +65,62 @@ It's used in the easy queries to determine which wrapper class to use as a
 result of the query.
 '''
 
+def wrap_query_columns(
+        description: Any) -> list[tuple[type, int, int, int]]:
+    '''
+    Returns the instructions for wrapping the rows of a query generated by
+    the 'build_easy_query' function based on the description of its cursor.
+    For every wrapper class, returns a tuple with the class, the index of the
+    column with the primary key and the range of the indices of the
+    columns with its hydrated 'query_result' (empty if the query isn't
+    hydrated).
+
+    The primary key columns are named after the tables. The hydrated columns
+    are named '<table>.<column>' and follow the primary key column of their
+    table.
+    '''
+    wrappers: list[tuple[type, int, int, int]] = []
+    names = [d[0] for d in description]
+    i = 0
+    while i < len(names):
+        wrapper = WRAPPER_CLASSES[names[i]]
+        start = i + 1
+        stop = start
+        prefix = f"{names[i]}."
+        while stop < len(names) and names[stop].startswith(prefix):
+            stop += 1
+        if start != stop and stop - start != len(
+                wrapper.query_result_columns):  # type: ignore
+            raise ValueError(
+                f"The query selects {stop - start} hydrated columns of "
+                f"'{names[i]}' instead of "
+                f"{len(wrapper.query_result_columns)}.")  # type: ignore
+        wrappers.append((wrapper, i, start, stop))
+        i = stop
+    return wrappers
+
+def wrap_query_row(
+        connection: sqlite3.Connection, row: tuple[Any, ...],
+        wrappers: list[tuple[type, int, int, int]]
+) -> tuple[AbstractDBView | None, ...]:
+    '''
+    Wraps the row of the results of a query in the wrapper classes using the
+    instructions from 'wrap_query_columns'. The hydrated columns are
+    stored in the 'query_result' cache of the wrappers, so accessing their
+    properties doesn't query the database.
+    '''
+    result: list[AbstractDBView | None] = []
+    for wrapper, pk, start, stop in wrappers:
+        value = row[pk]
+        if value is None:
+            result.append(None)
+            continue
+        obj = wrapper(connection, value)
+        if start != stop:
+            obj._query_result_cache = row[start:stop]
+        result.append(obj)
+    return tuple(result)
+
 def validate_weak_connections():
     '''
     Runs at the end of importing the sqlite_bedrock_packs package. It validates the
@@ -78,6 +152,28 @@ def add_reverse_connections():
                     columns=(v2.columns[1], v2.columns[0]),
                     is_pk=v[other_table].is_pk
                 )
+    relation_map_changed()
+
+def build_weak_connection_indexes_script() -> str:
+    '''
+    Runs at the end of importing the sqlite_bedrock_packs package, after
+    adding the reverse connections. Returns the SQL script that creates the
+    indexes on the columns used by the weak connections on both sides of the
+    connections. The script can't be a part of the build scripts of the
+    tables because the weak connections can reference the tables that are
+    created later.
+    '''
+    # Dict instead of a set to keep the order of the indexes stable
+    columns: dict[tuple[str, str], None] = {}
+    for this_table, v in RELATION_MAP.items():
+        for other_table, v2 in v.items():
+            if v2.is_pk:
+                continue
+            columns[(this_table, v2.columns[0])] = None
+            columns[(other_table, v2.columns[1])] = None
+    return "".join(
+        f"CREATE INDEX {table}_{column}_weak ON {table} ({column});\n"
+        for table, column in columns)
 
 
 class AbstractDBView(ABC):
@@ -88,6 +184,7 @@ class AbstractDBView(ABC):
     if TYPE_CHECKING:
         __name__: str
         build_script: str
+        query_result_columns: tuple[str, ...]
 
 class _DbTableView:
     '''
@@ -227,6 +324,7 @@ class _DbTableView:
                 columns=(this_table_column, other_table_column),
                 is_pk=False
             )
+        relation_map_changed()
 
     def assert_valid(self):
         '''
@@ -239,7 +337,8 @@ class _DbTableView:
         # Check if the original function doesn't define properties that are
         # required for the decorated class to work
         for reserved_name in [
-                "query_result", "_query_result_cache", "build_script"]:
+                "query_result", "_query_result_cache", "build_script",
+                "query_result_columns"]:
             if reserved_name in self.cls.__dict__:
                 raise ValueError(
                     "Unable to decorate class because it already defines "
@@ -343,16 +442,24 @@ class _DbTableView:
         init.__qualname__ = f"{self.cls.__name__}.__init__"
         return init
 
-    def generate_query_result(self):
+    def generate_query_result_columns(self) -> tuple[str, ...]:
         '''
-        Creates the query_result method of the class.
+        Returns the names of the columns returned by the query_result method
+        in the order used by the properties of the class.
         '''
-        _query_result_columns = ", ".join(
+        return tuple(
             [f"{name}_fk" for name in self.connects_to] +
             list(self.properties) +
             list(self.enum_properties)
         )
 
+    def generate_query_result(self):
+        '''
+        Creates the query_result method of the class.
+        '''
+        _query_result_columns = ", ".join(
+            self.generate_query_result_columns())
+
         def query_result(self_: Any):
             if self_._query_result_cache is None:
                 self_._query_result_cache = self_.connection.execute(
@@ -429,6 +536,8 @@ class _DbTableView:
         annotations_["query_result"] = "Callable[[], tuple[Any, ...]]"
         # Add the annotations of the build_script method
         annotations_["build_script"] = str
+        # Add the annotations of the query_result_columns attribute
+        annotations_["query_result_columns"] = "tuple[str, ...]"
         return annotations_
 
     def __call__(self) -> AbstractDBView:
@@ -455,6 +564,7 @@ class _DbTableView:
                 "__module__": "sqlite_bedrock_packs.views",
                 "__annotations__": annotations_,
                 "query_result": query_result,
+                "query_result_columns": self.generate_query_result_columns(),
                 "build_script": build_script
             } | properties | {
                 # Add the attributes of the original class
@@ -501,7 +611,9 @@ def dbtableview(
     the 'query_result' method.
 
     The class has a class attribute called 'build_script' that contains the SQL
-    script to create the table.
+    script to create the table and a class attribute called
+    'query_result_columns' with the names of the columns returned by the
+    'query_result' method.
 
     :param properties: A dictionary that defines the properties of the table.
         The keys are the names of the properties to be added to the class and
@@ -0,0 +1,218 @@
+'''
+This file contains the :class:`PackWatcher` class which keeps the database in
+sync with the files of the loaded packs.
+'''
+from __future__ import annotations
+from pathlib import Path
+from sqlite3 import Connection, OperationalError
+from threading import Event, RLock, Thread
+from typing import Callable, Collection, Optional
+
+from ._components import PACK_COMPONENTS, PackComponent
+from ._loading import RefreshResult, refresh_components, refresh_transaction
+from ._manifest import PackManifest, scan_pack
+from ._archive import resolve_pack_path
+
+class PackWatcher:
+    '''
+    Polls the directories of the resource packs and behavior packs loaded
+    into the database in a background thread and refreshes the components
+    of the packs whose files changed.
+
+    Every poll scans the packs with :func:`scan_pack` and compares the sizes
+    and modification times of the files with the previous scan. The changes
+    are applied after a poll that doesn't find any new changes, so a burst of
+    changes (for example saving multiple files at once) is applied in a
+    single transaction.
+
+    The changes are applied in the transactions started by the watcher. If
+    the database is locked by another connection, the changes stay pending
+    and are applied by one of the following polls.
+
+    Without the :code:`connect` function, the watcher shares the connection
+    with the rest of the application (for example for the in-memory
+    databases, which can't be opened twice). The changes are applied while
+    holding the :attr:`lock`, and they're postponed while the connection is
+    inside of a transaction, so the watcher never commits or rolls back the
+    changes of the application. The other threads that write to the shared
+    connection must hold the :attr:`lock`, and the lock can be used to read
+    the database without seeing a partially applied refresh.
+    '''
+    def __init__(
+            self, db: Connection, interval: float = 0.25,
+            on_change: Optional[Callable[[dict[Path, RefreshResult]], None]] = None,
+            workers: Optional[int] = None,
+            names: Optional[Collection[str]] = None,
+            connect: Optional[Callable[[], Connection]] = None):
+        '''
+        :param db: The database connection. It must be created with
+            :code:`check_same_thread=False`.
+        :param interval: The time between the polls in seconds.
+        :param on_change: A function called from the watcher thread after
+            applying the changes. It receives a dictionary that maps the
+            paths to the packs to the results of the refresh.
+        :param workers: The number of worker processes used for parsing the
+            modified files (see :func:`load_components`).
+        :param names: The names of the pack components to watch. It should
+            match the components used for loading the packs, otherwise the
+            missing components are loaded by the first refresh. By default,
+            all of the components are watched.
+        :param connect: A function that opens the connection used by the
+            watcher for applying the changes. The connection is opened by the
+            first poll and closed when the watcher stops. By default, the
+            changes are applied on :code:`db`.
+        '''
+        self.db = db
+        self.interval = interval
+        self.on_change = on_change
+        self.workers = workers
+        self.names: list[str] = [
+            name for name in PACK_COMPONENTS if names is None or name in names]
+        '''The names of the watched pack components.'''
+        self.lock = RLock()
+        self.error: Optional[BaseException] = None
+        '''
+        The exception raised while applying the changes. The watcher stops
+        when it happens.
+        '''
+        self._connect = connect
+        self._writer: Optional[Connection] = None
+        self._stop_event = Event()
+        self._thread: Optional[Thread] = None
+        # Maps (pack table, pack pk) to the last scan of the pack
+        self._manifests: dict[tuple[str, int], PackManifest] = {}
+        # The components with unapplied changes
+        self._pending: dict[tuple[str, int], set[str]] = {}
+
+    @property
+    def running(self) -> bool:
+        '''
+        Whether the watcher thread is running.
+        '''
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> PackWatcher:
+        '''
+        Starts the watcher thread. The first poll only records the state of
+        the packs, the changes made before it are not applied.
+        '''
+        if self.running:
+            raise RuntimeError("The watcher is already running.")
+        self._stop_event.clear()
+        self.error = None
+        self._manifests.clear()
+        self._pending.clear()
+        self.poll()
+        self._thread = Thread(
+            target=self._run, name="PackWatcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        '''
+        Stops the watcher thread and waits until it ends.
+        '''
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> PackWatcher:
+        if not self.running:
+            self.start()
+        return self
+
+    def __exit__(self, *args: object):
+        self.stop()
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self.error = e
+                return
+
+    def _connection(self) -> Connection:
+        '''
+        Returns the connection used for applying the changes.
+        '''
+        if self._connect is None:
+            return self.db
+        if self._writer is None:
+            self._writer = self._connect()
+        return self._writer
+
+    def _packs(self, db: Connection) -> list[tuple[str, int, Path]]:
+        '''
+        Returns the table names, primary keys and paths of the loaded packs.
+        '''
+        packs: list[tuple[str, int, Path]] = []
+        for pack_table in ("ResourcePack", "BehaviorPack"):
+            for pk, path in db.execute(
+                    f"SELECT {pack_table}_pk, CAST(path AS TEXT) "
+                    f"FROM {pack_table}"):
+                packs.append((pack_table, pk, resolve_pack_path(path)))
+        return packs
+
+    def poll(self) -> dict[Path, RefreshResult]:
+        '''
+        Scans the packs once. If there are no new changes since the previous
+        poll, applies the pending changes. This function is called
+        periodically by the watcher thread, but it can also be called
+        manually when the thread is not running.
+
+        Returns the results of the applied refreshes.
+        '''
+        db = self._connection()
+        with self.lock:
+            packs = self._packs(db)
+        components: dict[str, list[PackComponent]] = {}
+        for name in self.names:
+            component = PACK_COMPONENTS[name]
+            components.setdefault(component.pack_table, []).append(component)
+        changed = False
+        manifests: dict[tuple[str, int], PackManifest] = {}
+        for pack_table, pk, path in packs:
+            key = (pack_table, pk)
+            manifest = scan_pack(path, components.get(pack_table, []))
+            manifests[key] = manifest
+            previous = self._manifests.get(key)
+            if previous is None:
+                # A new pack, only record its state
+                continue
+            for name, files in manifest.items():
+                if files != previous[name]:
+                    self._pending.setdefault(key, set()).add(name)
+                    changed = True
+        self._manifests = manifests
+        if changed or len(self._pending) == 0:
+            return {}
+        paths = {(pack_table, pk): path for pack_table, pk, path in packs}
+        results: dict[Path, RefreshResult] = {}
+        with self.lock:
+            if db.in_transaction:
+                # The transaction of the application, the changes are
+                # applied after it ends
+                return {}
+            try:
+                with refresh_transaction(db):
+                    for key, names in self._pending.items():
+                        if key not in paths:
+                            continue  # The pack was removed from the database
+                        results[paths[key]] = refresh_components(
+                            db, [name for name in self.names if name in names],
+                            key[1], workers=self.workers,
+                            manifest=manifests[key])
+            except OperationalError as e:
+                if "locked" not in str(e):
+                    raise
+                # Another connection is writing, try again in the next poll
+                return {}
+        self._pending.clear()
+        if self.on_change is not None:
+            self.on_change(results)
+        return results
@@ -0,0 +1,68 @@
+'''
+Compares the time of loading the JSON files of the packs with the
+:func:`load_jsonc` function from :mod:`better_json_tools` and the one used by
+the loaders.
+
+Usage::
+
+    python -m sqlite_bedrock_packs.benchmarks.load_jsonc RP_PATH BP_PATH
+'''
+from __future__ import annotations
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable
+import json
+import sys
+
+from ..better_json_tools import load_jsonc as bjt_load_jsonc
+from .._jsonc import load_jsonc
+from .._components import PACK_COMPONENTS
+from .._manifest import scan_pack
+from .. import Database  # pylint: disable=unused-import
+
+def _time(function: Callable[[Path], Any], paths: list[Path]) -> float:
+    '''
+    Returns the best time of loading all of the files out of 3 attempts.
+    '''
+    best = float("inf")
+    for _ in range(3):
+        start = perf_counter()
+        for path in paths:
+            try:
+                function(path)
+            except json.JSONDecodeError:
+                pass
+        best = min(best, perf_counter() - start)
+    return best
+
+def main(rp_path: Path, bp_path: Path):
+    '''
+    Prints the average time of loading a file of every pack component.
+    '''
+    print(
+        f"{'component':<24}{'files':>7}{'old [us]':>12}{'new [us]':>12}"
+        f"{'speedup':>9}")
+    total_old = total_new = 0.0
+    for name, component in PACK_COMPONENTS.items():
+        pack_path = rp_path if component.pack_table == "ResourcePack" else bp_path
+        paths = [
+            entry.path
+            for entry in scan_pack(pack_path, [component])[name]
+            if entry.path.suffix == ".json"]
+        if len(paths) == 0:
+            continue
+        old = _time(bjt_load_jsonc, paths)
+        new = _time(load_jsonc, paths)
+        total_old += old
+        total_new += new
+        print(
+            f"{name:<24}{len(paths):>7}{old / len(paths) * 1e6:>12.1f}"
+            f"{new / len(paths) * 1e6:>12.1f}{old / new:>8.2f}x")
+    print(f"{'total':<24}{'':>7}{total_old:>11.3f}s{total_new:>11.3f}s"
+          f"{total_old / total_new:>8.2f}x")
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print(__doc__)
+        sys.exit(1)
+    main(Path(sys.argv[1]), Path(sys.argv[2]))
@@ -0,0 +1,159 @@
+'''
+The shared fixtures of the tests.
+
+The repository is the sqlite_bedrock_packs package itself, so it's imported
+from the parent directory of the tests under the name of the package,
+regardless of the name of the directory. The tests are skipped if the
+package can't be imported (for example when the better_json_tools submodule
+isn't checked out).
+'''
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Optional
+import importlib.util
+import json
+import sqlite3
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def _import_package():
+    if "sqlite_bedrock_packs" in sys.modules:
+        return
+    spec = importlib.util.spec_from_file_location(
+        "sqlite_bedrock_packs", ROOT / "__init__.py",
+        submodule_search_locations=[str(ROOT)])
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["sqlite_bedrock_packs"] = module
+    try:
+        spec.loader.exec_module(module)
+    except ImportError:
+        # pytest.importorskip in the test modules reports the error
+        for name in list(sys.modules):
+            if name.split(".")[0] == "sqlite_bedrock_packs":
+                del sys.modules[name]
+
+_import_package()
+
+def write_json(path: Path, data: Any, comment: Optional[str] = None):
+    '''
+    Writes a JSON file. If the comment is provided, it's added at the start
+    of the file, so the file is only valid as JSONC.
+    '''
+    path.parent.mkdir(parents=True, exist_ok=True)
+    text = json.dumps(data, indent=2)
+    if comment is not None:
+        text = f"// {comment}\n{text}"
+    path.write_text(text, encoding="utf8")
+
+def build_packs(root: Path, count: int = 3) -> tuple[Path, Path]:
+    '''
+    Creates a small resource pack and behavior pack with the files of most
+    of the pack components. Returns the paths to the RP and the BP.
+    '''
+    rp, bp = root / "RP", root / "BP"
+    for i in range(count):
+        comment = "a comment" if i % 2 == 0 else None
+        write_json(rp / "models" / "entity" / f"e{i}.geo.json", {
+            "format_version": "1.12.0",
+            "minecraft:geometry": [{
+                "description": {"identifier": f"geometry.e{i}"},
+                "bones": [{"name": "body", "cubes": [{"size": [1, 1, 1]}]}],
+            }],
+        }, comment)
+        write_json(rp / "entity" / f"e{i}.json", {
+            "format_version": "1.10.0",
+            "minecraft:client_entity": {"description": {
+                "identifier": f"test:e{i}",
+                "textures": {"default": f"textures/entity/e{i}"},
+                "geometry": {"default": f"geometry.e{i}"},
+                "render_controllers": ["controller.render.default"],
+            }},
+        }, comment)
+        (rp / "textures" / "entity").mkdir(parents=True, exist_ok=True)
+        (rp / "textures" / "entity" / f"e{i}.png").write_bytes(b"PNG" * (i + 1))
+        write_json(rp / "particles" / f"p{i}.json", {
+            "particle_effect": {"description": {"identifier": f"test:p{i}"}},
+        })
+        write_json(bp / "entities" / f"e{i}.json", {
+            "minecraft:entity": {
+                "description": {"identifier": f"test:e{i}"},
+                "components": {
+                    "minecraft:loot": {"table": f"loot_tables/l{i}.json"},
+                },
+            },
+        }, comment)
+        write_json(bp / "loot_tables" / f"l{i}.json", {
+            "pools": [{"entries": [{"type": "item", "name": f"test:i{i}"}]}],
+        })
+        write_json(bp / "items" / f"i{i}.json", {
+            "format_version": "1.16.100",
+            "minecraft:item": {"description": {"identifier": f"test:i{i}"}},
+        })
+    write_json(rp / "render_controllers" / "default.json", {
+        "format_version": "1.8.0",
+        "render_controllers": {"controller.render.default": {
+            "geometry": "Geometry.default",
+            "textures": ["Texture.default"],
+        }},
+    })
+    (rp / "models" / "broken.json").write_text("{ not json", encoding="utf8")
+    return rp, bp
+
+@pytest.fixture
+def packs(tmp_path: Path) -> tuple[Path, Path]:
+    '''
+    The paths to a new resource pack and behavior pack (see
+    :func:`build_packs`).
+    '''
+    return build_packs(tmp_path / "packs")
+
+@pytest.fixture
+def db(packs: tuple[Path, Path]) -> Any:  # pylint: disable=redefined-outer-name
+    '''
+    A new in-memory database with the packs from the :func:`packs` fixture.
+    '''
+    rp, bp = packs
+    sbp = pytest.importorskip("sqlite_bedrock_packs")
+    database = sbp.Database.create()
+    database.load_rp(rp)
+    database.load_bp(bp)
+    return database
+
+def dump(db: sqlite3.Connection, skip: tuple[str, ...] = ()) -> dict[str, list[tuple[Any, ...]]]:
+    '''
+    Returns all of the rows of all of the tables of the database sorted by
+    their primary keys.
+
+    :param skip: The names of the columns that aren't returned.
+    '''
+    result: dict[str, list[tuple[Any, ...]]] = {}
+    for (table,) in db.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' "
+            "AND name NOT LIKE 'sqlite_%' ORDER BY name").fetchall():
+        columns = [
+            row[1] for row in db.execute(f"PRAGMA table_info({table})")
+            if row[1] not in skip]
+        if len(columns) == 0:
+            columns = ["1"]  # Only the number of the rows is compared
+        result[table] = [
+            tuple(row) for row in db.execute(
+                f"SELECT {', '.join(columns)} FROM {table} ORDER BY 1")]
+    return result
+
+def identifiers(db: Any, table: str) -> set[str]:
+    '''
+    Returns the identifiers of the rows of the table of the database.
+    '''
+    return {
+        row[0] for row in db.connection.execute(
+            f"SELECT identifier FROM {table}")}
+
+def row_ids(row: tuple[Any, ...]) -> tuple[Optional[int], ...]:
+    '''
+    Returns the primary keys of the objects of a row of an easy query.
+    '''
+    return tuple(None if obj is None else obj.id for obj in row)
@@ -0,0 +1,72 @@
+'''
+The tests of loading the packs from the .mcpack, .mcaddon and .zip archives.
+'''
+from __future__ import annotations
+from pathlib import Path
+import zipfile
+
+import pytest
+
+sbp = pytest.importorskip("sqlite_bedrock_packs")
+
+# pylint: disable=wrong-import-position
+from conftest import identifiers
+
+def _zip_directory(archive: zipfile.ZipFile, directory: Path, prefix: str):
+    for path in sorted(directory.rglob("*")):
+        if path.is_file():
+            archive.write(path, prefix + path.relative_to(directory).as_posix())
+
+def test_archive_loading(packs: tuple[Path, Path], tmp_path: Path):
+    rp, bp = packs
+    mcpack = tmp_path / "rp.mcpack"
+    with zipfile.ZipFile(mcpack, "w") as archive:
+        _zip_directory(archive, rp, "")
+    mcaddon = tmp_path / "addon.mcaddon"
+    with zipfile.ZipFile(mcaddon, "w") as archive:
+        _zip_directory(archive, rp, "RP/")
+        archive.writestr(
+            "RP/manifest.json", '{"modules": [{"type": "resources"}]}')
+        _zip_directory(archive, bp, "BP/")
+        archive.writestr(
+            "BP/manifest.json", '{"modules": [{"type": "data"}]}')
+
+    expected = sbp.Database.create()
+    expected.load_rp(rp)
+    expected.load_bp(bp)
+    for rp_archive in (mcpack, mcaddon):
+        db = sbp.Database.create()
+        db.load_rp(rp_archive)
+        db.load_bp(mcaddon)
+        for table in ("Geometry", "ClientEntity", "Entity", "LootTable"):
+            assert identifiers(db, table) == identifiers(expected, table)
+        texture = db.connection.execute(
+            "SELECT identifier FROM TextureFile ORDER BY 1").fetchone()[0]
+        assert texture == "textures/entity/e0"
+        pack_path = db.connection.execute(
+            "SELECT path FROM ResourcePack").fetchone()[0]
+        assert isinstance(pack_path, Path)
+        assert db.refresh_rp(1) == sbp.RefreshResult([], [], [])
+
+def test_archive_manifests_with_comments(
+        packs: tuple[Path, Path], tmp_path: Path):
+    rp, bp = packs
+    mcaddon = tmp_path / "addon.mcaddon"
+    with zipfile.ZipFile(mcaddon, "w") as archive:
+        _zip_directory(archive, rp, "RP/")
+        archive.writestr(
+            "RP/manifest.json",
+            '// The resource pack\n{"modules": [{"type": "resources"}]}')
+        _zip_directory(archive, bp, "BP/")
+        archive.writestr(
+            "BP/manifest.json",
+            '{"modules": [/* The behavior pack */ {"type": "data"}]}')
+    packs_found = sbp.find_archive_packs(mcaddon)
+    assert [(type_, path.name) for type_, path in packs_found] == [
+        ("bp", "BP"), ("rp", "RP")]
+    db = sbp.Database.create()
+    db.load_rp(mcaddon)
+    db.load_bp(mcaddon)
+    for table in ("ResourcePack", "BehaviorPack"):
+        assert db.connection.execute(
+            f"SELECT count(*) FROM {table}").fetchone()[0] == 1
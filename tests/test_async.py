@@ -0,0 +1,86 @@
+'''
+The tests of the :class:`AsyncDatabase`.
+'''
+from __future__ import annotations
+from pathlib import Path
+import asyncio
+import threading
+import time
+
+import pytest
+
+sbp = pytest.importorskip("sqlite_bedrock_packs")
+
+def _count_query(count: int) -> str:
+    '''
+    Returns a query that counts to the number, which is slow for the large
+    numbers.
+    '''
+    return (
+        "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n "
+        f"WHERE i < {count}) SELECT count(*) FROM n")
+
+def test_queries_use_the_read_pool(packs: tuple[Path, Path], tmp_path: Path):
+    rp, _ = packs
+
+    async def main():
+        async with sbp.AsyncDatabase.create(
+                tmp_path / "packs.db", readers=2) as db:
+            await db.load_rp(rp)
+            await db.commit()
+            assert db.database.read_pool is not None
+            assert db.database.read_pool.size == 2
+            entities = await db.easy_query(sbp.ClientEntity)
+            assert sorted(e.identifier for e, in entities) == [
+                "test:e0", "test:e1", "test:e2"]
+            rows = [
+                row async for row in db.yield_from_easy_query(
+                    sbp.ClientEntity, chunk_size=1)]
+            assert len(rows) == 3
+            threads = await asyncio.gather(*(
+                db.read(lambda _: threading.current_thread().name)
+                for _ in range(4)))
+            assert all(
+                name.startswith("AsyncDatabaseReader") for name in threads)
+    asyncio.run(main())
+
+def test_cancelling_a_read_interrupts_its_query(tmp_path: Path):
+    async def main():
+        async with sbp.AsyncDatabase.create(
+                tmp_path / "packs.db", readers=1) as db:
+            await db.commit()
+            task = asyncio.create_task(db.read(
+                lambda c: c.execute(_count_query(10**9)).fetchone()))
+            await asyncio.sleep(0.1)
+            start = time.perf_counter()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            assert time.perf_counter() - start < 5
+            # The connection returned to the pool can be used again
+            assert await db.read(
+                lambda c: c.execute("SELECT 1").fetchone()[0]) == 1
+    asyncio.run(main())
+
+def test_cancelling_a_read_doesnt_interrupt_the_writer():
+    # Without the read pool, the queries share the connection of the writer
+    async def main():
+        async with sbp.AsyncDatabase.create() as db:
+            assert db.database.read_pool is None
+            started = threading.Event()
+
+            def write(database: sbp.Database) -> int:
+                started.set()
+                return database.connection.execute(
+                    _count_query(3 * 10**6)).fetchone()[0]
+            writing = asyncio.create_task(db.write(write))
+            await asyncio.get_running_loop().run_in_executor(
+                None, started.wait)
+            reading = asyncio.create_task(
+                db.read(lambda c: c.execute("SELECT 1").fetchone()))
+            await asyncio.sleep(0.05)
+            reading.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await reading
+            assert await writing == 3 * 10**6
+    asyncio.run(main())
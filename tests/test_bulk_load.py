@@ -0,0 +1,61 @@
+'''
+The tests of :meth:`Database.bulk_load`.
+'''
+from __future__ import annotations
+from pathlib import Path
+
+import pytest
+
+sbp = pytest.importorskip("sqlite_bedrock_packs")
+
+# pylint: disable=wrong-import-position
+from conftest import identifiers
+
+def test_bulk_load_rolls_back_on_error(
+        packs: tuple[Path, Path], tmp_path: Path):
+    rp, _ = packs
+    db = sbp.Database.create(tmp_path / "packs.db")
+    indexes = db.connection.execute(
+        "SELECT count(*) FROM sqlite_master WHERE type = 'index'"
+        ).fetchone()[0]
+    with pytest.raises(RuntimeError):
+        with db.bulk_load():
+            db.load_rp(rp)
+            raise RuntimeError()
+    assert db.connection.execute(
+        "SELECT count(*) FROM ResourcePack").fetchone()[0] == 0
+    assert db.connection.execute(
+        "SELECT count(*) FROM sqlite_master WHERE type = 'index'"
+        ).fetchone()[0] == indexes
+    assert db.connection.execute(
+        "PRAGMA journal_mode").fetchone()[0] == "delete"
+
+    with db.bulk_load():
+        db.load_rp(rp)
+    assert identifiers(db, "ClientEntity") == {
+        "test:e0", "test:e1", "test:e2"}
+    db.close()
+
+def test_bulk_load_with_a_read_pool(packs: tuple[Path, Path], tmp_path: Path):
+    rp, bp = packs
+    db = sbp.Database.create(tmp_path / "packs.db", readers=2)
+    db.load_bp(bp)
+
+    def count(table) -> int:
+        return len(list(sbp.yield_from_easy_query(db, table)))
+    assert count(sbp.Entity) == 3
+    with pytest.raises(RuntimeError):
+        with db.bulk_load():
+            db.load_rp(rp)
+            raise RuntimeError()
+    assert count(sbp.ClientEntity) == 0
+
+    with db.bulk_load():
+        db.load_rp(rp)
+        # The readers see the state from before the bulk load
+        assert count(sbp.ClientEntity) == 0
+        assert count(sbp.Entity) == 3
+    assert count(sbp.ClientEntity) == 3
+    assert db.connection.execute(
+        "PRAGMA journal_mode").fetchone()[0] == "wal"
+    db.close()
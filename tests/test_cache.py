@@ -0,0 +1,149 @@
+'''
+The tests of the :class:`ExtractionCache`.
+'''
+from __future__ import annotations
+from pathlib import Path
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sbp = pytest.importorskip("sqlite_bedrock_packs")
+
+from conftest import dump, write_json  # pylint: disable=wrong-import-position
+
+def _load(rp: Path, bp: Path, cache: Path, **kwargs):
+    db = sbp.Database.create()
+    reports = [
+        db.load_rp(rp, cache=cache, **kwargs),
+        db.load_bp(bp, cache=cache, **kwargs)]
+    return db, reports
+
+def test_cached_load_matches_the_load_without_cache(
+        packs: tuple[Path, Path], tmp_path: Path):
+    rp, bp = packs
+    expected = sbp.Database.create()
+    expected.load_rp(rp)
+    expected.load_bp(bp)
+    cache = tmp_path / "cache.db"
+    # The files are only hashed when they're loaded with the cache
+    skip = ("contentHash",)
+    for workers in (None, 2):
+        db, _ = _load(rp, bp, cache, workers=workers)
+        assert dump(db.connection, skip) == dump(expected.connection, skip)
+
+    db, reports = _load(rp, bp, cache)
+    assert reports[1].components["entities"].files_cached == 3
+    assert dump(db.connection, skip) == dump(expected.connection, skip)
+
+def test_modified_files_are_parsed_again(
+        packs: tuple[Path, Path], tmp_path: Path):
+    rp, bp = packs
+    cache = tmp_path / "cache.db"
+    _load(rp, bp, cache)
+    write_json(bp / "entities" / "e0.json", {"minecraft:entity": {
+        "description": {"identifier": "test:modified"}}})
+    db, reports = _load(rp, bp, cache)
+    entities = reports[1].components["entities"]
+    assert (entities.files_parsed, entities.files_cached) == (1, 2)
+    assert reports[1].components["loot_tables"].files_parsed == 0
+    identifiers = {
+        row[0] for row in db.connection.execute("SELECT identifier FROM Entity")}
+    assert identifiers == {"test:modified", "test:e1", "test:e2"}
+
+def test_rows_of_other_extractor_versions_are_removed(
+        packs: tuple[Path, Path], tmp_path: Path):
+    rp, bp = packs
+    cache = tmp_path / "cache.db"
+    _load(rp, bp, cache)
+    connection = sqlite3.connect(cache)
+    connection.execute(
+        "UPDATE ExtractedRows SET version = 'old' WHERE component = 'entities'")
+    connection.commit()
+    connection.close()
+
+    _, reports = _load(rp, bp, cache)
+    assert reports[1].components["entities"].files_cached == 0
+    assert reports[1].components["entities"].files_parsed == 3
+    assert reports[1].components["loot_tables"].files_parsed == 0
+
+@pytest.mark.parametrize("module_name", [
+    "sqlite_bedrock_packs._jsonc", "sqlite_bedrock_packs.better_json_tools"])
+def test_extractor_version_depends_on_the_json_parsers(
+        module_name: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    extractor_version = sbp._cache.extractor_version  # pylint: disable=protected-access
+    extractor_version.cache_clear()
+    version = extractor_version("entities")
+    # A copy of the sources of the module with a modified file
+    module = sys.modules[module_name]
+    source = Path(module.__file__)
+    copy = tmp_path / source.parent.name
+    copy.mkdir()
+    for path in source.parent.glob("*.py"):
+        (copy / path.name).write_bytes(path.read_bytes())
+    modified = copy / source.name
+    modified.write_bytes(modified.read_bytes() + b"\n# modified\n")
+    monkeypatch.setattr(module, "__file__", str(copy / source.name))
+    extractor_version.cache_clear()
+    try:
+        assert extractor_version("entities") != version
+    finally:
+        extractor_version.cache_clear()
+
+def test_files_are_looked_up_without_hashing_them(
+        packs: tuple[Path, Path], tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch):
+    rp, bp = packs
+    cache = tmp_path / "cache.db"
+
+    def hash_file(path: Path) -> str:
+        hashed.append(path)
+        return sbp._components.hash_file(path)  # pylint: disable=protected-access
+    hashed: list[Path] = []
+    monkeypatch.setattr(sbp._cache, "hash_file", hash_file)  # pylint: disable=protected-access
+    _load(rp, bp, cache)
+    _load(rp, bp, cache)
+    assert hashed == []
+
+    # Only the files with a different state are hashed. The cached rows are
+    # used if the content didn't change.
+    touched = bp / "entities" / "e1.json"
+    stat = touched.stat()
+    os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    _, reports = _load(rp, bp, cache)
+    assert hashed == [touched]
+    assert reports[1].components["entities"].files_cached == 3
+    _load(rp, bp, cache)
+    assert hashed == [touched]
+
+def test_caches_with_an_old_schema_are_cleared(tmp_path: Path):
+    path = tmp_path / "cache.db"
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE ExtractedRows (component, path, contentHash, version, "
+        "rows, PRIMARY KEY (component, path, contentHash))")
+    connection.execute(
+        "INSERT INTO ExtractedRows VALUES ('entities', 'a', 'b', 'c', 'd')")
+    connection.commit()
+    connection.close()
+    with sbp.ExtractionCache(path) as cache:
+        assert cache.connection.execute(
+            "SELECT count(*) FROM ExtractedRows").fetchone()[0] == 0
+
+def test_files_of_different_packs_are_cached_separately(tmp_path: Path):
+    # Same relative path, size and modification time, different content
+    cache = tmp_path / "cache.db"
+    identifiers = []
+    for name, identifier in (("a", "test:aaa"), ("b", "test:bbb")):
+        rp = tmp_path / name
+        path = rp / "entity" / "e.json"
+        write_json(path, {"minecraft:client_entity": {
+            "description": {"identifier": identifier}}})
+        os.utime(path, ns=(0, 10**18))
+        for _ in range(2):
+            db = sbp.Database.create()
+            db.load_rp(rp, cache=cache)
+            identifiers.append(db.connection.execute(
+                "SELECT identifier FROM ClientEntity").fetchone()[0])
+    assert identifiers == ["test:aaa", "test:aaa", "test:bbb", "test:bbb"]
@@ -0,0 +1,20 @@
+'''
+The tests of :func:`fetch_columns`.
+'''
+from __future__ import annotations
+
+import pytest
+
+sbp = pytest.importorskip("sqlite_bedrock_packs")
+
+def test_fetch_columns_returns_the_selected_columns(db):
+    columns = ["Geometry.identifier", "ClientEntity.ClientEntity_pk"]
+    expected = sorted(
+        (geometry.identifier, entity.id)
+        for entity, geometry in sbp.yield_from_easy_query(
+            db, sbp.ClientEntity, sbp.Geometry))
+    for hydrate in (False, True):
+        result = sbp.fetch_columns(
+            db, sbp.ClientEntity, sbp.Geometry, columns=columns,
+            hydrate=hydrate)
+        assert sorted(zip(*(result[column] for column in columns))) == expected
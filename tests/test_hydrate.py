@@ -0,0 +1,43 @@
+'''
+The tests of the easy queries with :code:`hydrate=True`.
+'''
+from __future__ import annotations
+from pathlib import Path
+
+import pytest
+
+sbp = pytest.importorskip("sqlite_bedrock_packs")
+
+def _properties(obj) -> dict:
+    return {name: getattr(obj, name) for name in type(obj).query_result_columns}
+
+def test_hydrated_objects_dont_run_queries(db):
+    tables = (sbp.ClientEntity, sbp.Left(sbp.Geometry))
+    expected = [
+        [_properties(obj) for obj in row]
+        for row in sbp.yield_from_easy_query(db, *tables)]
+    rows = list(sbp.yield_from_easy_query(db, *tables, hydrate=True))
+    queries: list[str] = []
+    db.connection.set_trace_callback(queries.append)
+    try:
+        hydrated = [[_properties(obj) for obj in row] for row in rows]
+    finally:
+        db.connection.set_trace_callback(None)
+    assert queries == []
+    assert hydrated == expected
+    assert len(expected) == 3
+
+def test_hydrated_queries_refresh_the_objects_of_the_identity_map(
+        packs: tuple[Path, Path]):
+    rp, _ = packs
+    db = sbp.Database.create(identity_map_size=16)
+    db.load_rp(rp, include=["client_entities"])
+    first = {
+        row[0].id: row[0]
+        for row in sbp.yield_from_easy_query(
+            db, sbp.ClientEntity, hydrate=True)}
+    # The data changes without clearing the identity map
+    db.connection.execute("UPDATE ClientEntity SET identifier = 'test:changed'")
+    rows = list(sbp.yield_from_easy_query(db, sbp.ClientEntity, hydrate=True))
+    assert all(row[0] is first[row[0].id] for row in rows)
+    assert {row[0].identifier for row in rows} == {"test:changed"}
@@ -0,0 +1,128 @@
+'''
+The tests of the JSONC projection scanner (:func:`project_jsonc`).
+'''
+from __future__ import annotations
+from json import JSONDecodeError
+import json
+import re
+
+import pytest
+
+pytest.importorskip("sqlite_bedrock_packs")
+
+# pylint: disable=wrong-import-position
+from sqlite_bedrock_packs._jsonc import (
+    SKIP_VALUE, loads_jsonc, project_jsonc)
+from sqlite_bedrock_packs.better_json_tools import SKIP_LIST
+
+DOCUMENT = r'''
+// A comment before the document
+{
+    /* A block comment with "quotes" and [brackets] */
+    "format_version": "1.12.0",
+    "minecraft:geometry": [
+        {
+            "description": {
+                "identifier": "geometry.a", // The identifier
+                "texture_width": 64
+            },
+            "bones": [
+                {"name": "\"quoted\" \\ [not a bracket] {", "cubes": [[1, [2]], []]},
+                {"name": "bóne // not a comment", "cubes": []}
+            ]
+        },
+        {
+            "description": {"identifier": "geometry.b"},
+            "bones": "/* not a comment */"
+        }
+    ],
+    "nested": [[[1, 2], [3, {"deep": [4]}]], [], [[5]]],
+    "skipped": {"a": [1, {"b": "}]"}], "c": null}
+}
+'''
+
+PATTERNS = [
+    ("minecraft:geometry", int, "description", "identifier"),
+    ("minecraft:geometry", int, "bones", int, "name"),
+    ("minecraft:geometry", int, "bones", SKIP_LIST, "cubes", int, int),
+    ("minecraft:geometry", 1, "bones"),
+    ("nested", int, int, int),
+    ("nested", 0, 1, 1, "deep", 0),
+    ("nested", None, None),
+    (re.compile("format_.*"),),
+    (str, SKIP_VALUE),
+    ("skipped", "a", 1, "b"),
+]
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_projection_matches_the_full_document(pattern: tuple):
+    full = loads_jsonc(DOCUMENT)
+    projection = project_jsonc(DOCUMENT, [pattern])
+    expected = _select(full, pattern)
+    assert len(expected) > 0
+    assert _select(projection, pattern) == expected
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_projection_of_decoded_document_matches_the_scanner(pattern: tuple):
+    # The document without comments is decoded before the projection, the
+    # document with comments is scanned
+    text = json.dumps(loads_jsonc(DOCUMENT))
+    assert project_jsonc(text, [pattern]) == project_jsonc(DOCUMENT, [pattern])
+
+def _select(data, pattern: tuple) -> list:
+    '''
+    Returns the paths and the values matched by the pattern.
+    '''
+    matches = [((), data)]
+    for key in pattern:
+        if key is SKIP_VALUE:
+            return [path for path, _ in matches]
+        result = []
+        for path, value in matches:
+            if key is SKIP_LIST:
+                if isinstance(value, list):
+                    result.extend(
+                        (path + (i,), item) for i, item in enumerate(value))
+                else:
+                    result.append((path, value))
+                continue
+            if isinstance(value, dict):
+                items = list(value.items())
+            elif isinstance(value, list):
+                items = list(enumerate(value))
+            else:
+                continue
+            for child_key, child in items:
+                if key is None or (key in (str, int) and isinstance(child_key, key)):
+                    matches_key = True
+                elif isinstance(key, re.Pattern):
+                    matches_key = (
+                        isinstance(child_key, str) and
+                        key.fullmatch(child_key) is not None)
+                else:
+                    matches_key = child_key == key
+                if matches_key:
+                    result.append((path + (child_key,), child))
+        matches = result
+    return matches
+
+def test_projection_skips_values_without_loading_them():
+    projection = project_jsonc(DOCUMENT, [("skipped", SKIP_VALUE)])
+    assert projection == {"skipped": {}}
+    projection = project_jsonc(
+        DOCUMENT, [("minecraft:geometry", 1, "description", "identifier")])
+    # The items that don't match keep their indices
+    assert projection["minecraft:geometry"][0] is None
+    assert projection["minecraft:geometry"][1] == {
+        "description": {"identifier": "geometry.b"}}
+
+@pytest.mark.parametrize("text", [
+    '{"a": [1, 2}',
+    '{"a": "unterminated}',
+    '{"a": 1} extra',
+    '{"a": /* unterminated comment}',
+    '{"a" 1}',
+])
+def test_projection_rejects_invalid_documents(text: str):
+    with pytest.raises(JSONDecodeError):
+        project_jsonc(text, [("b",)])
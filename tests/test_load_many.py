@@ -0,0 +1,77 @@
+'''
+The tests of :meth:`Database.load_many` and of the extraction of the files
+in chunks.
+'''
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+sbp = pytest.importorskip("sqlite_bedrock_packs")
+
+# pylint: disable=wrong-import-position
+from sqlite_bedrock_packs._components import PACK_COMPONENTS
+from sqlite_bedrock_packs._loading import start_extraction
+from sqlite_bedrock_packs._manifest import scan_pack
+from conftest import build_packs, dump
+
+def test_load_many_loads_the_same_rows_as_load_rp_and_bp(
+        packs: tuple[Path, Path]):
+    rp, bp = packs
+    expected = sbp.Database.create()
+    expected.load_rp(rp)
+    expected.load_bp(bp)
+    for workers in (None, 2):
+        db = sbp.Database.create()
+        results = db.load_many([("rp", rp), ("bp", bp)], workers=workers)
+        assert [result.error for result in results] == [None, None]
+        assert [result.pk for result in results] == [1, 1]
+        assert dump(db.connection) == dump(expected.connection)
+
+class _CountingExecutor(ThreadPoolExecutor):
+    '''
+    An executor that counts the submitted tasks.
+    '''
+    def __init__(self, max_workers: int):
+        super().__init__(max_workers=max_workers)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+def test_extraction_limits_the_chunks_in_flight(tmp_path: Path):
+    _, bp = build_packs(tmp_path, 50)
+    jobs = [
+        (name, entry)
+        for name, files in scan_pack(
+            bp, [PACK_COMPONENTS[name] for name in ("entities", "bp_items")]
+        ).items()
+        for entry in files
+    ]
+    with _CountingExecutor(2) as executor:
+        extracted = start_extraction(jobs, bp, executor=executor, workers=2)
+        assert executor.submitted == 4
+        first = next(extracted)
+        assert executor.submitted == 5
+        rows = [first, *extracted]
+    # 100 files in chunks of 12
+    assert executor.submitted == 9
+    assert [file_rows.rows for file_rows in rows] == [
+        file_rows.rows for file_rows in start_extraction(jobs, bp)]
+
+def test_load_many_reports_the_missing_packs(
+        packs: tuple[Path, Path], tmp_path: Path):
+    rp, _ = packs
+    db = sbp.Database.create()
+    missing = tmp_path / "missing"
+    # A file that isn't an archive isn't a pack either
+    not_a_pack = rp / "models" / "broken.json"
+    results = db.load_many([("rp", missing), ("rp", rp), ("bp", not_a_pack)])
+    assert [result.pk for result in results] == [None, 1, None]
+    assert isinstance(results[0].error, FileNotFoundError)
+    assert isinstance(results[2].error, FileNotFoundError)
+    assert results[1].error is None
+    assert db.connection.execute(
+        "SELECT count(*) FROM BehaviorPack").fetchone()[0] == 0
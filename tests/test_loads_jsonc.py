@@ -0,0 +1,57 @@
+'''
+The tests of decoding the JSONC files with :func:`loads_jsonc`.
+'''
+from __future__ import annotations
+from json import JSONDecodeError
+import json
+
+import pytest
+
+pytest.importorskip("sqlite_bedrock_packs")
+
+# pylint: disable=wrong-import-position
+from sqlite_bedrock_packs._jsonc import loads_jsonc, set_json_decoder
+
+DOCUMENT = r'''
+// A comment before the document
+{
+    /* A block comment with "quotes" */
+    "name": "bóne // not a comment", // The name
+    "bones": "/* not a comment */",
+    "escaped": "\" // not a comment"
+}
+'''
+
+def test_loads_jsonc_removes_comments():
+    assert loads_jsonc(DOCUMENT) == {
+        "name": "bóne // not a comment",
+        "bones": "/* not a comment */",
+        "escaped": "\" // not a comment",
+    }
+    with pytest.raises(JSONDecodeError):
+        loads_jsonc('{"a": 1,, // comment\n}')
+
+def test_errors_have_the_positions_of_the_original_text():
+    text = '/* a\nb */ {"a": [1,, 2]}'
+    with pytest.raises(JSONDecodeError) as error:
+        loads_jsonc(text)
+    assert (error.value.lineno, error.value.colno) == (2, 15)
+    assert text[error.value.pos] == ","
+
+def test_json_decoder_is_tried_first():
+    texts: list[str] = []
+
+    def decoder(text: str):
+        texts.append(text)
+        if "/" in text:
+            raise ValueError()
+        return {"decoded": True}
+    set_json_decoder(decoder)
+    try:
+        assert loads_jsonc('{"a": 1}') == {"decoded": True}
+        # The comments are removed when the decoder fails
+        assert loads_jsonc('{"a": 1} // comment') == {"a": 1}
+        assert texts == ['{"a": 1}', '{"a": 1} // comment']
+    finally:
+        set_json_decoder(None)
+    assert loads_jsonc('{"a": 1}') == json.loads('{"a": 1}')
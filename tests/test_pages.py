@@ -0,0 +1,41 @@
+'''
+The tests of the keyset-paginated easy queries.
+'''
+from __future__ import annotations
+
+import pytest
+
+sbp = pytest.importorskip("sqlite_bedrock_packs")
+
+from conftest import row_ids  # pylint: disable=wrong-import-position
+
+def test_pages_return_all_of_the_results_once(db):
+    full = sorted(row_ids(row) for row in sbp.yield_from_easy_query(
+        db, sbp.ClientEntity, sbp.Left(sbp.Geometry)))
+    pages = list(sbp.yield_easy_query_pages(
+        db, sbp.ClientEntity, sbp.Left(sbp.Geometry), page_size=2))
+    assert [len(page.rows) for page in pages] == [2, 1]
+    assert pages[-1].token is None
+    assert [row_ids(row) for page in pages for row in page.rows] == full
+
+def test_page_token_resumes_the_query(db):
+    first = sbp.fetch_easy_query_page(db, sbp.Entity, page_size=1)
+    assert first.token is not None
+    second = sbp.fetch_easy_query_page(
+        db, sbp.Entity, page_size=1, token=first.token)
+    rest = list(sbp.yield_easy_query_pages(
+        db, sbp.Entity, page_size=1, token=first.token))
+    assert [row_ids(row) for row in second.rows] == [row_ids(row) for row in rest[0].rows]
+    ids = [row[0].id for page in [first, *rest] for row in page.rows]
+    assert ids == sorted(ids) and len(ids) == 3
+
+def test_foreign_and_invalid_page_tokens_are_rejected(db):
+    token = sbp.fetch_easy_query_page(db, sbp.Entity, page_size=1).token
+    with pytest.raises(ValueError):
+        sbp.fetch_easy_query_page(db, sbp.Entity, sbp.LootTable, token=token)
+    with pytest.raises(ValueError):
+        sbp.fetch_easy_query_page(
+            db, sbp.Entity, where=["Entity.identifier != ''"], token=token)
+    for invalid in ("", "@@@", token[:-4] + "AAAA"):
+        with pytest.raises(ValueError):
+            sbp.fetch_easy_query_page(db, sbp.Entity, token=invalid)
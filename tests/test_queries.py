@@ -0,0 +1,64 @@
+'''
+The tests of the easy queries.
+'''
+from __future__ import annotations
+
+import pytest
+
+sbp = pytest.importorskip("sqlite_bedrock_packs")
+
+from conftest import row_ids  # pylint: disable=wrong-import-position
+
+def test_weak_connections_are_indexed(db):
+    indexes = {
+        row[0] for row in db.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' "
+            "AND name LIKE '%\\_weak' ESCAPE '\\'")}
+    assert "Entity_identifier_weak" in indexes
+    assert "ClientEntity_identifier_weak" in indexes
+    # Both sides of every weak connection have an index
+    relation_map = sbp._views.RELATION_MAP  # pylint: disable=protected-access
+    for table, connections in relation_map.items():
+        for connection in connections.values():
+            if not connection.is_pk:
+                assert f"{table}_{connection.columns[0]}_weak" in indexes
+    plan = " ".join(
+        row[3] for row in db.connection.execute(
+            "EXPLAIN QUERY PLAN " +
+            sbp.build_easy_query(sbp.Entity, sbp.ClientEntity)))
+    assert "_identifier_weak" in plan
+
+def test_easy_query_cache_info_counts_the_hits():
+    sbp.clear_easy_query_cache()
+    assert sbp.easy_query_cache_info() == (0, 0, 0, 0)
+    query = sbp.build_easy_query(sbp.Entity, sbp.ClientEntity)
+    assert sbp.build_easy_query(sbp.Entity, sbp.ClientEntity) == query
+    info = sbp.easy_query_cache_info()
+    assert (info.query_hits, info.query_misses) == (1, 1)
+    assert info.query_hit_rate == 0.5
+    # A different query reuses the path between the tables
+    join_path_hits = info.join_path_hits
+    sbp.build_easy_query(
+        sbp.Entity, sbp.ClientEntity, where=["Entity.identifier = 'a'"])
+    info = sbp.easy_query_cache_info()
+    assert (info.query_hits, info.query_misses) == (1, 2)
+    assert info.join_path_hits > join_path_hits
+    sbp.clear_easy_query_cache()
+    assert sbp.easy_query_cache_info().query_misses == 0
+
+def test_prepared_query_runs_with_different_parameters(db):
+    query = sbp.PreparedEasyQuery(
+        sbp.Entity, sbp.ClientEntity,
+        where=["Entity.identifier = :identifier"])
+    for identifier in ("test:e0", "test:e2", "test:missing"):
+        expected = [
+            row_ids(row) for row in sbp.yield_from_easy_query(
+                db, sbp.Entity, sbp.ClientEntity,
+                where=[f"Entity.identifier = '{identifier}'"])]
+        assert len(expected) == (0 if identifier == "test:missing" else 1)
+        for connection in (db, db.connection):
+            rows = query.execute(connection, {"identifier": identifier})
+            assert [row_ids(row) for row in rows] == expected
+    # The values are bound to the placeholder, so the SQL code of the query
+    # stays the same and SQLite reuses the prepared statement
+    assert ":identifier" in query.sql_code
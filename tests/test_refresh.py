@@ -0,0 +1,82 @@
+'''
+The tests of refreshing the loaded packs.
+'''
+from __future__ import annotations
+from pathlib import Path
+import hashlib
+import os
+
+import pytest
+
+sbp = pytest.importorskip("sqlite_bedrock_packs")
+
+# pylint: disable=wrong-import-position
+from conftest import dump, identifiers, write_json
+
+def test_refresh_applies_added_modified_and_removed_files(
+        packs: tuple[Path, Path]):
+    rp, bp = packs
+    db = sbp.Database.create()
+    bp_pk = db.load_bp(bp).pack_pks[0]
+    assert db.refresh_bp(bp_pk) == sbp.RefreshResult([], [], [])
+
+    modified = bp / "entities" / "e0.json"
+    write_json(modified, {"minecraft:entity": {
+        "description": {"identifier": "test:modified"}}})
+    removed = bp / "loot_tables" / "l1.json"
+    removed.unlink()
+    added = bp / "entities" / "new.json"
+    write_json(added, {"minecraft:entity": {
+        "description": {"identifier": "test:new"}}})
+    # Only the modification time changes. The file isn't hashed without
+    # the cache, so it's loaded again.
+    touched = bp / "entities" / "e2.json"
+    stat = touched.stat()
+    os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    result = db.refresh_bp(bp_pk)
+    assert result.added == [added]
+    assert result.modified == [modified, touched]
+    assert result.removed == [removed]
+    assert identifiers(db, "Entity") == {
+        "test:modified", "test:e1", "test:e2", "test:new"}
+    assert db.connection.execute(
+        "SELECT count(*) FROM LootTableFile").fetchone()[0] == 2
+
+    fresh = sbp.Database.create()
+    fresh.load_bp(bp)
+    # The primary keys of the refreshed rows are different
+    skip = tuple(
+        f"{table}_{key}"
+        for table in sbp.RELATION_MAP for key in ("pk", "fk"))
+    for table, rows in dump(fresh.connection, skip).items():
+        assert sorted(dump(db.connection, skip)[table]) == sorted(rows), table
+    assert db.refresh_bp(bp_pk) == sbp.RefreshResult([], [], [])
+
+def test_files_are_hashed_only_with_a_cache(
+        packs: tuple[Path, Path], tmp_path: Path):
+    rp, _ = packs
+    path = rp / "entity" / "e0.json"
+    texture = rp / "textures" / "entity" / "e1.png"
+    for cache in (None, tmp_path / "cache.db"):
+        db = sbp.Database.create()
+        rp_pk = db.load_rp(rp, cache=cache).pack_pks[0]
+        mtime, size, content_hash = db.connection.execute(
+            "SELECT mtime, size, contentHash FROM ClientEntityFile "
+            "WHERE path = ?", (path.as_posix(),)).fetchone()
+        assert (mtime, size) == (path.stat().st_mtime_ns, path.stat().st_size)
+        assert content_hash == (
+            None if cache is None
+            else hashlib.sha1(path.read_bytes()).hexdigest())
+        assert db.connection.execute(
+            "SELECT count(*) FROM TextureFile WHERE contentHash IS NULL"
+            ).fetchone()[0] == 3
+
+        # The files without a hash are compared by their state, the hashed
+        # files are only loaded again if their content changed
+        for touched in (path, texture):
+            stat = touched.stat()
+            os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        expected = [texture] if cache is not None else [path, texture]
+        assert sorted(db.refresh_rp(rp_pk).modified) == sorted(expected)
+        assert db.refresh_rp(rp_pk) == sbp.RefreshResult([], [], [])
@@ -0,0 +1,49 @@
+'''
+The tests of the :class:`LoadReport` and of the progress callbacks of the
+loaders.
+'''
+from __future__ import annotations
+from pathlib import Path
+
+import pytest
+
+sbp = pytest.importorskip("sqlite_bedrock_packs")
+
+def test_load_report_counts_the_files(packs: tuple[Path, Path]):
+    rp, _ = packs
+    report = sbp.Database.create().load_rp(rp, include=["geometries"])
+    geometries = report.components["geometries"]
+    # 3 geometries and the broken file
+    assert geometries.files_discovered == 4
+    assert geometries.files_parsed == 4
+    assert geometries.files_skipped == 1
+    assert geometries.rows["Geometry"] == 3
+
+def test_load_report_counts_only_the_parsed_bytes(
+        packs: tuple[Path, Path], tmp_path: Path):
+    rp, _ = packs
+    size = sum(
+        path.stat().st_size for path in (rp / "models").rglob("*.json"))
+    cache = tmp_path / "cache.db"
+    reports = [
+        sbp.Database.create().load_rp(
+            rp, include=["geometries"], cache=cache)
+        for _ in range(2)
+    ]
+    assert reports[0].components["geometries"].bytes_read == size
+    # The cached files aren't read
+    assert reports[1].components["geometries"].files_cached == 4
+    assert reports[1].components["geometries"].bytes_read == 0
+
+def test_progress_is_reported_for_every_file(packs: tuple[Path, Path]):
+    rp, _ = packs
+    calls: list[tuple[str, int, int]] = []
+    sbp.Database.create().load_rp(
+        rp, include=["geometries", "particles"],
+        progress=lambda *args: calls.append(args))
+    assert calls == [
+        ("geometries", 0, 4), ("particles", 0, 3),
+        ("geometries", 1, 4), ("geometries", 2, 4), ("geometries", 3, 4),
+        ("geometries", 4, 4),
+        ("particles", 1, 3), ("particles", 2, 3), ("particles", 3, 3),
+    ]
@@ -0,0 +1,24 @@
+'''
+The tests of creating the new databases from the schema template.
+'''
+from __future__ import annotations
+from pathlib import Path
+import sqlite3
+
+import pytest
+
+sbp = pytest.importorskip("sqlite_bedrock_packs")
+
+def test_new_databases_have_the_schema_of_the_build_scripts(tmp_path: Path):
+    # pylint: disable=protected-access
+    expected = sqlite3.connect(":memory:")
+    for build_script in sbp._build_scripts():
+        expected.executescript(build_script)
+    assert sbp._expected_schema() == sbp._get_schema(expected)
+    for db_path in (":memory:", tmp_path / "packs.db"):
+        db = sbp.Database.create(db_path)
+        assert sbp._get_schema(db.connection) == sbp._expected_schema()
+        file_name = db.connection.execute(
+            "PRAGMA database_list").fetchone()[2]
+        assert (file_name == "") == (db_path == ":memory:")
+        db.close()
@@ -0,0 +1,31 @@
+'''
+The tests of saving and loading the snapshots of the database.
+'''
+from __future__ import annotations
+from pathlib import Path
+import sqlite3
+
+import pytest
+
+sbp = pytest.importorskip("sqlite_bedrock_packs")
+
+# pylint: disable=wrong-import-position
+from conftest import dump
+
+def test_snapshot_round_trip(packs: tuple[Path, Path], tmp_path: Path):
+    rp, bp = packs
+    db = sbp.Database.create()
+    db.load_rp(rp)
+    db.load_bp(bp)
+    snapshot = tmp_path / "snapshot.db"
+    db.save_snapshot(snapshot)
+    for into_memory in (True, False):
+        loaded = sbp.Database.load_snapshot(snapshot, into_memory=into_memory)
+        assert dump(loaded.connection) == dump(db.connection)
+        loaded.close()
+
+    other = sqlite3.connect(tmp_path / "other.db")
+    other.execute("CREATE TABLE Something (value)")
+    other.close()
+    with pytest.raises(ValueError):
+        sbp.Database.load_snapshot(tmp_path / "other.db")
@@ -0,0 +1,47 @@
+'''
+The tests of the functions for analyzing the Molang expressions.
+'''
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("sqlite_bedrock_packs")
+
+# pylint: disable=wrong-import-position
+from sqlite_bedrock_packs.utils import (
+    clear_molang_resources_cache, find_molang_resources,
+    molang_resources_cache_info)
+
+@pytest.mark.parametrize("molang, prefixes, expected", [
+    (
+        "q.is_baby = 1 ? Array.skin[q.variant] : "
+        "(q.mark ? texture.default : TEXTURE.Default2)",
+        ["array", "Texture"],
+        {"array": ["skin"], "Texture": ["default", "default2"]},
+    ),
+    (
+        "v.ä.x + Geometry.ÄB + geometry.b",
+        ["geometry", "v.ä"],
+        {"geometry": ["äb", "b"], "v.ä": ["x"]},
+    ),
+    ("material.default", ["material", "texture"], {
+        "material": ["default"], "texture": []}),
+])
+def test_find_molang_resources(
+        molang: str, prefixes: list[str], expected: dict[str, list[str]]):
+    assert find_molang_resources(molang, prefixes) == expected
+
+def test_find_molang_resources_is_cached():
+    clear_molang_resources_cache()
+    molang = "q.is_baby ? texture.baby : texture.default"
+    first = find_molang_resources(molang, ["texture"])
+    info = molang_resources_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 1, 1)
+    # The results can be modified without changing the cached values
+    first["texture"].append("modified")
+    assert find_molang_resources(molang, ["texture"]) == {
+        "texture": ["baby", "default"]}
+    info = molang_resources_cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    clear_molang_resources_cache()
+    assert molang_resources_cache_info().currsize == 0
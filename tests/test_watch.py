@@ -0,0 +1,100 @@
+'''
+The tests of the :class:`PackWatcher`.
+'''
+from __future__ import annotations
+from pathlib import Path
+
+import pytest
+
+sbp = pytest.importorskip("sqlite_bedrock_packs")
+
+from conftest import write_json  # pylint: disable=wrong-import-position
+
+def _poll_until_applied(watcher) -> dict:
+    '''
+    Polls the watcher until it applies the changes. The first poll after the
+    changes only records them.
+    '''
+    for _ in range(3):
+        results = watcher.poll()
+        if len(results) > 0:
+            return results
+    return {}
+
+def test_watcher_refreshes_only_the_loaded_components(
+        packs: tuple[Path, Path]):
+    rp, _ = packs
+    db = sbp.Database.create()
+    db.load_rp(rp, include=["geometries"])
+    watcher = sbp.PackWatcher(db.connection, names=["geometries"])
+    watcher.poll()
+
+    write_json(rp / "models" / "entity" / "new.geo.json", {
+        "format_version": "1.12.0",
+        "minecraft:geometry": [{"description": {"identifier": "geometry.new"}}],
+    })
+    write_json(rp / "entity" / "new.json", {
+        "format_version": "1.10.0",
+        "minecraft:client_entity": {"description": {"identifier": "test:new"}},
+    })
+    results = _poll_until_applied(watcher)
+    assert [result.added for result in results.values()] == [
+        [rp / "models" / "entity" / "new.geo.json"]]
+    assert db.connection.execute(
+        "SELECT count(*) FROM Geometry").fetchone()[0] == 4
+    assert db.connection.execute(
+        "SELECT count(*) FROM ClientEntityFile").fetchone()[0] == 0
+
+def _add_geometry(rp: Path):
+    write_json(rp / "models" / "entity" / "new.geo.json", {
+        "format_version": "1.12.0",
+        "minecraft:geometry": [{"description": {"identifier": "geometry.new"}}],
+    })
+
+def _count(db, table: str) -> int:
+    return db.connection.execute(f"SELECT count(*) FROM {table}").fetchone()[0]
+
+def test_watcher_doesnt_commit_the_transactions_of_the_application(
+        packs: tuple[Path, Path]):
+    rp, _ = packs
+    db = sbp.Database.create()
+    db.load_rp(rp, include=["geometries", "particles"])
+    watcher = sbp.PackWatcher(db.connection)
+    watcher.poll()
+
+    db.connection.execute("DELETE FROM ParticleFile")
+    _add_geometry(rp)
+    # The changes are postponed until the transaction ends
+    assert watcher.poll() == {} and watcher.poll() == {}
+    assert _count(db, "Geometry") == 3
+    db.connection.rollback()
+    assert len(_poll_until_applied(watcher)) == 1
+    assert _count(db, "Geometry") == 4
+    assert _count(db, "ParticleFile") == 3
+
+def test_watcher_applies_the_changes_on_its_own_connection(
+        packs: tuple[Path, Path], tmp_path: Path):
+    rp, _ = packs
+    db_path = tmp_path / "packs.db"
+    db = sbp.Database.create(db_path)
+    db.load_rp(rp, include=["geometries", "particles"])
+
+    def connect():
+        # pylint: disable=protected-access
+        connection = sbp._connect(db_path)
+        connection.execute("PRAGMA busy_timeout = 10")
+        return connection
+    watcher = sbp.PackWatcher(db.connection, connect=connect)
+    watcher.poll()
+
+    db.connection.execute("DELETE FROM ParticleFile")
+    _add_geometry(rp)
+    # The database is locked by the transaction of the application
+    assert watcher.poll() == {} and watcher.poll() == {}
+    db.connection.rollback()
+    assert len(_poll_until_applied(watcher)) == 1
+    assert _count(db, "Geometry") == 4
+    assert _count(db, "ParticleFile") == 3
+    assert not db.connection.in_transaction
+    watcher.stop()
+    db.close()
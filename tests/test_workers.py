@@ -0,0 +1,23 @@
+'''
+The tests of loading the packs with the worker processes.
+'''
+from __future__ import annotations
+from pathlib import Path
+
+import pytest
+
+sbp = pytest.importorskip("sqlite_bedrock_packs")
+
+# pylint: disable=wrong-import-position
+from conftest import dump, identifiers
+
+def test_workers_load_the_same_rows_as_serial_loading(packs: tuple[Path, Path]):
+    rp, bp = packs
+    serial = sbp.Database.create()
+    serial.load_rp(rp)
+    serial.load_bp(bp)
+    parallel = sbp.Database.create()
+    parallel.load_rp(rp, workers=2)
+    parallel.load_bp(bp, workers=2)
+    assert dump(parallel.connection) == dump(serial.connection)
+    assert identifiers(serial, "Entity") == {"test:e0", "test:e1", "test:e2"}
@@ -1,8 +1,11 @@
 '''
 Functions for analyzing Molang expressions.
 '''
+from functools import _CacheInfo, lru_cache
 import re
 
+_SIMPLE_PREFIX = re.compile(r'\w+', flags=re.ASCII)
+
 def find_molang_resources(
         molang: str, resource_prefixes: list[str]) -> dict[str, list[str]]:
     '''
@@ -10,6 +13,9 @@ def find_molang_resources(
     a dictionary keyed by the resource type, with values being a list of
     found resources.
 
+    The results are cached (see :func:`molang_resources_cache_info`),
+    because the same expressions are repeated in many files.
+
     Example
     -------
     >>> find_molang_resources(
@@ -20,19 +26,64 @@ def find_molang_resources(
             resource_prefixes=["array", "texture"])
     {'array': ['array.skin'], 'texture': ['texture.default', 'texture.default2']}
     '''
-    molang = molang.lower()
+    resource_prefixes = tuple(resource_prefixes)
     results: dict[str, list[str]] = {
         prefix: []
         for prefix in resource_prefixes
     }
+    for resource_prefix, item_names in zip(
+            resource_prefixes,
+            _find_molang_resources(molang, resource_prefixes)):
+        results[resource_prefix].extend(item_names)
+    return results
+
+@lru_cache(maxsize=4096)
+def _find_molang_resources(
+        molang: str,
+        resource_prefixes: tuple[str, ...]) -> tuple[tuple[str, ...], ...]:
+    '''
+    Returns the names of the resources found by :func:`find_molang_resources`
+    in the order of the prefixes.
+    '''
+    molang = molang.lower()
+    return tuple(
+        tuple(pattern.findall(molang))
+        for pattern in _molang_resources_patterns(
+            resource_prefixes, molang.isascii()))
+
+@lru_cache(maxsize=256)
+def _molang_resources_patterns(
+        resource_prefixes: tuple[str, ...],
+        ascii_molang: bool) -> tuple[re.Pattern[str], ...]:
+    '''
+    Returns the patterns that find the resources of the prefixes in a
+    lowercase molang expression. If the expression is ASCII, the patterns of
+    the prefixes that are plain ASCII words are case-sensitive, which is
+    faster and gives the same results.
+    '''
+    patterns: list[re.Pattern[str]] = []
     for resource_prefix in resource_prefixes:
         # Capturing groups crops the first part of the search for example:
         # geometry.default -> geometry
-        item_pattern = re.compile(
-            f'{resource_prefix}\\.(\\w+)', flags=re.IGNORECASE)
-        for item_name in item_pattern.findall(molang):
-            results[resource_prefix].append(item_name)
-    return results
+        if ascii_molang and _SIMPLE_PREFIX.fullmatch(resource_prefix):
+            patterns.append(re.compile(f'{resource_prefix.lower()}\\.(\\w+)'))
+        else:
+            patterns.append(re.compile(
+                f'{resource_prefix}\\.(\\w+)', flags=re.IGNORECASE))
+    return tuple(patterns)
+
+def molang_resources_cache_info() -> _CacheInfo:
+    '''
+    Returns the statistics of the cache of :func:`find_molang_resources` (the
+    hits, the misses, the maximal size and the current size).
+    '''
+    return _find_molang_resources.cache_info()
+
+def clear_molang_resources_cache():
+    '''
+    Clears the cache of :func:`find_molang_resources`.
+    '''
+    _find_molang_resources.cache_clear()
 
 def split_item_name(item_name: str) -> tuple[str, str, int]:
     '''
@@ -34,19 +34,25 @@ class ResourcePack(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class BehaviorPack(AbstractDBView):
     path: pathlib.Path
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class AttachableFile(AbstractDBView):
     path: pathlib.Path
+    mtime: int
+    size: int
+    contentHash: str
     ResourcePack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class Attachable(AbstractDBView):
     identifier: str
     AttachableFile_fk: int
@@ -54,6 +60,7 @@ class Attachable(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class AttachableItemField(AbstractDBView):
     identifier: str
     condition: str
@@ -63,6 +70,7 @@ class AttachableItemField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class AttachableMaterialField(AbstractDBView):
     shortName: str
     identifier: str
@@ -72,6 +80,7 @@ class AttachableMaterialField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class AttachableTextureField(AbstractDBView):
     shortName: str
     identifier: str
@@ -81,6 +90,7 @@ class AttachableTextureField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class AttachableGeometryField(AbstractDBView):
     shortName: str
     identifier: str
@@ -90,6 +100,7 @@ class AttachableGeometryField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class AttachableRenderControllerField(AbstractDBView):
     identifier: str
     condition: str
@@ -99,6 +110,7 @@ class AttachableRenderControllerField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class AttachableAnimationField(AbstractDBView):
     shortName: str
     identifier: str
@@ -108,6 +120,7 @@ class AttachableAnimationField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class AttachableAnimationControllerField(AbstractDBView):
     shortName: str
     identifier: str
@@ -117,13 +130,18 @@ class AttachableAnimationControllerField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class BpAnimationFile(AbstractDBView):
     path: pathlib.Path
+    mtime: int
+    size: int
+    contentHash: str
     BehaviorPack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class BpAnimation(AbstractDBView):
     identifier: str
     jsonPath: str
@@ -132,13 +150,18 @@ class BpAnimation(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class BpAnimationControllerFile(AbstractDBView):
     path: pathlib.Path
+    mtime: int
+    size: int
+    contentHash: str
     BehaviorPack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class BpAnimationController(AbstractDBView):
     identifier: str
     jsonPath: str
@@ -147,13 +170,18 @@ class BpAnimationController(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class BpBlockFile(AbstractDBView):
     path: pathlib.Path
+    mtime: int
+    size: int
+    contentHash: str
     BehaviorPack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class BpBlock(AbstractDBView):
     identifier: str
     BpBlockFile_fk: int
@@ -161,6 +189,7 @@ class BpBlock(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class BpBlockLootField(AbstractDBView):
     identifier: str
     jsonPath: str
@@ -169,6 +198,7 @@ class BpBlockLootField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class BpBlockGeometryField(AbstractDBView):
     identifier: str
     jsonPath: str
@@ -177,6 +207,7 @@ class BpBlockGeometryField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class BpBlockMaterialInstancesField(AbstractDBView):
     jsonPath: str
     BpBlock_fk: int
@@ -184,6 +215,7 @@ class BpBlockMaterialInstancesField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class BpBlockMaterialInstancesFieldInstance(AbstractDBView):
     identifier: str
     jsonPath: str
@@ -194,13 +226,18 @@ class BpBlockMaterialInstancesFieldInstance(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class BpItemFile(AbstractDBView):
     path: pathlib.Path
+    mtime: int
+    size: int
+    contentHash: str
     BehaviorPack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class BpItem(AbstractDBView):
     identifier: str
     texture: str
@@ -210,13 +247,18 @@ class BpItem(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class ClientEntityFile(AbstractDBView):
     path: pathlib.Path
+    mtime: int
+    size: int
+    contentHash: str
     ResourcePack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class ClientEntity(AbstractDBView):
     identifier: str
     ClientEntityFile_fk: int
@@ -224,6 +266,7 @@ class ClientEntity(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class ClientEntityRenderControllerField(AbstractDBView):
     identifier: str
     condition: str
@@ -233,6 +276,7 @@ class ClientEntityRenderControllerField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class ClientEntityGeometryField(AbstractDBView):
     shortName: str
     identifier: str
@@ -242,6 +286,7 @@ class ClientEntityGeometryField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class ClientEntityTextureField(AbstractDBView):
     shortName: str
     identifier: str
@@ -251,6 +296,7 @@ class ClientEntityTextureField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class ClientEntityMaterialField(AbstractDBView):
     shortName: str
     identifier: str
@@ -260,6 +306,7 @@ class ClientEntityMaterialField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class ClientEntityAnimationField(AbstractDBView):
     shortName: str
     identifier: str
@@ -269,6 +316,7 @@ class ClientEntityAnimationField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class ClientEntityAnimationControllerField(AbstractDBView):
     shortName: str
     identifier: str
@@ -278,13 +326,18 @@ class ClientEntityAnimationControllerField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class EntityFile(AbstractDBView):
     path: pathlib.Path
+    mtime: int
+    size: int
+    contentHash: str
     BehaviorPack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class Entity(AbstractDBView):
     identifier: str
     EntityFile_fk: int
@@ -292,6 +345,7 @@ class Entity(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class EntityLootField(AbstractDBView):
     identifier: str
     jsonPath: str
@@ -301,6 +355,7 @@ class EntityLootField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class EntityTradeField(AbstractDBView):
     identifier: str
     jsonPath: str
@@ -310,6 +365,7 @@ class EntityTradeField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class EntitySpawnEggField(AbstractDBView):
     identifier: str
     Entity_fk: int
@@ -317,13 +373,18 @@ class EntitySpawnEggField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class GeometryFile(AbstractDBView):
     path: pathlib.Path
+    mtime: int
+    size: int
+    contentHash: str
     ResourcePack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class Geometry(AbstractDBView):
     identifier: str
     parent: str
@@ -333,13 +394,18 @@ class Geometry(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class LootTableFile(AbstractDBView):
     path: pathlib.Path
+    mtime: int
+    size: int
+    contentHash: str
     BehaviorPack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class LootTable(AbstractDBView):
     identifier: str
     LootTableFile_fk: int
@@ -347,6 +413,7 @@ class LootTable(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class LootTableItemField(AbstractDBView):
     identifier: str
     jsonPath: str
@@ -355,6 +422,7 @@ class LootTableItemField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class LootTableItemSpawnEggReferenceField(AbstractDBView):
     entityIdentifier: str
     spawnEggIdentifier: str
@@ -365,6 +433,7 @@ class LootTableItemSpawnEggReferenceField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class LootTableLootTableField(AbstractDBView):
     identifier: str
     jsonPath: str
@@ -373,13 +442,18 @@ class LootTableLootTableField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class ParticleFile(AbstractDBView):
     path: pathlib.Path
+    mtime: int
+    size: int
+    contentHash: str
     ResourcePack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class Particle(AbstractDBView):
     identifier: str
     material: str
@@ -389,13 +463,18 @@ class Particle(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class RenderControllerFile(AbstractDBView):
     path: pathlib.Path
+    mtime: int
+    size: int
+    contentHash: str
     ResourcePack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class RenderController(AbstractDBView):
     identifier: str
     jsonPath: str
@@ -404,6 +483,7 @@ class RenderController(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class RenderControllerTexturesField(AbstractDBView):
     ownerArray: str
     inOwnerArrayJsonPath: str
@@ -414,6 +494,7 @@ class RenderControllerTexturesField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class RenderControllerMaterialsField(AbstractDBView):
     ownerArray: str
     inOwnerArrayJsonPath: str
@@ -425,6 +506,7 @@ class RenderControllerMaterialsField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class RenderControllerGeometryField(AbstractDBView):
     ownerArray: str
     inOwnerArrayJsonPath: str
@@ -435,13 +517,18 @@ class RenderControllerGeometryField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class RpAnimationFile(AbstractDBView):
     path: pathlib.Path
+    mtime: int
+    size: int
+    contentHash: str
     ResourcePack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class RpAnimation(AbstractDBView):
     identifier: str
     jsonPath: str
@@ -450,6 +537,7 @@ class RpAnimation(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class RpAnimationParticleEffect(AbstractDBView):
     shortName: str
     jsonPath: str
@@ -458,6 +546,7 @@ class RpAnimationParticleEffect(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class RpAnimationSoundEffect(AbstractDBView):
     shortName: str
     jsonPath: str
@@ -466,13 +555,18 @@ class RpAnimationSoundEffect(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class RpAnimationControllerFile(AbstractDBView):
     path: pathlib.Path
+    mtime: int
+    size: int
+    contentHash: str
     ResourcePack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class RpAnimationController(AbstractDBView):
     identifier: str
     jsonPath: str
@@ -481,6 +575,7 @@ class RpAnimationController(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class RpAnimationControllerParticleEffect(AbstractDBView):
     shortName: str
     jsonPath: str
@@ -489,6 +584,7 @@ class RpAnimationControllerParticleEffect(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class RpAnimationControllerSoundEffect(AbstractDBView):
     shortName: str
     jsonPath: str
@@ -497,13 +593,18 @@ class RpAnimationControllerSoundEffect(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class RpItemFile(AbstractDBView):
     path: pathlib.Path
+    mtime: int
+    size: int
+    contentHash: str
     ResourcePack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class RpItem(AbstractDBView):
     identifier: str
     icon: str
@@ -512,21 +613,30 @@ class RpItem(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class SoundFile(AbstractDBView):
     path: pathlib.Path
     identifier: str
+    mtime: int
+    size: int
+    contentHash: str
     ResourcePack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class SoundDefinitionsFile(AbstractDBView):
     path: pathlib.Path
+    mtime: int
+    size: int
+    contentHash: str
     ResourcePack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class SoundDefinition(AbstractDBView):
     identifier: str
     jsonPath: str
@@ -535,6 +645,7 @@ class SoundDefinition(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class SoundDefinitionSoundField(AbstractDBView):
     identifier: str
     jsonPath: str
@@ -543,21 +654,30 @@ class SoundDefinitionSoundField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class TextureFile(AbstractDBView):
     path: pathlib.Path
     identifier: str
+    mtime: int
+    size: int
+    contentHash: str
     ResourcePack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class TradeTableFile(AbstractDBView):
     path: pathlib.Path
+    mtime: int
+    size: int
+    contentHash: str
     BehaviorPack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class TradeTable(AbstractDBView):
     identifier: str
     TradeTableFile_fk: int
@@ -565,6 +685,7 @@ class TradeTable(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class TradeTableItemField(AbstractDBView):
     identifier: str
     dataValue: int
@@ -574,6 +695,7 @@ class TradeTableItemField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class TradeTableItemSpawnEggReferenceField(AbstractDBView):
     entityIdentifier: str
     spawnEggIdentifier: str
@@ -583,13 +705,18 @@ class TradeTableItemSpawnEggReferenceField(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class TerrainTextureFile(AbstractDBView):
     path: pathlib.Path
+    mtime: int
+    size: int
+    contentHash: str
     ResourcePack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class TerrainTexture(AbstractDBView):
     identifier: str
     TerrainTextureFile_fk: int
@@ -597,6 +724,7 @@ class TerrainTexture(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class TerrainTextureVariation(AbstractDBView):
     identifier: str
     jsonPath: pathlib.Path
@@ -610,13 +738,18 @@ class TerrainTextureVariation(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class FeatureRuleFile(AbstractDBView):
     path: pathlib.Path
+    mtime: int
+    size: int
+    contentHash: str
     BehaviorPack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class FeatureRule(AbstractDBView):
     identifier: str
     placesFeature: str
@@ -625,13 +758,18 @@ class FeatureRule(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class FeatureFile(AbstractDBView):
     path: pathlib.Path
+    mtime: int
+    size: int
+    contentHash: str
     BehaviorPack_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class Feature(AbstractDBView):
     identifier: str
     jsonPath: str
@@ -641,6 +779,7 @@ class Feature(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class FeaturePlacesFeatureFieldValue(AbstractDBView):
     identifier: str
     jsonPath: str
@@ -648,10 +787,12 @@ class FeaturePlacesFeatureFieldValue(AbstractDBView):
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
     build_script: str
+    query_result_columns: tuple[str, ...]
 class FeaturePlacesFeatureField(AbstractDBView):
     Feature_fk: int
     FeaturePlacesFeatureFieldValue_fk: int
     id: int
     connection: sqlite3.Connection
     query_result: Callable[[], tuple[Any, ...]]
-    build_script: str
\ No newline at end of file
+    build_script: str
+    query_result_columns: tuple[str, ...]
\ No newline at end of file